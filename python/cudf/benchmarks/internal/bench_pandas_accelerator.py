@@ -0,0 +1,46 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.
+
+"""Benchmarks of attribute lookups on cudf.pandas accelerated modules.
+
+Installing cudf.pandas replaces the pandas module for the rest of the
+session, so these benchmarks only run in a session that was started with
+cudf.pandas enabled, and are skipped otherwise::
+
+    python -m pytest -p cudf.pandas benchmarks/internal/bench_pandas_accelerator.py
+"""
+
+import importlib
+
+import pytest
+
+import cudf.pandas
+
+pytestmark = pytest.mark.skipif(
+    not cudf.pandas.LOADED,
+    reason="cudf.pandas is not enabled (run with -p cudf.pandas)",
+)
+
+
+@pytest.fixture(scope="module")
+def xpd():
+    return importlib.import_module("pandas")
+
+
+def bench_getattr(benchmark, xpd):
+    benchmark(lambda: xpd.DataFrame)
+
+
+def bench_getattr_loop(benchmark, xpd):
+    def lookup():
+        for _ in range(1000):
+            xpd.Series
+            xpd.isna
+
+    benchmark(lookup)
+
+
+def bench_getattr_disabled(benchmark, xpd):
+    from cudf.pandas.module_accelerator import disable_module_accelerator
+
+    with disable_module_accelerator():
+        benchmark(lambda: xpd.DataFrame)
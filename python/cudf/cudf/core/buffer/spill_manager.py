@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import gc
 import io
+import math
 import textwrap
 import threading
+import time
 import traceback
 import warnings
 import weakref
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import partial
@@ -22,6 +24,8 @@ from cudf.options import get_option
 from cudf.utils.performance_tracking import _performance_tracking
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from cudf.core.buffer.spillable_buffer import SpillableBufferOwner
 
 _spill_cudf_nvtx_annotate = partial(
@@ -63,7 +67,11 @@ class SpillStatistics:
 
     Levels of information gathered:
       0  - disabled (no overhead).
-      1+ - duration and number of bytes spilled (very low overhead).
+      1+ - duration and number of bytes spilled, the number of spill
+           files written to disk, and the number of thrash events, i.e.
+           buffers unspilled within `thrash_window` seconds of being
+           spilled, and the activity of the background spill worker
+           (very low overhead).
       2+ - a traceback for each time a spillable buffer is exposed
            permanently (potential high overhead).
 
@@ -75,6 +83,9 @@ class SpillStatistics:
     ----------
     level : int
         If not 0, enables statistics at the specified level.
+    thrash_window : float, optional
+        Unspilling a buffer within this many seconds of spilling it
+        counts as a thrash event.
 
     Examples
     --------
@@ -90,6 +101,9 @@ class SpillStatistics:
     Spill Statistics (level=1):
      Spilling (level >= 1):
       gpu => cpu: 24B in 0.0033579860000827466s
+     Disk (level >= 1): None
+     Thrashing (level >= 1): None
+     Background spilling (level >= 1): None
     """
 
     @dataclass
@@ -101,10 +115,15 @@ class SpillStatistics:
 
     spill_totals: dict[tuple[str, str], tuple[int, float]]
 
-    def __init__(self, level) -> None:
+    def __init__(self, level, thrash_window: float = 1.0) -> None:
         self.lock = threading.Lock()
         self.level = level
+        self.thrash_window = thrash_window
         self.spill_totals = defaultdict(lambda: (0, 0))
+        self.disk_files = 0
+        self.thrash_count = 0
+        # Number of runs, bytes spilled, and time of the background worker
+        self.background_totals: tuple[int, int, float] = (0, 0, 0.0)
         # Maps each traceback to a Expose
         self.exposes: dict[str, SpillStatistics.Expose] = {}
 
@@ -130,6 +149,59 @@ class SpillStatistics:
                 total_nbytes + nbytes,
                 total_time + time,
             )
+            if dst == "disk":
+                self.disk_files += 1
+
+    def log_thrash(self, spilled_for: float) -> None:
+        """Log an unspilling event, which may be a thrash event
+
+        Parameters
+        ----------
+        spilled_for : float
+            Number of seconds the buffer was spilled.
+        """
+        if self.level < 1 or spilled_for > self.thrash_window:
+            return
+        with self.lock:
+            self.thrash_count += 1
+
+    def log_background_spill(self, nbytes: int, time: float) -> None:
+        """Log a run of the background spill worker
+
+        Parameters
+        ----------
+        nbytes : int
+            Number of bytes spilled.
+        time : float
+            Elapsed time the run took in seconds.
+        """
+        if self.level < 1:
+            return
+        with self.lock:
+            runs, total_nbytes, total_time = self.background_totals
+            self.background_totals = (
+                runs + 1,
+                total_nbytes + nbytes,
+                total_time + time,
+            )
+
+    def disk_totals(self) -> tuple[int, int]:
+        """Get the total number of bytes written to and read from disk
+
+        Return
+        ------
+        tuple
+            The number of bytes written and the number of bytes read.
+        """
+        with self.lock:
+            return self._disk_totals()
+
+    def _disk_totals(self) -> tuple[int, int]:
+        written = read = 0
+        for (src, dst), (nbytes, _) in self.spill_totals.items():
+            written += nbytes if dst == "disk" else 0
+            read += nbytes if src == "disk" else 0
+        return written, read
 
     def log_expose(self, buf: SpillableBufferOwner) -> None:
         """Log an expose event
@@ -178,6 +250,36 @@ class SpillStatistics:
                 ret += f"    {src} => {dst}: "
                 ret += f"{format_bytes(nbytes)} in {time:.3f}s\n"
 
+            # Print disk stats
+            ret += "  Disk (level >= 1):"
+            if self.disk_files == 0:
+                ret += " None\n"
+            else:
+                written, read = self._disk_totals()
+                ret += (
+                    f" {self.disk_files} files, "
+                    f"{format_bytes(written)} written, "
+                    f"{format_bytes(read)} read back\n"
+                )
+
+            # Print thrash stats
+            ret += "  Thrashing (level >= 1):"
+            if self.thrash_count == 0:
+                ret += " None\n"
+            else:
+                ret += (
+                    f" {self.thrash_count} buffers unspilled within "
+                    f"{self.thrash_window}s of being spilled\n"
+                )
+
+            # Print background spilling stats
+            ret += "  Background spilling (level >= 1):"
+            runs, nbytes, time = self.background_totals
+            if runs == 0:
+                ret += " None\n"
+            else:
+                ret += f" {runs} runs, {format_bytes(nbytes)} in {time:.3f}s\n"
+
             # Print expose stats
             ret += "  Exposed buffers (level >= 2): "
             if self.level < 2:
@@ -198,6 +300,161 @@ class SpillStatistics:
             return ret[:-1]  # Remove last `\n`
 
 
+@dataclass
+class _ManagedBuffer:
+    """Bookkeeping of a buffer known by the spill manager"""
+
+    ref: weakref.ReferenceType[SpillableBufferOwner]
+    size: int
+    location: str
+    # Time of the last spill from and unspill to device memory
+    spilled_at: float = -math.inf
+    unspilled_at: float = -math.inf
+    # Priority used by the GreedyDual-Size policy
+    priority: float = 0.0
+
+
+class SpillPolicy:
+    """Policy selecting the buffers to spill
+
+    A policy orders the spill candidates at a memory location. The spill
+    manager calls the methods of the policy with its lock held.
+    """
+
+    def on_access(self, entry: _ManagedBuffer) -> None:
+        """Called when a buffer is added, accessed, or unspilled"""
+
+    def on_spill(self, entry: _ManagedBuffer) -> None:
+        """Called when a buffer is spilled from device memory"""
+
+    def victims(
+        self,
+        lru: OrderedDict[int, None],
+        buffers: dict[int, _ManagedBuffer],
+    ) -> Iterator[int]:
+        """Generate the keys of spill candidates in the order to spill them
+
+        Parameters
+        ----------
+        lru : OrderedDict
+            Keys of the spill candidates in least recently accessed order.
+            Spilled buffers are removed from `lru` while iterating.
+        buffers : dict
+            The managed buffers.
+
+        Return
+        ------
+        Iterator
+            Keys of buffers currently in `lru`.
+        """
+        raise NotImplementedError()
+
+
+class LRUPolicy(SpillPolicy):
+    """Spill the least recently accessed buffers first
+
+    Candidates are visited in constant time each. Candidates that cannot
+    be spilled are moved to the back of the LRU order.
+    """
+
+    def victims(self, lru, buffers):
+        while lru:
+            key = next(iter(lru))
+            lru.move_to_end(key)
+            yield key
+
+
+class LargestFirstPolicy(SpillPolicy):
+    """Spill the largest buffers first
+
+    This minimizes the number of buffers spilled, ties are broken by
+    access time.
+    """
+
+    def victims(self, lru, buffers):
+        for key in sorted(lru, key=lambda k: buffers[k].size, reverse=True):
+            if key in lru:
+                yield key
+
+
+class GreedyDualSizePolicy(SpillPolicy):
+    """Spill buffers by GreedyDual-Size priority
+
+    On access, a buffer gets the priority ``L + 1 / size`` where ``L`` is
+    the priority of the last spilled buffer. The buffer with the lowest
+    priority is spilled first, thus large buffers are spilled before small
+    buffers, unless the large buffers were accessed more recently.
+    """
+
+    def __init__(self) -> None:
+        self.inflation = 0.0
+
+    def on_access(self, entry):
+        entry.priority = self.inflation + 1 / entry.size
+
+    def on_spill(self, entry):
+        self.inflation = max(self.inflation, entry.priority)
+
+    def victims(self, lru, buffers):
+        for key in sorted(lru, key=lambda k: buffers[k].priority):
+            if key in lru:
+                yield key
+
+
+class ProtectUnspilledPolicy(SpillPolicy):
+    """Spill the least recently accessed buffers first, but spill buffers
+    unspilled within the last `window` seconds last
+
+    Parameters
+    ----------
+    window : float, optional
+        Number of seconds a buffer is protected after unspilling.
+    """
+
+    def __init__(self, window: float = 1.0) -> None:
+        self.window = window
+
+    def victims(self, lru, buffers):
+        protected = []
+        cutoff = time.monotonic() - self.window
+        for key in list(lru):
+            if buffers[key].unspilled_at > cutoff:
+                protected.append(key)
+            elif key in lru:
+                yield key
+        for key in protected:
+            if key in lru:
+                yield key
+
+
+SPILL_POLICIES: dict[str, type[SpillPolicy]] = {
+    "lru": LRUPolicy,
+    "largest": LargestFirstPolicy,
+    "gds": GreedyDualSizePolicy,
+    "protect_unspilled": ProtectUnspilledPolicy,
+}
+
+
+def _background_spill_worker(
+    manager_ref: weakref.ReferenceType[SpillManager],
+    wakeup: threading.Event,
+) -> None:
+    """Run background spilling until the manager is deleted
+
+    The worker only holds a weak reference to the manager, which sets
+    `wakeup` when device memory usage crosses the high watermark and
+    when it is finalized.
+    """
+    while True:
+        wakeup.wait()
+        wakeup.clear()
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager._background_spill()
+        del manager
+
+
 class SpillManager:
     """Manager of spillable buffers.
 
@@ -210,32 +467,121 @@ class SpillManager:
     Notice, this is a soft limit. The memory usage might exceed the limit if
     too many buffers are unspillable.
 
+    When `device_high_watermark=<watermark-in-bytes>`, a background thread
+    spills buffers whenever device memory usage exceeds the high watermark,
+    until the usage is below the low watermark. Unlike `device_memory_limit`,
+    this moves the cost of spilling off the threads allocating buffers.
+    Combine the two to have the device memory limit act as a hard limit
+    enforced synchronously.
+
+    Similarly, when `host_memory_limit=<limit-in-bytes>`, buffers spilled to
+    host memory are spilled further to memory-mapped files on disk, when the
+    host memory used by spilled buffers exceeds the limit.
+
+    For each memory location, the manager maintains the spillable buffers
+    in least recently accessed order together with the number of bytes
+    at the location. Buffers notify the manager when they are accessed or
+    moved, thus limit checks are constant time. Which buffers to spill is
+    decided by a `SpillPolicy`. With the default LRU policy, finding
+    buffers to spill only visits the buffers actually spilled (and the
+    buffers that are spill locked).
+
     Parameters
     ----------
     device_memory_limit: int, optional
         If not None, this is the device memory limit in bytes that triggers
         device to host spilling. The global manager sets this to the value
         of `CUDF_SPILL_DEVICE_LIMIT` or None.
+    device_high_watermark: int, optional
+        If not None, this is the device memory usage in bytes that triggers
+        background spilling. The global manager sets this to the value
+        of `CUDF_SPILL_DEVICE_HIGH_WATERMARK` or None.
+    device_low_watermark: int, optional
+        The device memory usage in bytes that background spilling spills
+        down to. If None, 3/4 of the high watermark is used. The global
+        manager sets this to the value of `CUDF_SPILL_DEVICE_LOW_WATERMARK`
+        or None.
+    host_memory_limit: int, optional
+        If not None, this is the host memory limit in bytes that triggers
+        host to disk spilling. The global manager sets this to the value
+        of `CUDF_SPILL_HOST_LIMIT` or None.
+    disk_directory: str, optional
+        Directory of the files of buffers spilled to disk. If None, the
+        default temporary directory is used. The global manager sets this
+        to the value of `CUDF_SPILL_DISK_DIRECTORY` or None.
+    policy: str or SpillPolicy, optional
+        The policy selecting the buffers to spill, either a policy instance
+        or the name of a built-in policy: "lru", "largest", "gds", or
+        "protect_unspilled". The global manager sets this to the value of
+        `CUDF_SPILL_POLICY` or "lru".
     statistic_level: int, optional
         If not 0, enables statistics at the specified level. See
         SpillStatistics for the different levels.
     """
 
-    _buffers: weakref.WeakValueDictionary[int, SpillableBufferOwner]
+    _buffers: dict[int, _ManagedBuffer]
+    _lru: dict[str, OrderedDict[int, None]]
+    _nbytes: dict[str, int]
+    _deleted: deque[int]
     statistics: SpillStatistics
 
     def __init__(
         self,
         *,
         device_memory_limit: int | None = None,
+        device_high_watermark: int | None = None,
+        device_low_watermark: int | None = None,
+        host_memory_limit: int | None = None,
+        disk_directory: str | None = None,
+        policy: str | SpillPolicy = "lru",
         statistic_level: int = 0,
     ) -> None:
         self._lock = threading.Lock()
-        self._buffers = weakref.WeakValueDictionary()
+        self._buffers = {}
+        # Keys of the spill candidates in least recently accessed order
+        # and the total size of all managed buffers at each location.
+        # Exposed buffers are counted but are never spill candidates.
+        self._lru = {loc: OrderedDict() for loc in ("gpu", "cpu", "disk")}
+        self._nbytes = dict.fromkeys(("gpu", "cpu", "disk"), 0)
+        # Keys of deleted buffers. This is appended to by weakref callbacks,
+        # which may run at any time, so it is processed under the lock later.
+        self._deleted = deque()
         self._id_counter = 0
         self._device_memory_limit = device_memory_limit
+        self._host_memory_limit = host_memory_limit
+        self.disk_directory = disk_directory
+        if isinstance(policy, str):
+            if policy not in SPILL_POLICIES:
+                raise ValueError(
+                    f"Unknown spill policy: {policy!r}, valid policies "
+                    f"are {list(SPILL_POLICIES)}"
+                )
+            policy = SPILL_POLICIES[policy]()
+        self.policy = policy
         self.statistics = SpillStatistics(statistic_level)
 
+        self._device_high_watermark = device_high_watermark
+        self._device_low_watermark = device_low_watermark
+        self._background_wakeup: threading.Event | None = None
+        if device_high_watermark is not None:
+            if device_low_watermark is None:
+                self._device_low_watermark = device_high_watermark * 3 // 4
+            elif device_low_watermark > device_high_watermark:
+                raise ValueError(
+                    "The device low watermark cannot exceed the high "
+                    f"watermark: {device_low_watermark} > "
+                    f"{device_high_watermark}"
+                )
+            self._background_wakeup = threading.Event()
+            threading.Thread(
+                target=_background_spill_worker,
+                args=(weakref.ref(self), self._background_wakeup),
+                name="cudf-spill-worker",
+                daemon=True,
+            ).start()
+            # Wake up the worker to let it exit with the manager
+            weakref.finalize(self, self._background_wakeup.set)
+
     def _out_of_memory_handle(self, nbytes: int, *, retry_once=True) -> bool:
         """Try to handle an out-of-memory error by spilling
 
@@ -291,10 +637,119 @@ class SpillManager:
             The buffer to manage
         """
         if buffer.size > 0 and not buffer.exposed:
+            location = buffer.memory_location
+            deleted = self._deleted
             with self._lock:
-                self._buffers[self._id_counter] = buffer
+                key = self._id_counter
                 self._id_counter += 1
+                entry = _ManagedBuffer(
+                    ref=weakref.ref(
+                        buffer, lambda _, key=key: deleted.append(key)
+                    ),
+                    size=buffer.size,
+                    location=location,
+                )
+                self.policy.on_access(entry)
+                self._buffers[key] = entry
+                self._lru[location][key] = None
+                self._nbytes[location] += buffer.size
+                buffer._manager_key = key
+                self._check_high_watermark()
         self.spill_to_device_limit()
+        self.spill_to_host_limit()
+
+    def _check_high_watermark(self) -> None:
+        """Wake up the background spill worker if needed
+
+        The worker is woken up if device memory usage exceeds the
+        high watermark. Must be called with the lock held.
+        """
+        if (
+            self._background_wakeup is not None
+            and self._nbytes["gpu"] > self._device_high_watermark
+        ):
+            self._background_wakeup.set()
+
+    def _background_spill(self) -> int:
+        """Spill device memory down to the low watermark
+
+        This is run by the background spill worker.
+
+        Return
+        ------
+        int
+            The number of bytes spilled.
+        """
+        time_start = time.perf_counter()
+        with self._lock:
+            self._remove_deleted()
+            unspilled = self._nbytes["gpu"]
+        if unspilled <= self._device_high_watermark:
+            return 0
+        spilled = self.spill_device_memory(
+            nbytes=unspilled - self._device_low_watermark
+        )
+        self.statistics.log_background_spill(
+            nbytes=spilled, time=time.perf_counter() - time_start
+        )
+        return spilled
+
+    def _remove(self, key: int) -> None:
+        """Forget a deleted buffer, must be called with the lock held"""
+        entry = self._buffers.pop(key, None)
+        if entry is not None:
+            self._nbytes[entry.location] -= entry.size
+            self._lru[entry.location].pop(key, None)
+
+    def _remove_deleted(self) -> None:
+        """Forget all deleted buffers, must be called with the lock held"""
+        while self._deleted:
+            self._remove(self._deleted.popleft())
+
+    def _on_access(self, buffer: SpillableBufferOwner) -> None:
+        """Mark a managed buffer as the most recently accessed buffer"""
+        with self._lock:
+            entry = self._buffers.get(buffer._manager_key)
+            if entry is not None:
+                lru = self._lru[entry.location]
+                if buffer._manager_key in lru:
+                    lru.move_to_end(buffer._manager_key)
+                    self.policy.on_access(entry)
+
+    def _on_move(self, buffer: SpillableBufferOwner) -> None:
+        """Update the location of a managed buffer after (un-)spilling
+
+        The buffer becomes the most recently accessed buffer at its new
+        location.
+        """
+        key = buffer._manager_key
+        location = buffer.memory_location
+        now = time.monotonic()
+        with self._lock:
+            entry = self._buffers.get(key)
+            if entry is None or entry.location == location:
+                return
+            if location == "gpu":
+                entry.unspilled_at = now
+                self.statistics.log_thrash(now - entry.spilled_at)
+                self.policy.on_access(entry)
+                self._check_high_watermark()
+            elif entry.location == "gpu":
+                entry.spilled_at = now
+                self.policy.on_spill(entry)
+            self._nbytes[entry.location] -= entry.size
+            self._nbytes[location] += entry.size
+            if key in self._lru[entry.location]:
+                del self._lru[entry.location][key]
+                self._lru[location][key] = None
+            entry.location = location
+
+    def _on_expose(self, buffer: SpillableBufferOwner) -> None:
+        """Stop considering a permanently exposed buffer for spilling"""
+        with self._lock:
+            entry = self._buffers.get(buffer._manager_key)
+            if entry is not None:
+                self._lru[entry.location].pop(buffer._manager_key, None)
 
     def buffers(
         self, order_by_access_time: bool = False
@@ -312,22 +767,27 @@ class SpillManager:
             Tuple of buffers
         """
         with self._lock:
-            ret = tuple(self._buffers.values())
+            self._remove_deleted()
+            refs = [entry.ref for entry in self._buffers.values()]
+        ret = tuple(buf for buf in (ref() for ref in refs) if buf is not None)
         if order_by_access_time:
             ret = tuple(sorted(ret, key=lambda b: b.last_accessed))
         return ret
 
-    @_spill_cudf_nvtx_annotate
-    def spill_device_memory(self, nbytes: int) -> int:
-        """Try to spill device memory
+    def _spill(self, src: str, dst: str, nbytes: int) -> int:
+        """Spill buffers from `src` to `dst` in the order of the policy
 
-        This function is safe to call doing spill-on-demand
-        since it does not lock buffers already locked.
+        Each spill candidate is visited at most once.
 
         Parameters
         ----------
+        src : str
+            The memory location to spill from.
+        dst : str
+            The memory location to spill to.
         nbytes : int
-            Number of bytes to try to spill
+            Number of bytes to try to spill. At least one buffer is
+            spilled, if any is spillable.
 
         Return
         ------
@@ -335,11 +795,26 @@ class SpillManager:
             Number of actually bytes spilled.
         """
         spilled = 0
-        for buf in self.buffers(order_by_access_time=True):
+        with self._lock:
+            self._remove_deleted()
+            remaining = len(self._lru[src])
+            victims = self.policy.victims(self._lru[src], self._buffers)
+        while remaining > 0:
+            remaining -= 1
+            with self._lock:
+                key = next(victims, None)
+                if key is None:
+                    break
+                buf = self._buffers[key].ref()
+                if buf is None:
+                    self._remove(key)
+                    continue
+            # Notice, we must not hold the manager lock while spilling
+            # since the buffer calls back into the manager.
             if buf.lock.acquire(blocking=False):
                 try:
-                    if not buf.is_spilled and buf.spillable:
-                        buf.spill(target="cpu")
+                    if buf.memory_location == src and buf.spillable:
+                        buf.spill(target=dst)
                         spilled += buf.size
                         if spilled >= nbytes:
                             break
@@ -347,6 +822,73 @@ class SpillManager:
                     buf.lock.release()
         return spilled
 
+    @_spill_cudf_nvtx_annotate
+    def spill_device_memory(self, nbytes: int) -> int:
+        """Try to spill device memory
+
+        This function is safe to call doing spill-on-demand
+        since it does not lock buffers already locked.
+
+        Parameters
+        ----------
+        nbytes : int
+            Number of bytes to try to spill
+
+        Return
+        ------
+        int
+            Number of actually bytes spilled.
+        """
+        spilled = self._spill("gpu", "cpu", nbytes)
+        if spilled > 0:
+            self.spill_to_host_limit()
+        return spilled
+
+    def spill_host_memory(self, nbytes: int) -> int:
+        """Try to spill host memory to disk
+
+        Buffers spilled to host memory are moved to disk in the order
+        of the spill policy.
+
+        Parameters
+        ----------
+        nbytes : int
+            Number of bytes to try to spill
+
+        Return
+        ------
+        int
+            Number of actually bytes spilled.
+        """
+        if nbytes <= 0:
+            return 0
+        return self._spill("cpu", "disk", nbytes)
+
+    def spill_to_host_limit(self, host_limit: int | None = None) -> int:
+        """Try to spill host memory until host limit
+
+        Notice, by default this is a no-op.
+
+        Parameters
+        ----------
+        host_limit : int, optional
+            Limit in bytes. If None, the value of the environment variable
+            `CUDF_SPILL_HOST_LIMIT` is used. If this is not set, the method
+            does nothing and returns 0.
+
+        Return
+        ------
+        int
+            The number of bytes spilled.
+        """
+        limit = self._host_memory_limit if host_limit is None else host_limit
+        if limit is None:
+            return 0
+        with self._lock:
+            self._remove_deleted()
+            on_host = self._nbytes["cpu"]
+        return self.spill_host_memory(nbytes=on_host - limit)
+
     def spill_to_device_limit(self, device_limit: int | None = None) -> int:
         """Try to spill device memory until device limit
 
@@ -369,16 +911,19 @@ class SpillManager:
         )
         if limit is None:
             return 0
-        unspilled = sum(
-            buf.size for buf in self.buffers() if not buf.is_spilled
-        )
+        with self._lock:
+            self._remove_deleted()
+            unspilled = self._nbytes["gpu"]
+        if unspilled <= limit:
+            return 0
         return self.spill_device_memory(nbytes=unspilled - limit)
 
     def __repr__(self) -> str:
-        spilled = sum(buf.size for buf in self.buffers() if buf.is_spilled)
-        unspilled = sum(
-            buf.size for buf in self.buffers() if not buf.is_spilled
-        )
+        with self._lock:
+            self._remove_deleted()
+            spilled = self._nbytes["cpu"] + self._nbytes["disk"]
+            on_disk = self._nbytes["disk"]
+            unspilled = self._nbytes["gpu"]
         unspillable = 0
         for buf in self.buffers():
             if not (buf.is_spilled or buf.spillable):
@@ -389,9 +934,15 @@ class SpillManager:
         if self._device_memory_limit is not None:
             dev_limit = format_bytes(self._device_memory_limit)
 
+        host_limit = "N/A"
+        if self._host_memory_limit is not None:
+            host_limit = format_bytes(self._host_memory_limit)
+
         return (
-            f"<SpillManager device_memory_limit={dev_limit} | "
-            f"{format_bytes(spilled)} spilled | "
+            f"<SpillManager device_memory_limit={dev_limit} "
+            f"host_memory_limit={host_limit} | "
+            f"{format_bytes(spilled)} spilled "
+            f"({format_bytes(on_disk)} on disk) | "
             f"{format_bytes(unspilled)} ({unspillable_ratio:.0%}) "
             f"unspilled (unspillable)>"
         )
@@ -426,6 +977,13 @@ def get_global_manager() -> SpillManager | None:
         if get_option("spill"):
             manager = SpillManager(
                 device_memory_limit=get_option("spill_device_limit"),
+                device_high_watermark=get_option(
+                    "spill_device_high_watermark"
+                ),
+                device_low_watermark=get_option("spill_device_low_watermark"),
+                host_memory_limit=get_option("spill_host_limit"),
+                disk_directory=get_option("spill_disk_directory"),
+                policy=get_option("spill_policy"),
                 statistic_level=get_option("spill_stats"),
             )
             set_global_manager(manager)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import collections.abc
+import os
+import tempfile
 import time
 import weakref
 from threading import RLock
@@ -32,6 +34,39 @@ class SpillLock:
     pass
 
 
+def _write_to_disk(data: memoryview, directory: str | None) -> memoryview:
+    """Write host memory to a memory-mapped file
+
+    The file is unlinked right away, the operating system reclaims the
+    disk space when the memory map is released.
+
+    Parameters
+    ----------
+    data : memoryview
+        The host memory to write.
+    directory : str or None
+        The directory of the file. If None, the default temporary
+        directory is used.
+
+    Return
+    ------
+    memoryview
+        A read-only view of the memory-mapped file, which is read
+        back lazily on access.
+    """
+    if data.nbytes == 0:
+        return memoryview(b"")
+    fd, path = tempfile.mkstemp(prefix="cudf-spill-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return numpy.memmap(
+            path, dtype="u1", mode="r", shape=(data.nbytes,)
+        ).data
+    finally:
+        os.remove(path)
+
+
 class DelayedPointerTuple(collections.abc.Sequence):
     """
     A delayed version of the "data" field in __cuda_array_interface__.
@@ -65,7 +100,8 @@ class DelayedPointerTuple(collections.abc.Sequence):
 class SpillableBufferOwner(BufferOwner):
     """A Buffer that supports spilling memory off the GPU to avoid OOMs.
 
-    This buffer supports spilling the represented data to host memory.
+    This buffer supports spilling the represented data to host memory
+    and further to disk (memory-mapped files).
     Spilling can be done manually by calling `.spill(target="cpu")` but
     usually the associated spilling manager triggers spilling based on current
     device memory usage see `cudf.core.buffer.spill_manager.SpillManager`.
@@ -90,6 +126,7 @@ class SpillableBufferOwner(BufferOwner):
     _last_accessed: float
     _ptr_desc: dict[str, Any]
     _manager: SpillManager
+    _manager_key: int | None
 
     def _finalize_init(self, ptr_desc: dict[str, Any]) -> None:
         """Finish initialization of the spillable buffer
@@ -117,6 +154,7 @@ class SpillableBufferOwner(BufferOwner):
             )
 
         self._manager = manager
+        self._manager_key = None  # Set by the manager if managed
         self._manager.add(self)
 
     @classmethod
@@ -179,13 +217,18 @@ class SpillableBufferOwner(BufferOwner):
     def is_spilled(self) -> bool:
         return self._ptr_desc["type"] != "gpu"
 
+    @property
+    def memory_location(self) -> str:
+        """The location of the data: "gpu", "cpu", or "disk"."""
+        return self._ptr_desc["type"]
+
     def spill(self, target: str = "cpu") -> None:
         """Spill or un-spill this buffer in-place
 
         Parameters
         ----------
         target : str
-            The target of the spilling.
+            The target of the spilling: "gpu", "cpu", or "disk".
         """
 
         time_start = time.perf_counter()
@@ -199,6 +242,12 @@ class SpillableBufferOwner(BufferOwner):
                     f"Cannot in-place move an unspillable buffer: {self}"
                 )
 
+            if (ptr_type, target) == ("gpu", "disk"):
+                # Spill to host memory first
+                self.spill(target="cpu")
+                ptr_type = "cpu"
+                time_start = time.perf_counter()
+
             if (ptr_type, target) == ("gpu", "cpu"):
                 with nvtx.annotate(
                     message="SpillDtoH",
@@ -212,7 +261,7 @@ class SpillableBufferOwner(BufferOwner):
                 self._ptr_desc["memoryview"] = host_mem
                 self._ptr = 0
                 self._owner = None
-            elif (ptr_type, target) == ("cpu", "gpu"):
+            elif (ptr_type, target) in (("cpu", "gpu"), ("disk", "gpu")):
                 # Notice, this operation is prone to deadlock because the RMM
                 # allocation might trigger spilling-on-demand which in turn
                 # trigger a new call to this buffer's `spill()`.
@@ -229,10 +278,29 @@ class SpillableBufferOwner(BufferOwner):
                 self._ptr = dev_mem.ptr
                 self._owner = dev_mem
                 assert self._size == dev_mem.size
+            elif (ptr_type, target) == ("cpu", "disk"):
+                with nvtx.annotate(
+                    message="SpillHtoDisk",
+                    color=_get_color_for_nvtx("SpillHtoDisk"),
+                    domain="cudf_python-spill",
+                ):
+                    self._ptr_desc["memoryview"] = _write_to_disk(
+                        self._ptr_desc["memoryview"],
+                        self._manager.disk_directory,
+                    )
+            elif (ptr_type, target) == ("disk", "cpu"):
+                with nvtx.annotate(
+                    message="SpillDisktoH",
+                    color=_get_color_for_nvtx("SpillDisktoH"),
+                    domain="cudf_python-spill",
+                ):
+                    host_mem = host_memory_allocation(self.size)
+                    host_mem[:] = self._ptr_desc["memoryview"]
+                self._ptr_desc["memoryview"] = host_mem
             else:
-                # TODO: support moving to disk
                 raise ValueError(f"Unknown target: {target}")
             self._ptr_desc["type"] = target
+            self._manager._on_move(self)
 
         time_end = time.perf_counter()
         self._manager.statistics.log_spill(
@@ -255,6 +323,7 @@ class SpillableBufferOwner(BufferOwner):
             self.spill(target="gpu")
             super().mark_exposed()
             self._last_accessed = time.monotonic()
+            self._manager._on_expose(self)
 
     def spill_lock(self, spill_lock: SpillLock) -> None:
         """Spill lock the buffer
@@ -295,6 +364,7 @@ class SpillableBufferOwner(BufferOwner):
         else:
             self.spill_lock(spill_lock)
             self._last_accessed = time.monotonic()
+            self._manager._on_access(self)
         return self._ptr
 
     def memory_info(self) -> tuple[int, int, str]:
@@ -311,12 +381,12 @@ class SpillableBufferOwner(BufferOwner):
         int
             The size of the memory in bytes
         str
-            The device type as a string ("cpu" or "gpu")
+            The device type as a string ("cpu", "disk", or "gpu")
         """
 
         if self._ptr_desc["type"] == "gpu":
             ptr = self._ptr
-        elif self._ptr_desc["type"] == "cpu":
+        elif self._ptr_desc["type"] in ("cpu", "disk"):
             ptr = numpy.array(
                 self._ptr_desc["memoryview"], copy=False
             ).__array_interface__["data"][0]
@@ -346,7 +416,9 @@ class SpillableBufferOwner(BufferOwner):
         size = self._size if size is None else size
         with self.lock:
             if self.spillable:
-                self.spill(target="cpu")
+                if self._ptr_desc["type"] != "disk":
+                    # Data on disk is read directly from the memory map
+                    self.spill(target="cpu")
                 return self._ptr_desc["memoryview"][offset : offset + size]
             else:
                 assert self._ptr_desc["type"] == "gpu"
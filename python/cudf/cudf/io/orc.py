@@ -5,6 +5,7 @@ import itertools
 import warnings
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 import pyarrow as pa
 
 import pylibcudf as plc
@@ -113,20 +114,33 @@ def _filter_stripes(
         filepath_or_buffer, columns_in_predicate
     )
 
+    # Filter using file-level and stripe-level statistics, evaluating
+    # the filters on all files and on all stripes at once
+    file_mask = ioutils._apply_filters(filters, file_statistics)
+    stripe_mask = ioutils._apply_filters(filters, stripes_statistics)
+    stripe_num_rows = np.array(
+        [
+            next(iter(stripe_statistics.values())).number_of_values
+            for stripe_statistics in stripes_statistics
+        ],
+        dtype=np.int64,
+    )
+    num_rows_after_stripe = np.cumsum(stripe_num_rows)
+    num_rows_before_stripe = num_rows_after_stripe - stripe_num_rows
+
     file_stripe_map = []
-    for file_stat in file_statistics:
-        # Filter using file-level statistics
-        if not ioutils._apply_filters(filters, file_stat):
+    for keep_file in file_mask:
+        if not keep_file:
             continue
 
-        # Filter using stripe-level statistics
         selected_stripes = []
-        num_rows_scanned = 0
-        for i, stripe_statistics in enumerate(stripes_statistics):
-            num_rows_before_stripe = num_rows_scanned
-            num_rows_scanned += next(
-                iter(stripe_statistics.values())
-            ).number_of_values
+        for i, (num_rows_before, num_rows_scanned) in enumerate(
+            zip(
+                num_rows_before_stripe.tolist(),
+                num_rows_after_stripe.tolist(),
+                strict=True,
+            )
+        ):
             if stripes is not None and i not in stripes:
                 continue
             if skip_rows is not None and num_rows_scanned <= skip_rows:
@@ -136,10 +150,10 @@ def _filter_stripes(
             if (
                 skip_rows is not None
                 and num_rows is not None
-                and num_rows_before_stripe >= skip_rows + num_rows
+                and num_rows_before >= skip_rows + num_rows
             ):
                 continue
-            if ioutils._apply_filters(filters, stripe_statistics):
+            if stripe_mask[i]:
                 selected_stripes.append(i)
 
         file_stripe_map.append(selected_stripes)
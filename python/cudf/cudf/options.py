@@ -186,6 +186,13 @@ def _integer_and_none_validator(val):
         )
 
 
+def _string_and_none_validator(val):
+    if val is not None and not isinstance(val, str):
+        raise ValueError(
+            f"{val} is not a valid option. Must be a string or None."
+        )
+
+
 _register_option(
     "default_integer_bitwidth",
     None,
@@ -276,6 +283,89 @@ _register_option(
     _integer_and_none_validator,
 )
 
+_register_option(
+    "spill_device_high_watermark",
+    _env_get_int("CUDF_SPILL_DEVICE_HIGH_WATERMARK", None),
+    textwrap.dedent(
+        """
+        Enables background spilling when device memory usage in bytes
+        exceeds this watermark. A background thread then spills buffers
+        until the usage is below the "spill_device_low_watermark" option.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are any positive integer or None (disabled).
+        \tDefault is None.
+        """
+    ),
+    _integer_and_none_validator,
+)
+
+_register_option(
+    "spill_device_low_watermark",
+    _env_get_int("CUDF_SPILL_DEVICE_LOW_WATERMARK", None),
+    textwrap.dedent(
+        """
+        The device memory usage in bytes that background spilling spills
+        down to, see the "spill_device_high_watermark" option.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are any positive integer or None (3/4 of the high
+        \twatermark).
+        \tDefault is None.
+        """
+    ),
+    _integer_and_none_validator,
+)
+
+_register_option(
+    "spill_host_limit",
+    _env_get_int("CUDF_SPILL_HOST_LIMIT", None),
+    textwrap.dedent(
+        """
+        Enforce a host memory limit in bytes for spilled buffers. Buffers
+        spilled to host memory beyond this limit are spilled further to
+        disk, see the "spill_disk_directory" option.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are any positive integer or None (disabled).
+        \tDefault is None.
+        """
+    ),
+    _integer_and_none_validator,
+)
+
+_register_option(
+    "spill_disk_directory",
+    os.environ.get("CUDF_SPILL_DISK_DIRECTORY", None),
+    textwrap.dedent(
+        """
+        Directory of the memory-mapped files of buffers spilled to disk.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are a path or None (the default temporary directory).
+        \tDefault is None.
+        """
+    ),
+    _string_and_none_validator,
+)
+
+_register_option(
+    "spill_policy",
+    os.environ.get("CUDF_SPILL_POLICY", "lru"),
+    textwrap.dedent(
+        """
+        The policy that selects which buffers to spill:
+            lru               - least recently accessed first.
+            largest           - largest first.
+            gds               - size-weighted least recently accessed
+                                first (GreedyDual-Size).
+            protect_unspilled - least recently accessed first, but
+                                buffers unspilled within the last second
+                                are spilled last.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are "lru", "largest", "gds", or "protect_unspilled".
+        \tDefault is "lru".
+        """
+    ),
+    _make_contains_validator(["lru", "largest", "gds", "protect_unspilled"]),
+)
+
 _register_option(
     "spill_stats",
     _env_get_int("CUDF_SPILL_STATS", 0),
@@ -365,6 +455,35 @@ _register_option(
     _make_contains_validator([False, True]),
 )
 
+_register_option(
+    "io_cache_directory",
+    os.environ.get("CUDF_IO_CACHE_DIRECTORY", None),
+    textwrap.dedent(
+        """
+        Directory of a local on-disk cache of byte ranges read from remote
+        filesystems (e.g. S3 or GCS). The cache is keyed by the path, the
+        version (etag, size, and modification time), and the byte range,
+        so modified files are never served from the cache.
+        \tValid values are a path or None (disabled). Default is None.
+    """
+    ),
+    _string_and_none_validator,
+)
+
+_register_option(
+    "io_cache_size",
+    _env_get_int("CUDF_IO_CACHE_SIZE", 10 * 1024**3),
+    textwrap.dedent(
+        """
+        Maximum size in bytes of the local on-disk cache of remote byte
+        ranges, see the "io_cache_directory" option. The least recently
+        used byte ranges are evicted first.
+        \tValid values are any positive integer. Default is 10 GiB.
+    """
+    ),
+    _integer_validator,
+)
+
 
 class option_context(ContextDecorator):
     """
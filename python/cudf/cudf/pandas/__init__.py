@@ -14,9 +14,10 @@ from .fast_slow_proxy import (
     is_proxy_object,
 )
 from .magics import load_ipython_extension
-from .profiler import Profiler
+from .profiler import CountingProfiler, Profiler
 
 __all__ = [
+    "CountingProfiler",
     "Profiler",
     "as_proxy_object",
     "install",
@@ -17,14 +17,20 @@ import tempfile
 from contextlib import contextmanager
 
 from . import install
-from .profiler import Profiler, lines_with_profiling
+from .profiler import CountingProfiler, Profiler, lines_with_profiling
 
 
 @contextmanager
-def profile(function_profile, line_profile, fn):
-    if fn is None and (line_profile or function_profile):
+def profile(function_profile, line_profile, fn, counting_profile=False):
+    if fn is None and (line_profile or function_profile or counting_profile):
         raise RuntimeError("Enabling the profiler requires a script name.")
-    if line_profile:
+    if counting_profile:
+        with CountingProfiler(filename=fn) as profiler:
+            yield fn
+        profiler.print_per_function_stats()
+        if line_profile:
+            profiler.print_per_line_stats()
+    elif line_profile:
         with open(fn) as f:
             lines = f.readlines()
 
@@ -72,6 +78,16 @@ def main():
         action="store_true",
         help="Perform per-line profiling of this script.",
     )
+    parser.add_argument(
+        "--counting-profile",
+        action="store_true",
+        help=(
+            "Perform low-overhead per-function profiling of this script, "
+            "counting the function calls and host/device copies instead "
+            "of tracing every line. Combine with --line-profile to also "
+            "report the time per line."
+        ),
+    )
     parser.add_argument(
         "args",
         nargs=argparse.REMAINDER,
@@ -89,7 +105,12 @@ def main():
     install()
 
     script_name = args.args[0] if len(args.args) > 0 else None
-    with profile(args.profile, args.line_profile, script_name) as fn:
+    with profile(
+        args.profile,
+        args.line_profile,
+        script_name,
+        counting_profile=args.counting_profile,
+    ) as fn:
         if script_name is not None:
             args.args[0] = fn
         if args.module:
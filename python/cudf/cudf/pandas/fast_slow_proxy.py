@@ -8,8 +8,12 @@ import functools
 import inspect
 import operator
 import pickle
+import threading
+import time
 import types
 import warnings
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable, Iterator, Mapping
 from enum import IntEnum
 from typing import Any, Literal
@@ -18,7 +22,7 @@ import numpy as np
 
 from rmm import RMMError
 
-from ..options import _env_get_bool
+from ..options import _env_get_bool, _env_get_int
 from ..testing import assert_eq
 from .annotation import nvtx
 from .proxy_base import ProxyNDarrayBase
@@ -189,7 +193,7 @@ def make_final_proxy_type(
         # if we are wrapping a slow object,
         # convert it to a fast one
         if self._fsproxy_state is _State.SLOW:
-            return slow_to_fast(self._fsproxy_wrapped)
+            return _copy(_State.FAST, slow_to_fast, self._fsproxy_wrapped)
         return self._fsproxy_wrapped
 
     @nvtx.annotate(
@@ -201,7 +205,7 @@ def make_final_proxy_type(
         # if we are wrapping a fast object,
         # convert it to a slow one
         if self._fsproxy_state is _State.FAST:
-            return fast_to_slow(self._fsproxy_wrapped)
+            return _copy(_State.SLOW, fast_to_slow, self._fsproxy_wrapped)
         return self._fsproxy_wrapped
 
     def as_gpu_object(self):
@@ -604,6 +608,45 @@ class _FinalProxy(_FastSlowProxy):
         proxy._fsproxy_wrapped = value
         return proxy
 
+    @property
+    def _fsproxy_fast(self) -> Any:
+        """
+        Returns the wrapped object. If the wrapped object is of "slow"
+        type, replaces it with the corresponding "fast" object before
+        returning it. The "slow" object may be kept as a secondary
+        copy, see `_DualResidency`.
+        """
+        if self._fsproxy_state is _State.SLOW:
+            self._fsproxy_convert(_State.FAST)
+        return self._fsproxy_wrapped
+
+    @property
+    def _fsproxy_slow(self) -> Any:
+        """
+        Returns the wrapped object. If the wrapped object is of "fast"
+        type, replaces it with the corresponding "slow" object before
+        returning it. The "fast" object may be kept as a secondary
+        copy, see `_DualResidency`.
+        """
+        if self._fsproxy_state is _State.FAST:
+            self._fsproxy_convert(_State.SLOW)
+        return self._fsproxy_wrapped
+
+    def _fsproxy_convert(self, state: _State) -> None:
+        """
+        Replace the wrapped object with its `state` counterpart,
+        reusing the secondary copy if it is still valid.
+        """
+        wrapped = self._fsproxy_wrapped
+        converted = _dual_residency.get(self)
+        if converted is None:
+            if state is _State.FAST:
+                converted = self._fsproxy_slow_to_fast()
+            else:
+                converted = self._fsproxy_fast_to_slow()
+        self._fsproxy_wrapped = converted
+        _dual_residency.admit(self, wrapped)
+
     def __reduce__(self):
         """
         In conjunction with `__proxy_setstate__`, this effectively enables
@@ -669,7 +712,7 @@ class _IntermediateProxy(_FastSlowProxy):
     def _fsproxy_slow_to_fast(self) -> Any:
         func, args, kwargs = self._method_chain
         args, kwargs = _fast_arg(args), _fast_arg(kwargs)
-        return func(*args, **kwargs)
+        return _copy(_State.FAST, func, *args, **kwargs)
 
     @nvtx.annotate(
         "COPY_FAST_TO_SLOW",
@@ -679,7 +722,7 @@ class _IntermediateProxy(_FastSlowProxy):
     def _fsproxy_fast_to_slow(self) -> Any:
         func, args, kwargs = self._method_chain
         args, kwargs = _slow_arg(args), _slow_arg(kwargs)
-        return func(*args, **kwargs)
+        return _copy(_State.SLOW, func, *args, **kwargs)
 
     def __reduce__(self):
         """
@@ -963,6 +1006,34 @@ def _fast_function_call():
     return None
 
 
+# The active `cudf.pandas.profiler.CountingProfiler`, if any
+_call_profiler: Any = None
+
+
+def _set_call_profiler(profiler: Any) -> Any:
+    """
+    Make `profiler` the active counting profiler, returns the
+    previously active one.
+    """
+    global _call_profiler
+    previous, _call_profiler = _call_profiler, profiler
+    return previous
+
+
+def _copy(state: _State, convert: Callable, /, *args, **kwargs) -> Any:
+    """
+    Call `convert`, which copies an object to its `state` counterpart,
+    and report the copy to the active counting profiler.
+    """
+    profiler = _call_profiler
+    if profiler is None:
+        return convert(*args, **kwargs)
+    start = time.perf_counter()
+    result = convert(*args, **kwargs)
+    profiler.record_copy(state, result, time.perf_counter() - start)
+    return result
+
+
 def _slow_function_call():
     """
     Placeholder slow function for pytest profiling purposes.
@@ -970,6 +1041,418 @@ def _slow_function_call():
     return None
 
 
+# Scalar argument types whose values (rather than types) are part of the
+# key of a call in the fast path failure cache
+_KEY_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Maximum number of the packed arguments whose keys are part of the key
+# of a call in the fast path failure cache
+_KEY_MAX_SEQUENCE_LENGTH = 16
+
+# Key of an argument that is not fully described by its key, e.g. a list
+# or an array whose contents may make the fast path fail
+_UNKEYABLE = object()
+
+
+def _call_key(arg: Any, depth: int, with_dtypes: bool) -> Any:
+    """
+    Key of an argument of a call in the fast path failure cache.
+
+    The key of a proxy is its type (and the dtypes of the wrapped
+    object if `with_dtypes`), and the key of a scalar is its value.
+    Tuples and dicts up to `depth` are the packed arguments of the
+    call. Any other argument is `_UNKEYABLE`. Computing the key never
+    converts a proxy between its fast and slow type.
+    """
+    typ = type(arg)
+    if typ in _KEY_VALUE_TYPES:
+        return arg
+    elif isinstance(arg, _FunctionProxy):
+        slow = arg._fsproxy_slow
+        return (
+            getattr(slow, "__module__", None),
+            getattr(slow, "__qualname__", type(slow)),
+        )
+    elif isinstance(arg, _FastSlowProxy):
+        if with_dtypes and isinstance(arg, _FinalProxy):
+            return (typ, _wrapped_dtypes(arg))
+        return typ
+    elif typ is types.FunctionType:
+        return arg.__code__
+    elif typ is types.BuiltinFunctionType:
+        return (arg.__module__, arg.__qualname__)
+    elif isinstance(arg, (type, types.ModuleType)):
+        return arg
+    elif depth > 0 and typ is tuple:
+        if len(arg) > _KEY_MAX_SEQUENCE_LENGTH:
+            return _UNKEYABLE
+        keys = tuple(_call_key(a, depth - 1, with_dtypes) for a in arg)
+        if any(k is _UNKEYABLE for k in keys):
+            return _UNKEYABLE
+        return (typ, *keys)
+    elif depth > 0 and typ is dict:
+        keys = tuple(
+            (k, _call_key(v, depth - 1, with_dtypes)) for k, v in arg.items()
+        )
+        if any(k is _UNKEYABLE for _, k in keys):
+            return _UNKEYABLE
+        return (typ, *keys)
+    return _UNKEYABLE
+
+
+def _wrapped_dtypes(proxy: _FinalProxy) -> Any:
+    """
+    The dtype(s) of the object wrapped by `proxy`, if any.
+    """
+    try:
+        wrapped = vars(proxy)["_fsproxy_wrapped"]
+        dtype = getattr(wrapped, "dtype", None)
+        if dtype is not None:
+            return str(dtype)
+        dtypes = getattr(wrapped, "dtypes", None)
+        if dtypes is not None:
+            return tuple(sorted({str(d) for d in dtypes}))
+    except Exception:
+        pass
+    return None
+
+
+class _FastPathFailureCache:
+    """
+    Bounded cache of the calls whose fast path failed deterministically.
+
+    A call is keyed by the called function, the types of its proxied
+    arguments and the values of its scalar arguments, such that
+    repeating a call that failed the same way, e.g. ``df.apply(func)``
+    in a loop, goes straight to the slow path instead of converting its
+    arguments to their fast type and raising again. Failures are
+    recorded per dtypes of the proxied arguments, which are only
+    computed for calls that failed before. Calls with other arguments,
+    e.g. lists or arrays whose contents decide whether the fast path
+    fails, and constructor calls are never cached.
+
+    Set the environment variable ``CUDF_PANDAS_FALLBACK_CACHE`` to 0 to
+    disable the cache. ``CUDF_PANDAS_FALLBACK_CACHE_SIZE`` is the
+    maximum number of cached failures.
+    """
+
+    # Exceptions whose fast path failures are cached
+    _EXCEPTIONS = (NotImplementedError, TypeError, AttributeError)
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.records = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # Maps the keys of calls to their number of cached failures
+        self._calls: dict[tuple, int] = {}
+        # Maps the keys of calls and the dtypes of their proxied
+        # arguments to the type and message of the failure
+        self._failures: dict[tuple, tuple[type[Exception], str]] = {}
+
+    def key(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        """
+        The key of a call, or None if the call is not cached.
+        """
+        if self.maxsize <= 0 or not _env_get_bool(
+            "CUDF_PANDAS_FALLBACK_CACHE", True
+        ):
+            return None
+        if (
+            type(func) is types.FunctionType
+            and args
+            and isinstance(args[0], type)
+            and issubclass(args[0], _FastSlowProxy)
+        ):
+            # Constructors (see __init__ of the final proxy types),
+            # whose failures depend on the data they are given
+            return None
+        key = (
+            _call_key(func, 0, False),
+            _call_key(args, 2, False),
+            _call_key(kwargs, 1, False),
+        )
+        if any(k is _UNKEYABLE for k in key):
+            return None
+        return key
+
+    def _dtypes_key(self, key: tuple, args: tuple, kwargs: dict) -> tuple:
+        return (key, _call_key(args, 2, True), _call_key(kwargs, 1, True))
+
+    def get(self, key: Any, args: tuple, kwargs: dict) -> Exception | None:
+        """
+        The exception of the cached failure of a call, if any.
+        """
+        if key is None or key not in self._calls:
+            return None
+        failure = self._failures.get(self._dtypes_key(key, args, kwargs))
+        if failure is None:
+            return None
+        self.hits += 1
+        exc_type, message = failure
+        # Don't call __init__, which may take other arguments
+        return exc_type.__new__(exc_type, message)
+
+    def record(
+        self, key: Any, err: Exception, args: tuple, kwargs: dict
+    ) -> None:
+        """
+        Cache the failure of a call if it is deterministic.
+        """
+        if key is None or not isinstance(err, self._EXCEPTIONS):
+            return
+        dtypes_key = self._dtypes_key(key, args, kwargs)
+        with self._lock:
+            if dtypes_key in self._failures:
+                return
+            self._failures[dtypes_key] = (type(err), str(err))
+            self._calls[key] = self._calls.get(key, 0) + 1
+            self.records += 1
+            while len(self._failures) > self.maxsize:
+                # Evict the oldest failure
+                oldest = next(iter(self._failures))
+                del self._failures[oldest]
+                self._calls[oldest[0]] -= 1
+                if self._calls[oldest[0]] == 0:
+                    del self._calls[oldest[0]]
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all cached failures and reset the counters.
+        """
+        with self._lock:
+            self._calls.clear()
+            self._failures.clear()
+            self.hits = self.records = self.evictions = 0
+
+
+_fast_path_failures = _FastPathFailureCache(
+    _env_get_int("CUDF_PANDAS_FALLBACK_CACHE_SIZE", 1024)
+)
+
+
+def _nbytes(obj: Any) -> int | None:
+    """
+    The size in bytes of a pandas or cuDF object, None if unknown.
+    """
+    try:
+        if isinstance(getattr(type(obj), "nbytes", None), property):
+            return int(obj.nbytes)
+        usage = obj.memory_usage(deep=False)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    except Exception:
+        return None
+
+
+# Methods that mutate the object they are called on
+_MUTATING_METHODS = frozenset(
+    {
+        "__delattr__",
+        "__delitem__",
+        "__iadd__",
+        "__iand__",
+        "__iconcat__",
+        "__ifloordiv__",
+        "__ilshift__",
+        "__imatmul__",
+        "__imod__",
+        "__imul__",
+        "__ior__",
+        "__ipow__",
+        "__irshift__",
+        "__isub__",
+        "__itruediv__",
+        "__ixor__",
+        "__setattr__",
+        "__setitem__",
+        "__setstate__",
+        "insert",
+        "pop",
+        "update",
+    }
+)
+
+
+def _mutation_target(obj: Any) -> _FinalProxy | None:
+    """
+    The final proxy that mutating `obj` mutates, if any.
+
+    Mutating an intermediate proxy, e.g. ``df.loc`` in
+    ``df.loc[0] = 1``, mutates the final proxy it originates from.
+    """
+    while isinstance(obj, _IntermediateProxy):
+        func, args, _ = obj._method_chain
+        if func is call_operator and len(args) == 3:
+            # A method call, whose arguments are args[1]
+            args = args[1]
+        obj = args[0] if args else None
+    return obj if isinstance(obj, _FinalProxy) else None
+
+
+class _DualResidency:
+    """
+    Secondary copies of the objects wrapped by final proxies.
+
+    Converting a final proxy between its fast and slow type may keep
+    the object it wrapped as a secondary copy, such that code
+    alternating calls that are and aren't supported by the fast type
+    doesn't copy the wrapped object between host and device on every
+    call. The secondary copy of a proxy is dropped when the proxy is
+    mutated, e.g. by ``__setitem__``, ``__setattr__``, ``df.loc[...] =``
+    or a method called with ``inplace=True``, and the least recently
+    used copies are dropped when the copies exceed the memory budget.
+
+    Mutations through views of the wrapped object, e.g. chained
+    assignment or writing to ``df.values``, aren't tracked. Hence the
+    secondary copies are opt-in: set the environment variable
+    ``CUDF_PANDAS_DUAL_RESIDENCY_BUDGET`` to the maximum total size in
+    bytes of the secondary copies to enable them.
+    """
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.nbytes = 0
+        self.hits = 0
+        self.admits = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Reentrant since weak reference callbacks may run during a
+        # garbage collection triggered while holding the lock
+        self._lock = threading.RLock()
+        # Maps the ids of the proxies with a secondary copy, in least
+        # recently used order, to a weak reference to the proxy and
+        # the size of the copy
+        self._entries: OrderedDict[int, tuple[weakref.ref, int]] = (
+            OrderedDict()
+        )
+
+    def get(self, proxy: _FinalProxy) -> Any:
+        """
+        The secondary copy of the object wrapped by `proxy`, if it is
+        still valid.
+        """
+        entry = vars(proxy).get("_fsproxy_secondary")
+        if entry is None:
+            return None
+        primary, secondary = entry
+        if primary is not proxy._fsproxy_wrapped:
+            # The wrapped object was replaced, e.g. by __setstate__
+            self.invalidate(proxy)
+            return None
+        with self._lock:
+            if id(proxy) in self._entries:
+                self._entries.move_to_end(id(proxy))
+            self.hits += 1
+        return secondary
+
+    def admit(self, proxy: _FinalProxy, obj: Any) -> None:
+        """
+        Keep `obj`, the object wrapped by `proxy` before its
+        conversion, as the secondary copy of `proxy` if it fits in the
+        budget.
+        """
+        self.invalidate(proxy)
+        if self.budget <= 0 or isinstance(proxy, ProxyNDarrayBase):
+            # The buffer of a proxied ndarray is shared with the
+            # wrapped object and may be mutated without notice
+            return
+        nbytes = _nbytes(obj)
+        if nbytes is None or nbytes > self.budget:
+            return
+        key = id(proxy)
+        ref = weakref.ref(proxy, lambda ref: self._remove(key, ref))
+        proxy._fsproxy_secondary = (proxy._fsproxy_wrapped, obj)
+        evicted = []
+        with self._lock:
+            self._entries[key] = (ref, nbytes)
+            self.nbytes += nbytes
+            self.admits += 1
+            while self.nbytes > self.budget:
+                _, (old_ref, old_nbytes) = self._entries.popitem(last=False)
+                self.nbytes -= old_nbytes
+                self.evictions += 1
+                evicted.append(old_ref())
+        for old in evicted:
+            if old is not None:
+                vars(old).pop("_fsproxy_secondary", None)
+
+    def invalidate(self, proxy: _FinalProxy) -> bool:
+        """
+        Drop the secondary copy of `proxy`, returns whether it had one.
+        """
+        if vars(proxy).pop("_fsproxy_secondary", None) is None:
+            return False
+        with self._lock:
+            entry = self._entries.pop(id(proxy), None)
+            if entry is not None:
+                self.nbytes -= entry[1]
+        return True
+
+    def _remove(self, key: int, ref: weakref.ref) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+                self.nbytes -= entry[1]
+
+    def mutated(self, func: Callable, args: tuple) -> list[_FinalProxy]:
+        """
+        The proxies with a secondary copy that calling `func` with
+        `args` in `_fast_slow_function_call` may mutate.
+        """
+        if not self._entries or func is not call_operator or len(args) != 3:
+            return []
+        method, call_args, call_kwargs = args
+        if not isinstance(method, _MethodProxy):
+            return []
+        targets = []
+        if call_args and (
+            call_kwargs.get("inplace") is True
+            or getattr(method._fsproxy_slow, "__name__", None)
+            in _MUTATING_METHODS
+        ):
+            targets.append(call_args[0])
+        out = call_kwargs.get("out")
+        if out is not None:
+            targets.extend(out if isinstance(out, tuple) else (out,))
+        return [
+            target
+            for target in map(_mutation_target, targets)
+            if target is not None
+        ]
+
+    def invalidate_mutated(self, proxies: list[_FinalProxy]) -> None:
+        """
+        Drop the secondary copies of the mutated `proxies`.
+        """
+        for proxy in proxies:
+            if self.invalidate(proxy):
+                with self._lock:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drop all secondary copies and reset the counters.
+        """
+        with self._lock:
+            refs = [ref for ref, _ in self._entries.values()]
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = self.admits = self.evictions = 0
+            self.invalidations = 0
+        for ref in refs:
+            proxy = ref()
+            if proxy is not None:
+                vars(proxy).pop("_fsproxy_secondary", None)
+
+
+_dual_residency = _DualResidency(
+    _env_get_int("CUDF_PANDAS_DUAL_RESIDENCY_BUDGET", 0)
+)
+
+
 def _fast_slow_function_call(
     func: Callable,
     /,
@@ -987,7 +1470,16 @@ def _fast_slow_function_call(
     from .module_accelerator import disable_module_accelerator
 
     fast = False
+    key = _fast_path_failures.key(func, args, kwargs)
+    cached_err = _fast_path_failures.get(key, args, kwargs)
+    mutated = _dual_residency.mutated(func, args)
+    profiler = _call_profiler
+    if profiler is not None:
+        call = profiler.enter_call(func, args)
     try:
+        if cached_err is not None:
+            # The fast path is known to fail, skip it
+            raise cached_err
         with nvtx.annotate(
             "EXECUTE_FAST",
             color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_FAST"],
@@ -1032,6 +1524,8 @@ def _fast_slow_function_call(
                             f"The exception was {e}."
                         )
     except Exception as err:
+        if cached_err is None:
+            _fast_path_failures.record(key, err, args, kwargs)
         with nvtx.annotate(
             "EXECUTE_SLOW",
             color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_SLOW"],
@@ -1047,6 +1541,11 @@ def _fast_slow_function_call(
             _slow_function_call()
             with disable_module_accelerator():
                 result = func(*slow_args, **slow_kwargs)
+    finally:
+        # The secondary copies of mutated proxies are stale
+        _dual_residency.invalidate_mutated(mutated)
+        if profiler is not None:
+            profiler.exit_call(call, fast)
     return _maybe_wrap_result(result, func, *args, **kwargs), fast
 
 
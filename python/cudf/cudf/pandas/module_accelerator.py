@@ -379,7 +379,10 @@ class ModuleAccelerator(ModuleAcceleratorBase):
     """
 
     _denylist: tuple[str]
+    _denylist_cache: dict[str, bool]
     _disable_count: defaultdict[int, int]
+    _disable_lock: threading.Lock
+    _disable_total: int
     _module_cache_prefix: str = "_slow_lib_"
 
     # TODO: Add possibility for either an explicit allow-list of
@@ -408,10 +411,17 @@ class ModuleAccelerator(ModuleAcceleratorBase):
                 sys.modules[self._module_cache_prefix + mod] = sys.modules[mod]
                 del sys.modules[mod]
         self._denylist = (*slow_module.__path__, *fast_module.__path__)
+        # Whether code in a file is in the denylist, by filename
+        self._denylist_cache = {}
 
         # This initialization does not need to be protected since a given instance is
         # always being created on a given thread.
         self._disable_count = defaultdict(int)
+        # Number of active disabled() blocks across all threads, such
+        # that attribute lookups can skip the per-thread checks when
+        # none is active
+        self._disable_total = 0
+        self._disable_lock = threading.Lock()
         return self
 
     def _populate_module(self, mod: ModuleType):
@@ -503,11 +513,15 @@ class ModuleAccelerator(ModuleAcceleratorBase):
         -------
         Context manager for disabling things
         """
+        with self._disable_lock:
+            self._disable_total += 1
         self._disable_count[threading.get_ident()] += 1
         try:
             yield
         finally:
             self._disable_count[threading.get_ident()] -= 1
+            with self._disable_lock:
+                self._disable_total -= 1
 
     @staticmethod
     def getattr_real_or_wrapped(
@@ -536,7 +550,7 @@ class ModuleAccelerator(ModuleAcceleratorBase):
         -------
         The requested attribute (either real or wrapped)
         """
-        use_real = (
+        use_real = loader._disable_total > 0 and (
             loader._disable_count[threading.get_ident()] > 0
             # If acceleration was disabled on the main thread, we should respect that.
             # This only works because we currently have no way to re-enable other than
@@ -552,13 +566,15 @@ class ModuleAccelerator(ModuleAcceleratorBase):
         )
         if not use_real:
             # Only need to check the denylist if we're not turned off.
-            frame = sys._getframe()
             # We cannot possibly be at the top level.
-            assert frame.f_back
-            calling_module = pathlib.PurePath(frame.f_back.f_code.co_filename)
-            use_real = _caller_in_denylist(
-                calling_module, tuple(loader._denylist)
-            )
+            filename = sys._getframe(1).f_code.co_filename
+            use_real = loader._denylist_cache.get(filename)
+            if use_real is None:
+                use_real = loader._denylist_cache[filename] = (
+                    _caller_in_denylist(
+                        pathlib.PurePath(filename), loader._denylist
+                    )
+                )
         try:
             if use_real:
                 return real[name]
@@ -4,11 +4,14 @@
 from __future__ import annotations
 
 import inspect
+import linecache
 import operator
 import pickle
 import sys
+import threading
 import time
 from collections import defaultdict
+from dataclasses import dataclass
 
 from rich.console import Console
 from rich.syntax import Syntax
@@ -19,6 +22,9 @@ from .fast_slow_proxy import (
     _FunctionProxy,
     _IntermediateProxy,
     _MethodProxy,
+    _nbytes,
+    _set_call_profiler,
+    _State,
 )
 
 # This text is used in contexts where the profiler is injected into the
@@ -311,3 +317,256 @@ class Profiler:
 def load_stats(file_name):
     with open(file_name, "rb") as f:
         return pickle.load(f)
+
+
+@dataclass
+class CallStats:
+    """
+    Counters of the calls of a function or the calls made by a line,
+    see `CountingProfiler`.
+    """
+
+    gpu_calls: int = 0
+    gpu_time: float = 0.0
+    cpu_calls: int = 0
+    cpu_time: float = 0.0
+    # Copies and bytes copied from host to device
+    h2d_copies: int = 0
+    h2d_bytes: int = 0
+    # Copies and bytes copied from device to host
+    d2h_copies: int = 0
+    d2h_bytes: int = 0
+
+
+class CountingProfiler:
+    """
+    Low-overhead profiler of the cudf.pandas function calls.
+
+    Unlike `Profiler`, which traces every line, this profiler is driven
+    by counters and timestamps recorded by the function calls and the
+    host/device copies of the proxies themselves, such that it is cheap
+    enough to leave on for production workloads. It reports per-function
+    GPU and CPU time, the number of CPU fallbacks and the bytes copied
+    in each direction.
+
+    Calls are also attributed to the line of `filename` that made them,
+    found by walking the stack of the outermost function calls only.
+
+    Parameters
+    ----------
+    filename
+        The file whose lines the calls are attributed to, defaults to
+        the file entering the profiler.
+    """
+
+    def __init__(self, filename: str | None = None):
+        self._filename = filename
+        self._lock = threading.Lock()
+        # Per-thread stack of the names of the running function calls
+        self._local = threading.local()
+        self._per_func_results: defaultdict[str, CallStats] = defaultdict(
+            CallStats
+        )
+        self._per_line_results: defaultdict[tuple[int, str], CallStats] = (
+            defaultdict(CallStats)
+        )
+        self._previous = None
+        self.start_time = None
+        self.end_time = None
+
+    def __enter__(self):
+        if self._filename is None:
+            self._filename = inspect.currentframe().f_back.f_code.co_filename
+        self.start_time = time.perf_counter()
+        self._previous = _set_call_profiler(self)
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        _set_call_profiler(self._previous)
+        self._previous = None
+        self.end_time = time.perf_counter()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"], state["_local"]
+        state["_per_func_results"] = dict(self._per_func_results)
+        state["_per_line_results"] = dict(self._per_line_results)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._per_func_results = defaultdict(CallStats, self._per_func_results)
+        self._per_line_results = defaultdict(CallStats, self._per_line_results)
+
+    @staticmethod
+    def _function_name(func, args) -> str | None:
+        func_obj = args[0] if args else None
+        if isinstance(func_obj, _MethodProxy):
+            return func_obj._fsproxy_slow.__qualname__
+        elif isinstance(func_obj, _FunctionProxy):
+            return func_obj.__name__
+        elif isinstance(func_obj, type) and issubclass(
+            func_obj, (_FinalProxy, _IntermediateProxy)
+        ):
+            if func is getattr:
+                return f"{func_obj.__name__}.{args[1]}"
+            return func_obj.__name__
+        elif func is getattr and isinstance(
+            func_obj, (_FinalProxy, _IntermediateProxy)
+        ):
+            # Attribute access, e.g. df.shape
+            return f"{type(func_obj).__name__}.{args[1]}"
+        return None
+
+    def _caller_line(self) -> tuple[int, str] | None:
+        frame = sys._getframe(3)
+        while frame is not None:
+            if frame.f_code.co_filename == self._filename:
+                return (frame.f_lineno, self._filename)
+            frame = frame.f_back
+        return None
+
+    def enter_call(self, func, args):
+        """
+        Record the start of a call of `func` with `args`, returns the
+        token to pass to `exit_call`.
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        line = self._caller_line() if not stack else None
+        name = self._function_name(func, args)
+        if name is None and stack:
+            # Attribute the call, e.g. a constructor, to its caller
+            name = stack[-1]
+        stack.append(name)
+        return (name, line, time.perf_counter())
+
+    def exit_call(self, token, fast: bool):
+        """
+        Record the end of the call started by `enter_call`.
+        """
+        elapsed = time.perf_counter()
+        name, line, start = token
+        elapsed -= start
+        self._local.stack.pop()
+        with self._lock:
+            stats = []
+            if name is not None and (
+                not self._local.stack or self._local.stack[-1] != name
+            ):
+                stats.append(self._per_func_results[name])
+            if line is not None:
+                stats.append(self._per_line_results[line])
+            for stat in stats:
+                if fast:
+                    stat.gpu_calls += 1
+                    stat.gpu_time += elapsed
+                else:
+                    stat.cpu_calls += 1
+                    stat.cpu_time += elapsed
+
+    def record_copy(self, state: _State, obj, elapsed: float):
+        """
+        Record the copy of a proxied object to `obj`, of type `state`.
+        """
+        stack = getattr(self._local, "stack", None)
+        name = stack[-1] if stack else None
+        nbytes = _nbytes(obj) or 0
+        with self._lock:
+            stat = self._per_func_results[name or "<other>"]
+            if state is _State.FAST:
+                stat.h2d_copies += 1
+                stat.h2d_bytes += nbytes
+            else:
+                stat.d2h_copies += 1
+                stat.d2h_bytes += nbytes
+
+    @property
+    def per_function_stats(self) -> dict[str, CallStats]:
+        with self._lock:
+            return dict(self._per_func_results)
+
+    @property
+    def per_line_stats(self):
+        list_data = []
+        with self._lock:
+            items = list(self._per_line_results.items())
+        for (line_no, filename), val in items:
+            line = linecache.getline(filename, line_no).strip()
+            list_data.append([line_no, line, val.gpu_time, val.cpu_time])
+        return sorted(list_data, key=operator.itemgetter(0))
+
+    def print_per_function_stats(self):
+        table = Table()
+        for col in (
+            "Function",
+            "GPU ncalls",
+            "GPU cumtime",
+            "CPU ncalls",
+            "CPU cumtime",
+            "H2D copies",
+            "H2D bytes",
+            "D2H copies",
+            "D2H bytes",
+        ):
+            table.add_column(col)
+
+        cpu_funcs = []
+        for func_name, stats in sorted(self.per_function_stats.items()):
+            table.add_row(
+                func_name,
+                f"{stats.gpu_calls}",
+                f"{stats.gpu_time:.3f}",
+                f"{stats.cpu_calls}",
+                f"{stats.cpu_time:.3f}",
+                f"{stats.h2d_copies}",
+                f"{stats.h2d_bytes}",
+                f"{stats.d2h_copies}",
+                f"{stats.d2h_bytes}",
+            )
+            if stats.cpu_calls:
+                cpu_funcs.append(func_name)
+
+        time_elapsed = self.end_time - self.start_time
+        table.title = f"""\n\
+        Total time elapsed: {time_elapsed:.3f} seconds
+
+        Stats
+        """
+        console = Console()
+        console.print(table)
+        if cpu_funcs:
+            console.print(
+                _cpu_issue_text.format(
+                    cpu_functions_used=format_cpu_functions_used(cpu_funcs)
+                )
+            )
+
+    def print_per_line_stats(self):
+        table = Table()
+        table.add_column("Line no.")
+        table.add_column("Line")
+        table.add_column("GPU TIME(s)")
+        table.add_column("CPU TIME(s)")
+        for line_no, line, gpu_time, cpu_time in self.per_line_stats:
+            table.add_row(
+                str(line_no),
+                Syntax(str(line), "python"),
+                "" if gpu_time == 0 else "{:.9f}".format(gpu_time),
+                "" if cpu_time == 0 else "{:.9f}".format(cpu_time),
+            )
+        time_elapsed = self.end_time - self.start_time
+        table.title = f"""\n\
+        Total time elapsed: {time_elapsed:.3f} seconds
+
+        Stats
+        """
+        console = Console()
+        console.print(table)
+
+    def dump_stats(self, file_name):
+        with open(file_name, "wb") as f:
+            pickle.dump(self, f)
@@ -0,0 +1,197 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.
+
+from io import BytesIO
+
+import fsspec
+import pyarrow as pa
+import pytest
+
+import cudf
+from cudf.utils import ioutils
+from cudf.utils.iocache import BlockCache, get_block_cache
+
+
+@pytest.fixture
+def memory_file():
+    fs = fsspec.filesystem("memory")
+    path = "/cudf-test-ioutils/data.bin"
+    data = bytes(range(256)) * 100
+    fs.pipe(path, data)
+    yield fs, path, data
+    fs.rm(path)
+
+
+@pytest.mark.parametrize("bytes_per_thread", [100, 4096, 1_000_000])
+def test_fsspec_data_transfer(memory_file, bytes_per_thread):
+    fs, path, data = memory_file
+    ret = ioutils._fsspec_data_transfer(
+        path, fs=fs, bytes_per_thread=bytes_per_thread
+    )
+    assert ret.getbuffer() == data
+    assert ret.tell() == 0
+
+
+def test_fsspec_data_transfer_file_object(memory_file):
+    fs, path, data = memory_file
+    with fs.open(path, mode="rb") as f:
+        ret = ioutils._fsspec_data_transfer(f, bytes_per_thread=100)
+    assert ret.getvalue() == data
+
+
+@pytest.mark.parametrize("blocksize", [1000, 1_000_000])
+def test_get_remote_bytes_all(memory_file, blocksize):
+    fs, path, data = memory_file
+    assert ioutils._get_remote_bytes_all(
+        [path, path], fs, blocksize=blocksize
+    ) == [data, data]
+
+
+def test_read_byte_ranges_short_read(memory_file):
+    fs, path, data = memory_file
+    buf = bytearray(len(data) + 10)
+    with pytest.raises(EOFError):
+        ioutils._read_byte_ranges(
+            path, [(0, len(data)), (len(data), 10)], buf, fs=fs
+        )
+
+
+def test_block_cache_lru(tmp_path):
+    cache = BlockCache(str(tmp_path), max_size=10)
+    cache.put(("a",), b"aaaaaa")
+    cache.put(("b",), b"bbbb")
+    assert cache.get(("a",)) == b"aaaaaa"
+    cache.put(("c",), b"cccc")  # Evicts the least recently used "b"
+    assert cache.nbytes == 10
+    assert cache.get(("b",)) is None
+    assert cache.get(("c",)) == b"cccc"
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # A new cache reuses the cached byte ranges
+    cache = BlockCache(str(tmp_path), max_size=10)
+    assert cache.nbytes == 10
+    assert cache.get(("a",)) == b"aaaaaa"
+
+
+@pytest.mark.parametrize("blocksize", [1000, 1_000_000])
+def test_get_remote_bytes_all_cached(tmp_path, memory_file, blocksize):
+    fs, path, data = memory_file
+    with cudf.option_context("io_cache_directory", str(tmp_path)):
+        cache = get_block_cache()
+        for _ in range(2):
+            assert ioutils._get_remote_bytes_all(
+                [path], fs, blocksize=blocksize
+            ) == [data]
+        nranges = -(-len(data) // blocksize)
+        assert (cache.hits, cache.misses) == (nranges, nranges)
+
+        # Modified files are never served from the cache
+        fs.pipe(path, data[::-1])
+        assert ioutils._get_remote_bytes_all(
+            [path], fs, blocksize=blocksize
+        ) == [data[::-1]]
+        assert (cache.hits, cache.misses) == (nranges, nranges * 2)
+
+
+def test_fsspec_data_transfer_cached(tmp_path, memory_file):
+    fs, path, data = memory_file
+    with cudf.option_context("io_cache_directory", str(tmp_path)):
+        cache = get_block_cache()
+        for _ in range(2):
+            ret = ioutils._fsspec_data_transfer(
+                path, fs=fs, bytes_per_thread=10_000
+            )
+            assert ret.getvalue() == data
+        assert (cache.hits, cache.misses) == (3, 3)
+
+
+def _int_stats(ranges):
+    return [
+        {
+            "a": ioutils._ColumnStatistics(
+                {"minimum": lo, "maximum": hi, "sum": (lo + hi) * 10 // 2},
+                number_of_values=10,
+                has_null=False,
+            )
+        }
+        for lo, hi in ranges
+    ]
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ([("a", "==", 15)], [False, True, False]),
+        ([("a", "!=", 20)], [True, True, False]),
+        ([("a", "<", 10)], [True, False, False]),
+        ([("a", "<=", 10)], [True, True, False]),
+        ([("a", ">", 19)], [False, False, True]),
+        ([("a", ">=", 19)], [False, True, True]),
+        ([("a", "in", {3, 20})], [True, False, True]),
+        ([("a", "in", [-1, 30])], [False, False, False]),
+        ([("a", "not in", {20})], [True, True, False]),
+        ([("a", "not in", set(range(10, 20)))], [True, False, True]),
+        ([("a", "not in", set(range(10, 19)))], [True, True, True]),
+        ([[("a", ">", 5), ("a", "<", 12)]], [True, True, False]),
+        ([[("a", "==", 1)], [("a", "==", 20)]], [True, False, True]),
+    ],
+)
+def test_apply_filters(filters, expected):
+    stats = _int_stats([(0, 9), (10, 19), (20, 20)])
+    filters = ioutils._prepare_filters(filters)
+    mask = ioutils._apply_filters(filters, stats)
+    assert mask.tolist() == expected
+
+
+def test_apply_filters_not_in_inclusive_maximum():
+    # The maximum of a stripe is one of its values
+    stats = _int_stats([(5, 6), (5, 5)])
+    filters = ioutils._prepare_filters([("a", "not in", [5])])
+    assert ioutils._apply_filters(filters, stats).tolist() == [True, False]
+
+
+def test_apply_filters_missing_statistics():
+    stats = [{"a": ioutils._ColumnStatistics()}] * 2
+    filters = ioutils._prepare_filters([("a", "==", "x")])
+    assert ioutils._apply_filters(filters, stats).tolist() == [True, True]
+
+
+def test_apply_filters_bool():
+    stats = [
+        {
+            "b": ioutils._ColumnStatistics(
+                {"true_count": t, "false_count": 10 - t},
+                number_of_values=10,
+                has_null=False,
+            )
+        }
+        for t in (0, 5, 10)
+    ]
+    for op, val, expected in [
+        ("==", True, [False, True, True]),
+        ("==", False, [True, True, False]),
+        ("!=", True, [True, True, False]),
+    ]:
+        filters = ioutils._prepare_filters([("b", op, val)])
+        assert ioutils._apply_filters(filters, stats).tolist() == expected
+
+
+def test_parquet_row_group_statistics():
+    pq = pytest.importorskip("pyarrow.parquet")
+    buf = BytesIO()
+    table = pa.table({"a": list(range(30)), "b": ["x"] * 30})
+    pq.write_table(table, buf, row_group_size=10)
+    buf.seek(0)
+    stats = ioutils._parquet_row_group_statistics(
+        pq.read_metadata(buf), columns=["a"]
+    )
+    assert [list(s) for s in stats] == [["a"]] * 3
+    assert stats[1]["a"] == {"minimum": 10, "maximum": 19}
+    assert stats[1]["a"].number_of_values == 10
+    assert not stats[1]["a"].has_null
+    filters = ioutils._prepare_filters([("a", "in", [5, 25])])
+    assert ioutils._apply_filters(filters, stats).tolist() == [
+        True,
+        False,
+        True,
+    ]
@@ -282,6 +282,21 @@ def test_environment_variables_device_limit(monkeypatch):
         assert manager.statistics.level == 0
 
 
+def test_environment_variables_host_limit(monkeypatch, tmp_path):
+    with _get_manager_in_env(
+        monkeypatch,
+        [
+            ("CUDF_SPILL", "on"),
+            ("CUDF_SPILL_ON_DEMAND", "off"),
+            ("CUDF_SPILL_HOST_LIMIT", "1000"),
+            ("CUDF_SPILL_DISK_DIRECTORY", str(tmp_path)),
+        ],
+    ) as manager:
+        assert isinstance(manager, SpillManager)
+        assert manager._host_memory_limit == 1000
+        assert manager.disk_directory == str(tmp_path)
+
+
 @pytest.mark.parametrize("level", (1, 2))
 def test_environment_variables_spill_stats(monkeypatch, level):
     with _get_manager_in_env(
@@ -342,6 +357,115 @@ def test_spill_to_device_limit(manager: SpillManager):
     assert single_column_df_data(df3).is_spilled
 
 
+def test_spill_lru_index(manager: SpillManager):
+    df1 = single_column_df()
+    df2 = single_column_df()
+    df3 = single_column_df()
+    # Spill locked buffers are skipped and moved to the back
+    with acquire_spill_lock():
+        single_column_df_data(df1).get_ptr(mode="read")
+        manager.spill_device_memory(nbytes=gen_df_data_nbytes * 3)
+        assert not single_column_df_data(df1).is_spilled
+        assert single_column_df_data(df2).is_spilled
+        assert single_column_df_data(df3).is_spilled
+    # The running byte counters match the managed buffers
+    assert manager._nbytes["gpu"] == gen_df_data_nbytes
+    assert manager._nbytes["cpu"] == gen_df_data_nbytes * 2
+    del df2
+    assert manager._nbytes["cpu"] == gen_df_data_nbytes
+    assert manager.spill_to_device_limit(device_limit=0) == gen_df_data_nbytes
+    assert spilled_and_unspilled(manager) == (gen_df_data_nbytes * 2, 0)
+    assert len(manager.buffers()) == 2
+    # Exposed buffers are counted but never spill candidates
+    single_column_df_data(df3).get_ptr(mode="read")
+    single_column_df_data(df1).spill(target="gpu")
+    assert manager._nbytes["gpu"] == gen_df_data_nbytes * 2
+    assert manager.spill_device_memory(nbytes=1) == gen_df_data_nbytes
+    assert single_column_df_data(df1).is_spilled
+    assert not single_column_df_data(df3).is_spilled
+    assert manager.spill_device_memory(nbytes=1) == 0
+
+
+@pytest.mark.parametrize(
+    "manager, victim",
+    [
+        ({"policy": "lru"}, 0),
+        ({"policy": "largest"}, 1),
+        ({"policy": "gds"}, 1),
+        ({"policy": "protect_unspilled"}, 0),
+    ],
+    indirect=["manager"],
+)
+def test_spill_policy(manager: SpillManager, victim):
+    buffers = [
+        as_buffer(data=rmm.DeviceBuffer(size=n), exposed=False)
+        for n in (10, 100, 50)
+    ]
+    assert manager.spill_device_memory(nbytes=1) == buffers[victim].size
+    assert [b.is_spilled for b in buffers] == [i == victim for i in range(3)]
+
+
+@pytest.mark.parametrize(
+    "manager",
+    [{"policy": "protect_unspilled", "statistic_level": 1}],
+    indirect=True,
+)
+def test_spill_policy_protect_unspilled(manager: SpillManager):
+    buffers = [
+        as_buffer(data=rmm.DeviceBuffer(size=10), exposed=False)
+        for _ in range(2)
+    ]
+    buffers[0].spill(target="cpu")
+    buffers[0].spill(target="gpu")
+    with acquire_spill_lock():
+        buffers[1].get_ptr(mode="read")
+    # The least recently accessed buffer was just unspilled
+    manager.spill_device_memory(nbytes=1)
+    assert not buffers[0].is_spilled
+    assert buffers[1].is_spilled
+    assert manager.statistics.thrash_count == 1
+    assert "Thrashing (level >= 1): 1 buffers" in str(manager.statistics)
+
+
+@pytest.mark.parametrize(
+    "manager",
+    [
+        {
+            "device_high_watermark": gen_df_data_nbytes,
+            "device_low_watermark": 0,
+            "statistic_level": 1,
+        }
+    ],
+    indirect=True,
+)
+def test_background_spilling(manager: SpillManager):
+    df1 = single_column_df()
+    df2 = single_column_df()  # Crosses the high watermark
+    deadline = time.monotonic() + 10
+    while spilled_and_unspilled(manager)[1] > 0:
+        assert time.monotonic() < deadline, "background spilling timed out"
+        time.sleep(0.01)
+    assert spilled_and_unspilled(manager) == (gen_df_data_nbytes * 2, 0)
+    assert single_column_df_data(df1).is_spilled
+    assert single_column_df_data(df2).is_spilled
+    runs, nbytes, _ = manager.statistics.background_totals
+    assert runs >= 1
+    assert nbytes >= gen_df_data_nbytes * 2
+    assert "Background spilling (level >= 1): None" not in str(
+        manager.statistics
+    )
+
+
+def test_background_spilling_watermarks():
+    with pytest.raises(ValueError, match="low watermark cannot exceed"):
+        SpillManager(device_high_watermark=10, device_low_watermark=20)
+
+
+def test_spill_policy_unknown():
+    with pytest.raises(ValueError, match="Unknown spill policy"):
+        SpillManager(policy="unknown")
+
+
 @pytest.mark.parametrize(
     "manager", [{"device_memory_limit": 0}], indirect=True
 )
@@ -618,6 +742,64 @@ def test_as_buffer_of_spillable_buffer(manager: SpillManager):
     assert all(cupy.array(b5.memoryview()) == data[1:-1])
 
 
+@pytest.mark.parametrize(
+    "manager", [{"statistic_level": 0}, {"statistic_level": 1}], indirect=True
+)
+def test_spill_host_to_disk(manager: SpillManager, tmp_path):
+    # The host <-> disk tier doesn't require device memory
+    manager.disk_directory = str(tmp_path)
+    data = np.arange(100, dtype="u1")
+    buf = as_buffer(data=data, exposed=False)
+    assert buf.owner.memory_location == "cpu"
+
+    buf.spill(target="disk")
+    assert buf.owner.memory_location == "disk"
+    assert buf.is_spilled
+    # The spill file is unlinked and only kept alive by the memory map
+    assert list(tmp_path.iterdir()) == []
+    assert buf.memoryview() == memoryview(data)
+    assert buf[10:20].memoryview() == memoryview(data[10:20])
+    assert buf.owner.memory_location == "disk"
+
+    buf.spill(target="cpu")
+    assert buf.owner.memory_location == "cpu"
+    assert buf.memoryview() == memoryview(data)
+
+    if manager.statistics.level == 0:
+        assert manager.statistics.disk_files == 0
+        return
+    assert manager.statistics.disk_files == 1
+    assert manager.statistics.disk_totals() == (buf.size, buf.size)
+    assert "1 files" in str(manager.statistics)
+
+
+def test_spill_gpu_to_disk(manager: SpillManager):
+    df = single_column_df()
+    expected = df.to_pandas()
+    single_column_df_data(df).spill(target="disk")
+    assert single_column_df_base_data(df).owner.memory_location == "disk"
+    assert_eq(df, expected)
+    assert not single_column_df_data(df).is_spilled
+
+
+@pytest.mark.parametrize(
+    "manager", [{"host_memory_limit": 100}], indirect=True
+)
+def test_spill_to_host_limit(manager: SpillManager):
+    buffers = [
+        as_buffer(data=np.full(60, i, dtype="u1"), exposed=False)
+        for i in range(3)
+    ]
+    # Adding host buffers enforces the limit by spilling the least
+    # recently accessed buffers to disk
+    locations = [b.owner.memory_location for b in buffers]
+    assert locations == ["disk", "disk", "cpu"]
+    assert manager.spill_to_host_limit(0) == 60
+    for i, b in enumerate(buffers):
+        assert b.owner.memory_location == "disk"
+        assert b.memoryview() == memoryview(np.full(60, i, dtype="u1"))
+
+
 @pytest.mark.parametrize("dtype", ["uint8", "uint64"])
 def test_memoryview_slice(manager: SpillManager, dtype):
     """Check .memoryview() of a sliced spillable buffer"""
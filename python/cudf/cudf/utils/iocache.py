@@ -0,0 +1,267 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.
+"""Local on-disk cache of byte ranges of remote files."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from cudf.options import get_option
+
+
+class BlockCache:
+    """Size-bounded on-disk cache of byte ranges of remote files
+
+    Each cached byte range is stored in a file in `directory`, named by
+    a hash of its key. Keys include the version of the remote file (its
+    etag, size, and modification time), thus modified files are never
+    served from the cache. When the total size exceeds `max_size`, the
+    least recently used byte ranges are evicted. Byte ranges already in
+    `directory` are reused, in the order of their modification time.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the cached byte ranges. Created if it doesn't exist.
+    max_size : int
+        Maximum total size in bytes of the cached byte ranges.
+    """
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # File names of the cached byte ranges and their sizes
+        # in least recently used order
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._nbytes = 0
+        os.makedirs(directory, exist_ok=True)
+        existing = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                existing.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(existing):
+            self._entries[name] = size
+            self._nbytes += size
+        with self._lock:
+            self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        """Total size in bytes of the cached byte ranges"""
+        return self._nbytes
+
+    @staticmethod
+    def _name(key: tuple) -> str:
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def get(self, key: tuple) -> bytes | None:
+        """Get a cached byte range
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the byte range, see `range_key`.
+
+        Returns
+        -------
+        bytes or None
+            The cached bytes or None if `key` isn't cached.
+        """
+        name = self._name(key)
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            if name not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Persist the recency for caches reusing the directory
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another process or thread
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+                self._discard(name)
+            return None
+        return data
+
+    def put(self, key: tuple, data: Any) -> None:
+        """Cache a byte range
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the byte range, see `range_key`.
+        data : bytes-like
+            The bytes of the byte range.
+        """
+        nbytes = memoryview(data).nbytes
+        if nbytes > self.max_size:
+            return
+        name = self._name(key)
+        # Write to a temporary file first, such that concurrent readers
+        # never see a partially written byte range
+        fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=self.directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, os.path.join(self.directory, name))
+        with self._lock:
+            self._discard(name)
+            self._entries[name] = nbytes
+            self._nbytes += nbytes
+            self._evict()
+
+    def _discard(self, name: str) -> None:
+        # Forget a byte range, must be called with the lock held
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._nbytes -= size
+
+    def _evict(self) -> None:
+        # Evict the least recently used byte ranges until the cache
+        # fits `max_size`, must be called with the lock held
+        while self._nbytes > self.max_size:
+            name, size = self._entries.popitem(last=False)
+            self._nbytes -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def __repr__(self) -> str:
+        return (
+            f"<BlockCache directory={self.directory!r} "
+            f"nbytes={self._nbytes} max_size={self.max_size} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+
+def file_version(fs, path: str) -> tuple:
+    """Get the version of a remote file
+
+    Parameters
+    ----------
+    fs : fsspec.AbstractFileSystem
+        The filesystem of the file.
+    path : str
+        The path of the file.
+
+    Returns
+    -------
+    tuple
+        The etag, size, and modification time of the file (or None
+        for the attributes the filesystem doesn't provide).
+    """
+    info = fs.info(path)
+    etag = next(
+        (info[k] for k in ("ETag", "etag") if info.get(k) is not None), None
+    )
+    mtime = next(
+        (
+            str(info[k])
+            for k in ("LastModified", "mtime", "updated", "created")
+            if info.get(k) is not None
+        ),
+        None,
+    )
+    return (etag, info.get("size"), mtime)
+
+
+def range_key(fs, path: str, version: tuple, start: int, end: int) -> tuple:
+    """Get the cache key of a byte range of a remote file"""
+    return (fs.protocol, path, version, start, end)
+
+
+@functools.cache
+def _get_block_cache(directory: str, max_size: int) -> BlockCache:
+    return BlockCache(directory, max_size)
+
+
+def get_block_cache() -> BlockCache | None:
+    """Get the block cache of remote reads or None if caching is disabled
+
+    The cache is configured by the "io_cache_directory" and
+    "io_cache_size" options.
+    """
+    directory = get_option("io_cache_directory")
+    if directory is None:
+        return None
+    return _get_block_cache(directory, get_option("io_cache_size"))
+
+
+class CachedFileSystem:
+    """Proxy of a fsspec filesystem serving `cat_ranges` from a block cache
+
+    All other attributes are forwarded to the filesystem.
+
+    Parameters
+    ----------
+    fs : fsspec.AbstractFileSystem
+        The filesystem to proxy.
+    cache : BlockCache
+        The block cache.
+    """
+
+    def __init__(self, fs, cache: BlockCache) -> None:
+        self.fs = fs
+        self.cache = cache
+        self._versions: dict[str, tuple] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fs, name)
+
+    def version(self, path: str) -> tuple:
+        """Get the (memoized) version of a file, see `file_version`"""
+        if path not in self._versions:
+            self._versions[path] = file_version(self.fs, path)
+        return self._versions[path]
+
+    def cat_ranges(self, paths, starts, ends, **kwargs) -> list:
+        """Read byte ranges, see `fsspec.AbstractFileSystem.cat_ranges`
+
+        Byte ranges are read from the cache if possible. The other
+        byte ranges are read from the filesystem and cached.
+        """
+        if not isinstance(starts, list):
+            starts = [starts] * len(paths)
+        if not isinstance(ends, list):
+            ends = [ends] * len(paths)
+
+        keys = []
+        for path, start, end in zip(paths, starts, ends, strict=True):
+            version = self.version(path)
+            size = version[1]
+            start = 0 if start is None else start
+            end = size if end is None else end
+            if size is not None:
+                start = start + size if start < 0 else start
+                end = end + size if end < 0 else min(end, size)
+            keys.append(range_key(self.fs, path, version, start, end))
+
+        ret: list = [self.cache.get(key) for key in keys]
+        missing = [i for i, data in enumerate(ret) if data is None]
+        if missing:
+            fetched = self.fs.cat_ranges(
+                [paths[i] for i in missing],
+                [starts[i] for i in missing],
+                [ends[i] for i in missing],
+                **kwargs,
+            )
+            for i, data in zip(missing, fetched, strict=True):
+                ret[i] = data
+                if isinstance(data, bytes):
+                    self.cache.put(keys[i], data)
+        return ret
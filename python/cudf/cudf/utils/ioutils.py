@@ -8,8 +8,8 @@ import operator
 import os
 import urllib
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import BufferedWriter, BytesIO, IOBase, TextIOWrapper
-from threading import Thread
 from typing import TYPE_CHECKING, Any
 
 import fsspec
@@ -24,6 +24,12 @@ from cudf.api.types import is_list_like
 from cudf.core._compat import PANDAS_LT_300
 from cudf.utils.docutils import docfmt_partial
 from cudf.utils.dtypes import cudf_dtype_to_pa_type, np_dtypes_to_pandas_dtypes
+from cudf.utils.iocache import (
+    CachedFileSystem,
+    file_version,
+    get_block_cache,
+    range_key,
+)
 
 try:
     import fsspec.parquet as fsspec_parquet
@@ -44,6 +50,9 @@ PARQUET_META_TYPE_MAP = {
 
 _BYTES_PER_THREAD_DEFAULT = 256 * 1024 * 1024
 
+# Maximum number of threads of the shared pool reading remote byte ranges
+_IO_MAX_WORKERS = 32
+
 _docstring_remote_sources = """
 - cuDF supports local and remote data stores. See configuration details for
   available sources
@@ -1930,12 +1939,10 @@ def get_reader_filepath_or_buffer(
                 if isinstance(source, TextIOWrapper):
                     source = source.buffer
                 filepaths_or_buffers.append(
-                    BytesIO(
-                        _fsspec_data_transfer(
-                            source,
-                            mode=mode,
-                            bytes_per_thread=bytes_per_thread,
-                        )
+                    _fsspec_data_transfer(
+                        source,
+                        mode=mode,
+                        bytes_per_thread=bytes_per_thread,
                     )
                 )
             else:
@@ -2052,110 +2059,320 @@ def buffer_write_lines(buf, lines):
     buf.write("\n".join(lines))
 
 
-def _apply_filter_bool_eq(val, col_stats):
-    if "true_count" in col_stats and "false_count" in col_stats:
-        if val is True:
-            if (col_stats["true_count"] == 0) or (
-                col_stats["false_count"] == col_stats["number_of_values"]
-            ):
-                return False
-        elif val is False:
-            if (col_stats["false_count"] == 0) or (
-                col_stats["true_count"] == col_stats.number_of_values
-            ):
-                return False
-    return True
+class _ColumnStatistics(dict):
+    """Dict-like statistics of a column in a stripe or row group
+
+    Mirrors ``OrcColumnStatistics``, the statistics are the "minimum",
+    "maximum", "sum", "true_count" and "false_count" items.
+    """
+
+    def __init__(self, stats=(), *, number_of_values=None, has_null=None):
+        super().__init__(stats)
+        self.number_of_values = number_of_values
+        self.has_null = has_null
+
+
+def _parquet_row_group_statistics(metadata, columns=None):
+    """Get the statistics of the row groups of a parquet file
+
+    Parameters
+    ----------
+    metadata : pyarrow.parquet.FileMetaData
+        The metadata of the parquet file.
+    columns : list of str, optional
+        The columns to get the statistics of, all columns by default.
+
+    Returns
+    -------
+    list[dict[str, _ColumnStatistics]]
+        The statistics of each row group, in the format of
+        `_apply_filters`.
+    """
+    ret = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        row_group_stats = {}
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            name = chunk.path_in_schema
+            if columns is not None and name not in columns:
+                continue
+            stats = chunk.statistics
+            if stats is None:
+                row_group_stats[name] = _ColumnStatistics(has_null=True)
+                continue
+            values = {}
+            if stats.has_min_max:
+                values = {"minimum": stats.min, "maximum": stats.max}
+            row_group_stats[name] = _ColumnStatistics(
+                values,
+                number_of_values=stats.num_values,
+                has_null=not stats.has_null_count or stats.null_count > 0,
+            )
+        ret.append(row_group_stats)
+    return ret
+
+
+def _statistic_array(stats, name):
+    # Gather a statistic of all stripes or row groups into an array and
+    # a mask of the stripes or row groups that have the statistic.
+    # Types without a NumPy equivalent, e.g. datetimes, and mixed types
+    # are gathered into an object array.
+    values = [s.get(name) for s in stats]
+    present = np.array([v is not None for v in values], dtype=bool)
+    fill = next((v for v in values if v is not None), 0)
+    values = [fill if v is None else v for v in values]
+    try:
+        ret = np.array(values)
+    except (OverflowError, ValueError):
+        ret = None
+    if ret is None or ret.dtype.kind not in "biufU":
+        ret = np.empty(len(values), dtype=object)
+        ret[:] = values
+    return ret, present
+
+
+class _StatisticsArrays:
+    """Statistics of a column in all stripes or row groups as arrays
+
+    Parameters
+    ----------
+    stats : list
+        The dict-like statistics of the column in each stripe or row
+        group, e.g. ``OrcColumnStatistics``.
+    """
 
+    def __init__(self, stats):
+        self.stats = stats
+        self.minimum, self.has_minimum = _statistic_array(stats, "minimum")
+        self.maximum, self.has_maximum = _statistic_array(stats, "maximum")
+        self.sum, self.has_sum = _statistic_array(stats, "sum")
+        self.has_null = np.array([bool(s.has_null) for s in stats], dtype=bool)
+        self.has_counts = np.array(
+            ["true_count" in s and "false_count" in s for s in stats],
+            dtype=bool,
+        )
+        self.true_count = np.array(
+            [s.get("true_count") or 0 for s in stats], dtype=np.int64
+        )
+        self.false_count = np.array(
+            [s.get("false_count") or 0 for s in stats], dtype=np.int64
+        )
+        self.number_of_values = np.array(
+            [
+                -1 if s.number_of_values is None else s.number_of_values
+                for s in stats
+            ],
+            dtype=np.int64,
+        )
 
-def _apply_filter_not_eq(val, col_stats):
-    return ("minimum" in col_stats and val < col_stats["minimum"]) or (
-        "maximum" in col_stats and val > col_stats["maximum"]
+    @property
+    def is_numeric(self):
+        return self.minimum.dtype.kind in "biuf"
+
+    def compare(self, name, op, val):
+        """Compare a statistic with `val`, False where it is missing"""
+        present = getattr(self, f"has_{name}")
+        if not present.any():
+            return present.copy()
+        return present & np.asarray(op(getattr(self, name), val))
+
+
+def _prune_bool_eq(val, col):
+    # Stripes or row groups without a row equal to the boolean `val`
+    if val is True:
+        return col.has_counts & (
+            (col.true_count == 0) | (col.false_count == col.number_of_values)
+        )
+    elif val is False:
+        return col.has_counts & (
+            (col.false_count == 0) | (col.true_count == col.number_of_values)
+        )
+    return np.zeros(len(col.stats), dtype=bool)
+
+
+def _prune_not_eq(val, col):
+    # Stripes or row groups without a row equal to `val`
+    return col.compare("minimum", operator.gt, val) | col.compare(
+        "maximum", operator.lt, val
     )
 
 
-def _apply_predicate(op, val, col_stats):
+def _prune_in(val, col):
+    # Stripes or row groups without a row equal to any element of `val`
+    values = np.asarray(list(val))
+    kinds = {values.dtype.kind, col.minimum.dtype.kind}
+    if kinds <= set("iuf") and not np.isnan(values).any() or kinds == {"U"}:
+        # A stripe or row group is pruned if no element is between its
+        # minimum and maximum
+        values = np.unique(values)
+        lo = np.where(
+            col.has_minimum, np.searchsorted(values, col.minimum, "left"), 0
+        )
+        hi = np.where(
+            col.has_maximum,
+            np.searchsorted(values, col.maximum, "right"),
+            len(values),
+        )
+        return hi <= lo
+    prune = col.compare("maximum", operator.lt, min(val)) | col.compare(
+        "minimum", operator.gt, max(val)
+    )
+    return prune | np.logical_and.reduce(
+        [_prune_not_eq(elem, col) for elem in val]
+    )
+
+
+def _range_covered(val, col_min, col_max):
+    # Whether all values in [col_min, col_max] are elements of `val`
+    if isinstance(col_min, int):
+        col_range = range(col_min, col_max + 1)
+    elif isinstance(col_min, datetime.datetime):
+        col_range = pd.date_range(col_min, col_max, inclusive="both")
+    else:
+        return False
+    return len(col_range) > 0 and all(elem in val for elem in col_range)
+
+
+def _prune_not_in(val, col):
+    # Stripes or row groups with all rows equal to an element of `val`
+    mn, mx = col.minimum, col.maximum
+    has_range = col.has_minimum & col.has_maximum
+    prune = has_range & np.asarray(mn == mx)
+    prune &= np.logical_or.reduce(
+        [col.compare("minimum", operator.eq, elem) for elem in val]
+        + [np.zeros(len(col.stats), dtype=bool)]
+    )
+    if mn.dtype.kind in "iu":
+        # The stripes or row groups whose integer range [minimum, maximum]
+        # is made up of elements of `val`
+        info = np.iinfo(mn.dtype)
+        ints = np.array(
+            sorted(
+                {
+                    int(elem)
+                    for elem in val
+                    if isinstance(elem, (int, float, np.integer, np.floating))
+                    and float(elem).is_integer()
+                    and info.min <= elem <= info.max
+                }
+            ),
+            dtype=mn.dtype,
+        )
+        ncovered = np.searchsorted(ints, mx, "right") - np.searchsorted(
+            ints, mn, "left"
+        )
+        ncovered = ncovered.astype(mn.dtype)
+        # Compare maximum - minimum (rather than maximum - minimum + 1)
+        # with the number of covered elements to avoid overflow
+        prune |= (
+            has_range & (mx > mn) & (ncovered > 0) & (mx - mn == ncovered - 1)
+        )
+    elif mn.dtype == object:
+        for i in np.flatnonzero(has_range & ~prune):
+            prune[i] = _range_covered(val, mn[i], mx[i])
+    return prune
+
+
+def _prune_predicate(op, val, col):
+    """Evaluate a predicate on the statistics of a column
+
+    Parameters
+    ----------
+    op : str
+        The operator of the predicate.
+    val : object
+        The value of the predicate.
+    col : _StatisticsArrays
+        The statistics of the column in all stripes or row groups.
+
+    Returns
+    -------
+    numpy.ndarray[bool]
+        Mask of the stripes or row groups without rows satisfying the
+        predicate.
+    """
     # Sanitize operator
     if op not in {"=", "==", "!=", "<", "<=", ">", ">=", "in", "not in"}:
         raise ValueError(f"'{op}' is not a valid operator in predicates.")
 
-    col_min = col_stats.get("minimum", None)
-    col_max = col_stats.get("maximum", None)
-    col_sum = col_stats.get("sum", None)
-
     # Apply operator
     if op == "=" or op == "==":
-        if _apply_filter_not_eq(val, col_stats):
-            return False
+        prune = _prune_not_eq(val, col) | _prune_bool_eq(val, col)
         # TODO: Replace pd.isnull with
         # cudf.isnull once it is implemented
-        if pd.isnull(val) and not col_stats.has_null:
-            return False
-        if not _apply_filter_bool_eq(val, col_stats):
-            return False
+        if pd.isnull(val):
+            prune |= ~col.has_null
     elif op == "!=":
-        if (
-            col_min is not None
-            and col_max is not None
-            and val == col_min
-            and val == col_max
-        ):
-            return False
-        if _apply_filter_bool_eq(val, col_stats):
-            return False
-    elif col_min is not None and (
-        (op == "<" and val <= col_min) or (op == "<=" and val < col_min)
-    ):
-        return False
-    elif col_max is not None and (
-        (op == ">" and val >= col_max) or (op == ">=" and val > col_max)
-    ):
-        return False
-    elif (
-        col_sum is not None
-        and op == ">"
-        and (
-            (col_min is not None and col_min >= 0 and col_sum <= val)
-            or (col_max is not None and col_max <= 0 and col_sum >= val)
-        )
-    ):
-        return False
-    elif (
-        col_sum is not None
-        and op == ">="
-        and (
-            (col_min is not None and col_min >= 0 and col_sum < val)
-            or (col_max is not None and col_max <= 0 and col_sum > val)
+        # Pruned if all rows are equal to `val`
+        prune = col.compare("minimum", operator.eq, val) & col.compare(
+            "maximum", operator.eq, val
         )
-    ):
-        return False
+        if isinstance(val, bool):
+            prune |= _prune_bool_eq(not val, col)
+    elif op == "<":
+        prune = col.compare("minimum", operator.ge, val)
+    elif op == "<=":
+        prune = col.compare("minimum", operator.gt, val)
+    elif op == ">" or op == ">=":
+        if op == ">":
+            prune = col.compare("maximum", operator.le, val)
+        else:
+            prune = col.compare("maximum", operator.lt, val)
+        if col.is_numeric:
+            # The sum of non-negative values bounds the maximum from
+            # above and the sum of non-positive values bounds the
+            # minimum from below
+            if op == ">":
+                below = col.compare("sum", operator.le, val)
+                above = col.compare("sum", operator.ge, val)
+            else:
+                below = col.compare("sum", operator.lt, val)
+                above = col.compare("sum", operator.gt, val)
+            prune |= (col.compare("minimum", operator.ge, 0) & below) | (
+                col.compare("maximum", operator.le, 0) & above
+            )
     elif op == "in":
-        if (col_max is not None and col_max < min(val)) or (
-            col_min is not None and col_min > max(val)
-        ):
-            return False
-        if all(_apply_filter_not_eq(elem, col_stats) for elem in val):
-            return False
-    elif op == "not in" and col_min is not None and col_max is not None:
-        if any(elem == col_min == col_max for elem in val):
-            return False
-        col_range = None
-        if isinstance(col_min, int):
-            col_range = range(col_min, col_max)
-        elif isinstance(col_min, datetime.datetime):
-            col_range = pd.date_range(col_min, col_max)
-        if col_range and all(elem in val for elem in col_range):
-            return False
-    return True
+        prune = _prune_in(val, col)
+    else:
+        prune = _prune_not_in(val, col)
+    return prune
 
 
 def _apply_filters(filters, stats):
+    """Evaluate filters on the statistics of stripes or row groups
+
+    The filters are evaluated on all stripes or row groups at once,
+    using NumPy arrays of the statistics of each column.
+
+    Parameters
+    ----------
+    filters : list[list[tuple]]
+        The filters in disjunctive normal form, see `_prepare_filters`.
+    stats : list[dict]
+        The statistics of each stripe or row group, mapping the column
+        names to dict-like column statistics, e.g.
+        ``OrcColumnStatistics`` or the statistics from
+        `_parquet_row_group_statistics`.
+
+    Returns
+    -------
+    numpy.ndarray[bool]
+        Mask of the stripes or row groups that may have rows satisfying
+        the filters.
+    """
+    columns = {}
+    ret = np.zeros(len(stats), dtype=bool)
     for conjunction in filters:
-        if all(
-            _apply_predicate(op, val, stats[col])
-            for col, op, val in conjunction
-        ):
-            return True
-    return False
+        mask = np.ones(len(stats), dtype=bool)
+        for col, op, val in conjunction:
+            if not mask.any():
+                break
+            if col not in columns:
+                columns[col] = _StatisticsArrays([s[col] for s in stats])
+            mask &= ~_prune_predicate(op, val, columns[col])
+        ret |= mask
+    return ret
 
 
 def _prepare_filters(filters):
@@ -2187,7 +2404,7 @@ def _fsspec_data_transfer(
     bytes_per_thread=_BYTES_PER_THREAD_DEFAULT,
     max_gap=64_000,
     mode="rb",
-):
+) -> BytesIO:
     if bytes_per_thread is None:
         bytes_per_thread = _BYTES_PER_THREAD_DEFAULT
 
@@ -2205,31 +2422,63 @@ def _fsspec_data_transfer(
         except AttributeError:
             # If we cannot find the size of path_or_fob
             # just read it.
-            return path_or_fob.read()
+            return BytesIO(path_or_fob.read())
+        if isinstance(path_or_fob, fsspec.spec.AbstractBufferedFile):
+            # Read in parallel through new handles of the same file,
+            # an open file object cannot be shared between threads
+            path_or_fob, fs = path_or_fob.path, path_or_fob.fs
     file_size = file_size or fs.size(path_or_fob)
 
-    # Check if a direct read makes the most sense
-    if bytes_per_thread >= file_size:
-        if file_like:
-            return path_or_fob.read()
-        else:
-            return fs.open(path_or_fob, mode=mode, cache_type="all").read()
-
-    # Threaded read into "local" buffer
-    buf = np.zeros(file_size, dtype="b")
-
+    # Read directly into the buffer of the returned BytesIO, which
+    # libcudf reads without a copy. Each thread reads at most
+    # `bytes_per_thread` bytes (a single range is read directly).
+    ret = _preallocated_bytesio(file_size)
     byte_ranges = [
         (b, min(bytes_per_thread, file_size - b))
         for b in range(0, file_size, bytes_per_thread)
     ]
-    _read_byte_ranges(
-        path_or_fob,
-        byte_ranges,
-        buf,
-        fs=fs,
-    )
+    cache = None
+    if fs is not None and not _is_local_filesystem(fs):
+        cache = get_block_cache()
+    with ret.getbuffer() as local_buffer:
+        if cache is not None:
+            # Fill the byte ranges found in the block cache
+            key = functools.partial(
+                range_key, fs, path_or_fob, file_version(fs, path_or_fob)
+            )
+            missing = []
+            for offset, nbytes in byte_ranges:
+                data = cache.get(key(offset, offset + nbytes))
+                if data is None:
+                    missing.append((offset, nbytes))
+                else:
+                    local_buffer[offset : offset + nbytes] = data
+            byte_ranges = missing
+        _read_byte_ranges(
+            path_or_fob,
+            byte_ranges,
+            local_buffer,
+            fs=fs,
+        )
+        if cache is not None:
+            for offset, nbytes in byte_ranges:
+                cache.put(
+                    key(offset, offset + nbytes),
+                    local_buffer[offset : offset + nbytes],
+                )
+    return ret
+
 
-    return buf.tobytes()
+def _preallocated_bytesio(nbytes: int) -> BytesIO:
+    # Create a BytesIO of `nbytes` zero bytes. The BytesIO owns its
+    # buffer, thus `getbuffer()` returns a writable view without
+    # copying (unlike a BytesIO initialized with a bytes object).
+    ret = BytesIO()
+    if nbytes > 0:
+        ret.seek(nbytes - 1)
+        ret.write(b"\0")
+        ret.seek(0)
+    return ret
 
 
 def _merge_ranges(byte_ranges, max_block=256_000_000, max_gap=64_000):
@@ -2253,22 +2502,39 @@ def _merge_ranges(byte_ranges, max_block=256_000_000, max_gap=64_000):
     return new_ranges
 
 
+@functools.cache
+def _io_executor() -> ThreadPoolExecutor:
+    # Thread pool shared by all remote reads
+    return ThreadPoolExecutor(
+        max_workers=_IO_MAX_WORKERS, thread_name_prefix="cudf-io"
+    )
+
+
+def _readinto(fob, view: memoryview) -> None:
+    # Fill `view` from the current position of `fob`
+    if not hasattr(fob, "readinto"):
+        view[:] = fob.read(len(view))
+        return
+    pos = 0
+    while pos < len(view):
+        nbytes = fob.readinto(view[pos:])
+        if not nbytes:
+            raise EOFError(
+                f"Expected {len(view)} bytes but could only read {pos} bytes"
+            )
+        pos += nbytes
+
+
 def _assign_block(fs, path_or_fob, local_buffer, offset, nbytes):
     if fs is None:
         # We have an open fsspec file object
         path_or_fob.seek(offset)
-        local_buffer[offset : offset + nbytes] = np.frombuffer(
-            path_or_fob.read(nbytes),
-            dtype="b",
-        )
+        _readinto(path_or_fob, local_buffer[offset : offset + nbytes])
     else:
         # We have an fsspec filesystem and a path
         with fs.open(path_or_fob, mode="rb", cache_type="none") as fob:
             fob.seek(offset)
-            local_buffer[offset : offset + nbytes] = np.frombuffer(
-                fob.read(nbytes),
-                dtype="b",
-            )
+            _readinto(fob, local_buffer[offset : offset + nbytes])
 
 
 def _read_byte_ranges(
@@ -2277,28 +2543,30 @@ def _read_byte_ranges(
     local_buffer,
     fs=None,
 ):
-    # Simple utility to copy remote byte ranges
+    # Simple utility to read remote byte ranges directly
     # into a local buffer for IO in libcudf
-    workers = []
-    for offset, nbytes in ranges:
-        if len(ranges) > 1:
-            workers.append(
-                Thread(
-                    target=_assign_block,
-                    args=(fs, path_or_fob, local_buffer, offset, nbytes),
-                )
-            )
-            workers[-1].start()
-        else:
+    local_buffer = memoryview(local_buffer).cast("B")
+    if fs is None or len(ranges) <= 1:
+        # An open file object cannot be shared between threads
+        for offset, nbytes in ranges:
             _assign_block(fs, path_or_fob, local_buffer, offset, nbytes)
+        return
 
-    for worker in workers:
-        worker.join()
+    futures = [
+        _io_executor().submit(
+            _assign_block, fs, path_or_fob, local_buffer, offset, nbytes
+        )
+        for offset, nbytes in ranges
+    ]
+    for future in futures:
+        future.result()
 
 
 def _get_remote_bytes_all(
     remote_paths, fs, *, blocksize=_BYTES_PER_THREAD_DEFAULT
 ):
+    if (cache := get_block_cache()) is not None:
+        fs = CachedFileSystem(fs, cache)
     # TODO: Experiment with a heuristic to avoid the fs.sizes
     # call when we are reading many files at once (the latency
     # of collecting the file sizes is unnecessary in this case)
@@ -2326,7 +2594,7 @@ def _get_remote_bytes_all(
         unique_count = dict(zip(*np.unique(paths, return_counts=True)))
         offset = np.cumsum([0] + [unique_count[p] for p in remote_paths])
         buffers = [
-            functools.reduce(operator.add, chunks[offset[i] : offset[i + 1]])
+            b"".join(chunks[offset[i] : offset[i + 1]])
             for i in range(len(remote_paths))
         ]
         return buffers
@@ -2343,6 +2611,8 @@ def _get_remote_bytes_parquet(
     if fsspec_parquet is None or (columns is None and row_groups is None):
         return _get_remote_bytes_all(remote_paths, fs, blocksize=blocksize)
 
+    if (cache := get_block_cache()) is not None:
+        fs = CachedFileSystem(fs, cache)
     sizes = fs.sizes(remote_paths)
     data = fsspec_parquet._get_parquet_byte_ranges(
         remote_paths,
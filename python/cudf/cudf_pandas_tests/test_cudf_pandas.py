@@ -13,6 +13,7 @@ import pathlib
 import pickle
 import pstats
 import subprocess
+import sys
 import tempfile
 import time
 import types
@@ -44,6 +45,7 @@ from cudf.pandas.fast_slow_proxy import (
     NotImplementedFallbackError,
     OOMFallbackError,
     TypeFallbackError,
+    _fast_path_failures,
     _Unusable,
     as_proxy_object,
     is_proxy_object,
@@ -1814,6 +1816,8 @@ def test_fallback_raises_specific_error(
 
     # Must explicitly undo the patch. Proxy dispatch doesn't work with monkeypatch contexts.
     monkeypatch.setattr(xpd.Series.mean, "_fsproxy_fast", cudf.Series.mean)
+    # Forget the forced failure, so later calls use the GPU
+    _fast_path_failures.clear()
 
 
 @pytest.mark.parametrize(
@@ -2096,3 +2100,20 @@ def test_pandas_objects_not_callable():
     assert isinstance(xpd.DataFrame, Callable)
     assert isinstance(xpd.Index, Callable)
     assert isinstance(xpd.RangeIndex, Callable)
+
+
+def test_module_getattr_denylist_cache():
+    from cudf.pandas.module_accelerator import (
+        ModuleAccelerator,
+        disable_module_accelerator,
+    )
+
+    (loader,) = (p for p in sys.meta_path if isinstance(p, ModuleAccelerator))
+    assert is_proxy_object(xpd.DataFrame)
+    # The decision for this file is memoized...
+    assert loader._denylist_cache[__file__] is False
+    # ...but doesn't override disabling the accelerator
+    with disable_module_accelerator():
+        assert loader._disable_total > 0
+        assert xpd.DataFrame is pd.DataFrame
+    assert is_proxy_object(xpd.DataFrame)
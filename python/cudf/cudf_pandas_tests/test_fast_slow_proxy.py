@@ -11,7 +11,9 @@ import numpy as np
 import pytest
 
 from cudf.pandas.fast_slow_proxy import (
+    _dual_residency,
     _fast_arg,
+    _fast_path_failures,
     _FunctionProxy,
     _slow_arg,
     _transform_arg,
@@ -206,6 +208,177 @@ def test_fallback_with_stringio():
     assert pxy(StringIO("hello")) == "hello"
 
 
+@pytest.mark.parametrize("enabled", [True, False])
+def test_fallback_cache(monkeypatch, enabled):
+    monkeypatch.setenv("CUDF_PANDAS_FALLBACK_CACHE", str(int(enabled)))
+    _fast_path_failures.clear()
+    fast_calls = []
+
+    def slow(x):
+        return x
+
+    def fast(x):
+        fast_calls.append(x)
+        raise NotImplementedError()
+
+    pxy = _FunctionProxy(fast=fast, slow=slow)
+    assert [pxy(1), pxy(1), pxy(2)] == [1, 1, 2]
+    if enabled:
+        # The second call skips the known failure of the fast path
+        assert fast_calls == [1, 2]
+        assert (_fast_path_failures.hits, _fast_path_failures.records) == (
+            1,
+            2,
+        )
+    else:
+        assert fast_calls == [1, 1, 2]
+        assert _fast_path_failures.records == 0
+
+
+def test_fallback_cache_nondeterministic_error():
+    _fast_path_failures.clear()
+    fast_calls = []
+
+    def slow(x):
+        return x
+
+    def fast(x):
+        fast_calls.append(x)
+        raise ValueError()
+
+    pxy = _FunctionProxy(fast=fast, slow=slow)
+    assert [pxy(1), pxy(1)] == [1, 1]
+    assert fast_calls == [1, 1]
+
+
+def test_fallback_cache_data_dependent_failure():
+    _fast_path_failures.clear()
+    fast_calls = []
+
+    def check(x):
+        if len({type(v) for v in x}) > 1:
+            raise TypeError("mixed types")
+
+    class Fast:
+        def __init__(self, x):
+            check(x)
+            self.x = x
+
+    class Slow:
+        def __init__(self, x):
+            self.x = x
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=lambda fast: Slow(fast.x),
+        slow_to_fast=lambda slow: Fast(slow.x),
+    )
+    # A failed construction from mixed types does not
+    # make later constructions fall back
+    assert isinstance(Pxy([1, "a"])._fsproxy_wrapped, Slow)
+    assert isinstance(Pxy([1, 2])._fsproxy_wrapped, Fast)
+
+    def fast(x):
+        fast_calls.append(x)
+        check(x)
+        return "fast"
+
+    pxy = _FunctionProxy(fast=fast, slow=lambda x: "slow")
+    assert [pxy([1, "a"]), pxy([1, 2])] == ["slow", "fast"]
+    assert fast_calls == [[1, "a"], [1, 2]]
+    assert _fast_path_failures.records == 0
+
+
+@pytest.fixture
+def dual_residency_proxy(monkeypatch):
+    monkeypatch.setattr(_dual_residency, "budget", 1024)
+    _dual_residency.clear()
+    copies = []
+
+    class Fast:
+        nbytes = property(lambda self: 8)
+
+        def __init__(self, x):
+            self.x = x
+
+        def __setitem__(self, key, value):
+            self.x = value
+
+        def both(self):
+            return self.x
+
+    class Slow:
+        nbytes = property(lambda self: 8)
+
+        def __init__(self, x):
+            self.x = x
+
+        def __setitem__(self, key, value):
+            self.x = value
+
+        def both(self):
+            return self.x
+
+        def slow_only(self):
+            return self.x
+
+    def fast_to_slow(fast):
+        copies.append("fast_to_slow")
+        return Slow(fast.x)
+
+    def slow_to_fast(slow):
+        copies.append("slow_to_fast")
+        return Fast(slow.x)
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=fast_to_slow,
+        slow_to_fast=slow_to_fast,
+    )
+    yield Pxy, copies
+    _dual_residency.clear()
+
+
+def test_dual_residency(dual_residency_proxy):
+    Pxy, copies = dual_residency_proxy
+    pxy = Pxy(1)
+    assert [pxy.slow_only(), pxy.both(), pxy.slow_only()] == [1, 1, 1]
+    # Alternating between the fast and slow paths copies only once
+    assert copies == ["fast_to_slow"]
+    assert _dual_residency.hits == 2
+    pxy[0] = 2
+    # The mutation invalidates the secondary copy
+    assert _dual_residency.invalidations == 1
+    assert [pxy.slow_only(), pxy.both()] == [2, 2]
+    assert copies == ["fast_to_slow", "fast_to_slow"]
+
+
+def test_dual_residency_budget(dual_residency_proxy, monkeypatch):
+    Pxy, copies = dual_residency_proxy
+    monkeypatch.setattr(_dual_residency, "budget", 8)
+    a, b = Pxy(1), Pxy(2)
+    assert [a.slow_only(), b.slow_only()] == [1, 2]
+    # The secondary copy of b evicts the one of a
+    assert (_dual_residency.evictions, _dual_residency.nbytes) == (1, 8)
+    assert [b.both(), a.both()] == [2, 1]
+    assert copies == ["fast_to_slow", "fast_to_slow", "slow_to_fast"]
+    del a, b
+    assert _dual_residency.nbytes == 0
+
+
+def test_dual_residency_disabled(dual_residency_proxy, monkeypatch):
+    Pxy, copies = dual_residency_proxy
+    monkeypatch.setattr(_dual_residency, "budget", 0)
+    pxy = Pxy(1)
+    assert [pxy.slow_only(), pxy.both()] == [1, 1]
+    assert copies == ["fast_to_slow", "slow_to_fast"]
+    assert _dual_residency.admits == 0
+
+
 def test_access_class():
     def func():
         pass
@@ -7,7 +7,9 @@ import subprocess
 
 import pytest
 
-from cudf.pandas import LOADED, Profiler
+import cudf
+from cudf.pandas import LOADED, CountingProfiler, Profiler
+from cudf.pandas.fast_slow_proxy import _fast_path_failures
 
 if not LOADED:
     raise ImportError("These tests must be run with cudf.pandas loaded")
@@ -84,6 +86,40 @@ def test_profiler_fast_slow_name_mismatch():
         df.iloc[0, 1] = "foo"
 
 
+def _raise_not_implemented(self, *args, **kwargs):
+    raise NotImplementedError()
+
+
+def test_counting_profiler(monkeypatch):
+    monkeypatch.setattr(
+        pd.Series.mean, "_fsproxy_fast", _raise_not_implemented
+    )
+    try:
+        with CountingProfiler() as profiler:
+            s = pd.Series(range(1000))
+            s.sum()
+            s.mean()
+    finally:
+        # Proxy dispatch doesn't work with monkeypatch undo
+        monkeypatch.setattr(pd.Series.mean, "_fsproxy_fast", cudf.Series.mean)
+        # Forget the forced failure, so later calls use the GPU
+        _fast_path_failures.clear()
+
+    per_function_stats = profiler.per_function_stats
+    assert per_function_stats["Series.sum"].gpu_calls == 1
+    assert per_function_stats["Series.sum"].cpu_calls == 0
+    assert per_function_stats["Series.mean"].gpu_calls == 0
+    assert per_function_stats["Series.mean"].cpu_calls == 1
+    # The fallback copies the series from device to host
+    assert per_function_stats["Series.mean"].d2h_copies == 1
+    assert per_function_stats["Series.mean"].d2h_bytes >= 8000
+    assert [line for _, line, _, _ in profiler.per_line_stats] == [
+        "s = pd.Series(range(1000))",
+        "s.sum()",
+        "s.mean()",
+    ]
+
+
 def test_profiler_commandline():
     data_directory = os.path.dirname(os.path.abspath(__file__))
     # Create a copy of the current environment variables
@@ -120,3 +156,34 @@ def test_profiler_commandline():
         "CPU percall",
     ]:
         assert string in output
+
+
+def test_counting_profiler_commandline():
+    data_directory = os.path.dirname(os.path.abspath(__file__))
+    env = os.environ.copy()
+    env["COLUMNS"] = "10000"
+
+    sp_completed = subprocess.run(
+        [
+            "python",
+            "-m",
+            "cudf.pandas",
+            "--counting-profile",
+            data_directory + "/data/profile_basic.py",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert sp_completed.returncode == 0
+    output = sp_completed.stdout
+
+    for string in [
+        "Total time",
+        "Function",
+        "GPU ncalls",
+        "CPU ncalls",
+        "H2D bytes",
+        "D2H bytes",
+    ]:
+        assert string in output
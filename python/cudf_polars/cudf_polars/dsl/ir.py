@@ -66,6 +66,7 @@ __all__ = [
     "PythonScan",
     "Scan",
     "Select",
+    "Sink",
     "Slice",
     "Sort",
     "Union",
@@ -482,8 +483,21 @@ class Scan(IR):
         row_index: tuple[str, int] | None,
         include_file_paths: str | None,
         predicate: expr.NamedExpr | None,
+        *,
+        byte_range: tuple[int, int] | None = None,
     ) -> DataFrame:
-        """Evaluate and return a dataframe."""
+        """
+        Evaluate and return a dataframe.
+
+        Notes
+        -----
+        The optional ``byte_range`` argument is an ``(offset, size)``
+        pair restricting a CSV or NDJSON read of a single file to the
+        rows that start within that range of bytes. A ``size`` of
+        zero reads until the end of the file. Byte ranges of a CSV
+        file assume that no quoted field contains a line terminator,
+        and that the file does not start with blank lines.
+        """
         if typ == "csv":
 
             def read_csv_header(
@@ -498,7 +512,7 @@ class Scan(IR):
 
             parse_options = reader_options["parse_options"]
             sep = chr(parse_options["separator"])
-            quote = chr(parse_options["quote_char"])
+            quote_char = parse_options["quote_char"]
             eol = chr(parse_options["eol_char"])
             if reader_options["schema"] is not None:
                 # Reader schema provides names
@@ -533,23 +547,36 @@ class Scan(IR):
             for p in paths:
                 skiprows = reader_options["skip_rows"]
                 path = Path(p)
-                with path.open() as f:
-                    while f.readline() == "\n":
-                        skiprows += 1
-                options = (
-                    plc.io.csv.CsvReaderOptions.builder(plc.io.SourceInfo([path]))
-                    .nrows(n_rows)
-                    .skiprows(
+                builder = plc.io.csv.CsvReaderOptions.builder(plc.io.SourceInfo([path]))
+                if byte_range is None:
+                    with path.open() as f:
+                        while f.readline() == "\n":
+                            skiprows += 1
+                    builder = builder.nrows(n_rows).skiprows(
                         skiprows if POLARS_VERSION_LT_128 else skiprows + skip_rows
                     )  # pragma: no cover
-                    .lineterminator(str(eol))
-                    .quotechar(str(quote))
-                    .decimal(decimal)
+                else:
+                    # Byte ranges cannot be combined with skiprows/nrows
+                    builder = builder.byte_range_offset(byte_range[0]).byte_range_size(
+                        byte_range[1]
+                    )
+                builder = builder.lineterminator(str(eol))
+                if quote_char is None:
+                    builder = builder.quoting(plc.io.types.QuoteStyle.NONE)
+                else:
+                    builder = builder.quotechar(chr(quote_char))
+                options = (
+                    builder.decimal(decimal)
                     .keep_default_na(keep_default_na=False)
                     .na_filter(na_filter=True)
                     .build()
                 )
                 options.set_delimiter(str(sep))
+                if byte_range is not None and byte_range[0] > 0:
+                    # Only the first byte range contains the header
+                    if column_names is None:
+                        column_names = read_csv_header(path, str(sep))
+                    header = -1
                 if column_names is not None:
                     options.set_names([str(name) for name in column_names])
                 else:
@@ -680,11 +707,14 @@ class Scan(IR):
             json_schema: list[plc.io.json.NameAndType] = [
                 (name, typ, []) for name, typ in schema.items()
             ]
+            offset, size = byte_range if byte_range is not None else (0, 0)
             plc_tbl_w_meta = plc.io.json.read_json(
                 plc.io.json._setup_json_reader_options(
                     plc.io.SourceInfo(paths),
                     lines=True,
                     dtypes=json_schema,
+                    byte_range_offset=offset,
+                    byte_range_size=size,
                     prune_columns=True,
                 )
             )
@@ -2014,3 +2044,239 @@ class Empty(IR):
     def do_evaluate(cls) -> DataFrame:  # pragma: no cover
         """Evaluate and return a dataframe."""
         return DataFrame([])
+
+
+class Sink(IR):
+    """Write a dataframe to a file."""
+
+    __slots__ = ("cloud_options", "kind", "options", "path")
+    _non_child = ("schema", "kind", "path", "options", "cloud_options")
+    kind: str
+    """What type of file are we writing? Parquet, Csv or Json."""
+    path: str
+    """Path of the file to write to."""
+    options: dict[str, Any]
+    """Writer-specific options, as dictionary."""
+    cloud_options: dict[str, Any] | None
+    """Cloud-related authentication options."""
+
+    PARQUET_COMPRESSION: ClassVar[dict[str, plc.io.types.CompressionType]] = {
+        "Uncompressed": plc.io.types.CompressionType.NONE,
+        "Snappy": plc.io.types.CompressionType.SNAPPY,
+        "Gzip": plc.io.types.CompressionType.GZIP,
+        "Lz4Raw": plc.io.types.CompressionType.LZ4,
+        "Zstd": plc.io.types.CompressionType.ZSTD,
+    }
+    """Mapping from polars parquet compression names to libcudf codecs."""
+
+    def __init__(
+        self,
+        schema: Schema,
+        kind: str,
+        path: str,
+        options: dict[str, Any],
+        cloud_options: dict[str, Any] | None,
+        df: IR,
+    ):
+        self.schema = schema
+        self.kind = kind
+        self.path = path
+        self.options = options
+        self.cloud_options = cloud_options
+        self._non_child_args = (schema, kind, path, options)
+        self.children = (df,)
+        if self.cloud_options is not None and any(
+            self.cloud_options.get(k) is not None for k in ("aws", "azure", "gcp")
+        ):
+            raise NotImplementedError(
+                "Write to cloud storage"
+            )  # pragma: no cover; no test yet
+        if (sync_on_close := options.get("sync_on_close")) not in (None, "None"):
+            raise NotImplementedError(f"sync_on_close={sync_on_close!r} in sink")
+        if kind == "Parquet":
+            compression = options["compression"]
+            if isinstance(compression, dict):
+                ((compression, level),) = compression.items()
+                if level is not None:
+                    raise NotImplementedError(
+                        "Setting a compression level in the parquet writer"
+                    )
+            if compression not in self.PARQUET_COMPRESSION:
+                raise NotImplementedError(
+                    f"Compression type {compression!r} in the parquet writer"
+                )
+            options["compression"] = compression
+        elif kind == "Csv":
+            if any(
+                dtype.id() in (plc.TypeId.LIST, plc.TypeId.STRUCT)
+                for dtype in df.schema.values()
+            ):
+                # Polars refuses to write these too
+                raise NotImplementedError(
+                    "Nested types in the CSV writer"
+                )  # pragma: no cover
+            if options["include_bom"]:
+                raise NotImplementedError("Writing a byte order mark to CSV")
+            serialize = options["serialize_options"]
+            for key in (
+                "date_format",
+                "time_format",
+                "datetime_format",
+                "float_scientific",
+                "float_precision",
+            ):
+                if serialize[key] is not None:
+                    raise NotImplementedError(f"{key} in the CSV writer")
+            if serialize["quote_style"] != "Necessary":
+                raise NotImplementedError(
+                    f"quote_style={serialize['quote_style']!r} in the CSV writer"
+                )
+            if chr(serialize["quote_char"]) != '"':
+                raise NotImplementedError("Custom quote character in the CSV writer")
+        elif kind != "Json":
+            raise NotImplementedError(f"Unhandled sink kind: {kind}")
+
+    def get_hashable(self) -> Hashable:
+        """
+        Hashable representation of the node.
+
+        The writer options are a (nested) dictionary, which we
+        serialize to make them hashable.
+        """
+        schema_hash = tuple(self.schema.items())
+        return (
+            type(self),
+            schema_hash,
+            self.kind,
+            self.path,
+            json.dumps(self.options, sort_keys=True),
+            json.dumps(self.cloud_options, sort_keys=True),
+        )
+
+    @staticmethod
+    def prepare_path(path: str, options: dict[str, Any]) -> None:
+        """Create the parent directory of ``path`` if requested."""
+        if options.get("mkdir", False):
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def write_csv(
+        target: plc.io.SinkInfo,
+        options: dict[str, Any],
+        df: DataFrame,
+        *,
+        include_header: bool,
+    ) -> None:
+        """
+        Write a dataframe as CSV.
+
+        Parameters
+        ----------
+        target
+            Sink to write to.
+        options
+            Polars CSV writer options.
+        df
+            Dataframe to write.
+        include_header
+            Should the header line be written? When appending
+            partitions to a file this is only true for the first one.
+        """
+        serialize = options["serialize_options"]
+        plc.io.csv.write_csv(
+            plc.io.csv.CsvWriterOptions.builder(target, df.table)
+            .include_header(include_header)
+            .names(df.column_names)
+            .na_rep(serialize["null"])
+            .line_terminator(serialize["line_terminator"])
+            .inter_column_delimiter(chr(serialize["separator"]))
+            .true_value("true")
+            .false_value("false")
+            .build()
+        )
+
+    @staticmethod
+    def write_json(target: plc.io.SinkInfo, df: DataFrame) -> None:
+        """Write a dataframe as newline-delimited JSON."""
+        metadata = plc.io.TableWithMetadata(
+            df.table, [(name, []) for name in df.column_names]
+        )
+        plc.io.json.write_json(
+            plc.io.json.JsonWriterOptions.builder(target, df.table)
+            .metadata(metadata)
+            .lines(True)  # noqa: FBT003
+            .na_rep("null")
+            .include_nulls(True)  # noqa: FBT003
+            .build()
+        )
+
+    @classmethod
+    def parquet_writer_options(
+        cls, options: dict[str, Any], df: DataFrame
+    ) -> tuple[
+        plc.io.types.TableInputMetadata,
+        plc.io.types.CompressionType,
+        plc.io.types.StatisticsFreq,
+    ]:
+        """
+        Translate polars parquet writer options.
+
+        Parameters
+        ----------
+        options
+            Polars parquet writer options.
+        df
+            Dataframe to write (or the first partition thereof).
+
+        Returns
+        -------
+        tuple of column metadata, compression and statistics level
+        to pass to the (chunked) libcudf parquet writer.
+        """
+        metadata = plc.io.types.TableInputMetadata(df.table)
+        for column_metadata, name in zip(
+            metadata.column_metadata, df.column_names, strict=True
+        ):
+            column_metadata.set_name(name)
+        statistics = options["statistics"]
+        if isinstance(statistics, dict):
+            statistics = any(statistics.values())
+        return (
+            metadata,
+            cls.PARQUET_COMPRESSION[options["compression"]],
+            plc.io.types.StatisticsFreq.STATISTICS_ROWGROUP
+            if statistics
+            else plc.io.types.StatisticsFreq.STATISTICS_NONE,
+        )
+
+    @classmethod
+    def do_evaluate(
+        cls,
+        schema: Schema,
+        kind: str,
+        path: str,
+        options: dict[str, Any],
+        df: DataFrame,
+    ) -> DataFrame:
+        """Write the dataframe and return an empty dataframe."""
+        cls.prepare_path(path, options)
+        target = plc.io.SinkInfo([path])
+        if kind == "Parquet":
+            metadata, compression, stats_level = cls.parquet_writer_options(options, df)
+            writer_options = (
+                plc.io.parquet.ParquetWriterOptions.builder(target, df.table)
+                .metadata(metadata)
+                .compression(compression)
+                .stats_level(stats_level)
+                .build()
+            )
+            if (row_group_size := options.get("row_group_size")) is not None:
+                writer_options.set_row_group_size_rows(row_group_size)
+            if (data_page_size := options.get("data_page_size")) is not None:
+                writer_options.set_max_page_size_bytes(data_page_size)
+            plc.io.parquet.write_parquet(writer_options)
+        elif kind == "Csv":
+            cls.write_csv(target, options, df, include_header=options["include_header"])
+        else:
+            cls.write_json(target, df)
+        return DataFrame([])
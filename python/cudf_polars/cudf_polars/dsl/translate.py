@@ -463,6 +463,32 @@ def _(node: pl_ir.HConcat, translator: Translator, schema: Schema) -> ir.IR:
     )
 
 
+@_translate_ir.register
+def _(node: pl_ir.Sink, translator: Translator, schema: Schema) -> ir.IR:
+    payload = json.loads(node.payload)
+    try:
+        file = payload["File"]
+    except (KeyError, TypeError) as e:
+        raise NotImplementedError(f"Sink to {payload}") from e
+    ((kind, options),) = file["file_type"].items()
+    options.update(file.get("sink_options") or {})
+    # Older polars versions name the destination "path", newer
+    # ones wrap it in a "target" enum.
+    target = file.get("target", file.get("path"))
+    if isinstance(target, dict):
+        if "Path" not in target:
+            raise NotImplementedError("Sink to a python file object")
+        target = target["Path"]
+    return ir.Sink(
+        schema,
+        kind,
+        target,
+        options,
+        file.get("cloud_options"),
+        translator.translate_ir(n=node.input),
+    )
+
+
 def translate_named_expr(
     translator: Translator, *, n: pl_expr.PyExprIR
 ) -> expr.NamedExpr:
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    import pylibcudf as plc
+
     from cudf_polars.dsl.expr import NamedExpr
     from cudf_polars.dsl.nodebase import Node
 
@@ -16,19 +18,30 @@ if TYPE_CHECKING:
 class PartitionInfo:
     """Partitioning information."""
 
-    __slots__ = ("count", "partitioned_on")
+    __slots__ = ("count", "partitioned_on", "sorted_on")
     count: int
     """Partition count."""
     partitioned_on: tuple[NamedExpr, ...]
     """Columns the data is hash-partitioned on."""
+    sorted_on: tuple[tuple[NamedExpr, plc.types.Order, plc.types.NullOrder], ...]
+    """
+    Sort keys (with order and null order) the data is globally sorted on.
+
+    Every row of partition ``i`` sorts before (or equal to)
+    every row of partition ``i + 1``.
+    """
 
     def __init__(
         self,
         count: int,
         partitioned_on: tuple[NamedExpr, ...] = (),
+        sorted_on: tuple[
+            tuple[NamedExpr, plc.types.Order, plc.types.NullOrder], ...
+        ] = (),
     ):
         self.count = count
         self.partitioned_on = partitioned_on
+        self.sorted_on = sorted_on
 
     def keys(self, node: Node) -> Iterator[tuple[str, int]]:
         """Return the partitioned keys for a given node."""
@@ -0,0 +1,329 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+"""Sample-based cardinality, key-frequency and size estimation."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+import pylibcudf as plc
+
+from cudf_polars.dsl.ir import (
+    Cache,
+    DataFrameScan,
+    Filter,
+    HStack,
+    MapFunction,
+    Projection,
+    Scan,
+    Select,
+    Union,
+)
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.experimental.base import get_key_name
+from cudf_polars.experimental.io import SplitScan
+from cudf_polars.experimental.scheduler import cull
+from cudf_polars.experimental.utils import _sizeof
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableMapping
+
+    from cudf_polars.containers import DataFrame
+    from cudf_polars.dsl.expr import NamedExpr
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.experimental.base import PartitionInfo
+    from cudf_polars.utils.config import ConfigOptions
+
+
+# Nodes for which each output partition only depends on
+# a single partition of each child. A sampled partition of
+# a graph made up of these nodes can be computed without
+# computing the rest of the graph.
+_SAMPLEABLE_NODES = (
+    Cache,
+    DataFrameScan,
+    Filter,
+    HStack,
+    MapFunction,
+    Projection,
+    Scan,
+    Select,
+    SplitScan,
+    Union,
+)
+
+# Fraction of the sampled rows with a key that is seen exactly
+# once, above which the sampled keys are assumed to be unique
+UNIQUE_SINGLETON_FRACTION = 0.9
+
+
+def _sampleable(ir: IR) -> bool:
+    # Can we cheaply compute a few partitions of ir?
+    return all(isinstance(node, _SAMPLEABLE_NODES) for node in traversal([ir]))
+
+
+def _key_table(
+    keys: tuple[NamedExpr, ...], dfs: tuple[DataFrame, ...]
+) -> plc.Table | None:
+    # Concatenate the keys of the (non-empty) sampled partitions
+    tables = [
+        plc.Table([key.evaluate(df).obj for key in keys])
+        for df in dfs
+        if df.num_rows > 0
+    ]
+    if not tables:
+        return None
+    return tables[0] if len(tables) == 1 else plc.concatenate.concatenate(tables)
+
+
+def _key_statistics(keys: tuple[NamedExpr, ...], *dfs: DataFrame) -> tuple[int, ...]:
+    """
+    Collect the key statistics of a sample.
+
+    Parameters
+    ----------
+    keys
+        The (distinct or group-by) keys.
+    dfs
+        The sampled partitions.
+
+    Returns
+    -------
+    The number of sampled rows, the number of distinct
+    keys in the sample, and the number of keys that occur
+    exactly once in the sample.
+    """
+    if (table := _key_table(keys, dfs)) is None:
+        return 0, 0, 0
+    indices = list(range(table.num_columns()))
+    distinct, singletons = (
+        plc.stream_compaction.distinct(
+            table,
+            indices,
+            keep,
+            plc.types.NullEquality.EQUAL,
+            plc.types.NanEquality.ALL_EQUAL,
+        ).num_rows()
+        for keep in (
+            plc.stream_compaction.DuplicateKeepOption.KEEP_ANY,
+            plc.stream_compaction.DuplicateKeepOption.KEEP_NONE,
+        )
+    )
+    return table.num_rows(), distinct, singletons
+
+
+def _hot_keys(
+    keys: tuple[NamedExpr, ...], fraction: float, *dfs: DataFrame
+) -> tuple[tuple[Any, ...], ...]:
+    """
+    Find the frequent keys of a sample.
+
+    Parameters
+    ----------
+    keys
+        The keys to count.
+    fraction
+        The fraction of the sampled rows that a key
+        must exceed to be returned.
+    dfs
+        The sampled partitions.
+
+    Returns
+    -------
+    The values of the frequent (non-null) keys. A key
+    must occur more than once to be frequent.
+    """
+    if (table := _key_table(keys, dfs)) is None:
+        return ()
+    grouped, (counts,) = plc.groupby.GroupBy(table).aggregate(
+        [
+            plc.groupby.GroupByRequest(
+                table.columns()[0],
+                [plc.aggregation.count(plc.types.NullPolicy.INCLUDE)],
+            )
+        ]
+    )
+    mask = plc.binaryop.binary_operation(
+        counts.columns()[0],
+        # Keys seen only once in the sample are never hot
+        plc.Scalar.from_py(
+            max(fraction * table.num_rows(), 1.0), plc.DataType(plc.TypeId.FLOAT64)
+        ),
+        plc.binaryop.BinaryOperator.GREATER,
+        plc.DataType(plc.TypeId.BOOL8),
+    )
+    hot = plc.stream_compaction.apply_boolean_mask(grouped, mask)
+    return tuple(
+        zip(
+            *(plc.interop.to_arrow(column).to_pylist() for column in hot.columns()),
+            strict=True,
+        )
+    )
+
+
+def estimate_cardinality_factor(
+    ir: IR,
+    keys: tuple[NamedExpr, ...],
+    partition_info: MutableMapping[IR, PartitionInfo],
+    config_options: ConfigOptions,
+) -> float | None:
+    """
+    Estimate the fraction of distinct keys in a partitioned frame.
+
+    Parameters
+    ----------
+    ir
+        The (lowered) IR node to sample.
+    keys
+        The keys to estimate the number of distinct values of.
+    partition_info
+        A mapping from all unique IR nodes to the
+        associated partitioning information.
+    config_options
+        GPUEngine configuration options.
+
+    Returns
+    -------
+    The estimated number of distinct keys, as a fraction of
+    the number of rows of ``ir`` (i.e. an estimated
+    ``cardinality_factor``). None if the estimate is
+    unavailable, because sampling is disabled, ``ir`` has a
+    single partition or cannot be sampled cheaply, or the
+    sample is empty.
+
+    Notes
+    -----
+    A few partitions of ``ir`` are computed at planning time
+    (and computed again when the query is executed). The total
+    number of distinct keys is estimated from the sample using
+    the "Guaranteed-Error Estimator" of Charikar et al. (2000):
+    keys seen more than once in the sample are counted once, and
+    keys seen exactly once are scaled up by the square root of
+    the inverse sampling fraction. If (almost) every sampled key
+    is seen exactly once, the keys are likely unique, and the
+    singletons are scaled up by the inverse sampling fraction
+    instead. Overestimating the number of distinct keys only
+    costs a few more output partitions, while underestimating
+    it produces output partitions that may not fit in memory.
+    """
+    assert config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in 'estimate_cardinality_factor'"
+    )
+    count = partition_info[ir].count
+    sample = _sample(ir, partition_info, config_options, _key_statistics, keys)
+    if sample is None:
+        return None
+    (n_rows, distinct, singletons), n_sample = sample
+    if n_rows == 0:
+        return None
+
+    # Extrapolate to the full frame
+    total_rows = n_rows * count / n_sample
+    scale = total_rows / n_rows
+    if singletons < UNIQUE_SINGLETON_FRACTION * n_rows:
+        scale = math.sqrt(scale)
+    estimate = scale * singletons + distinct - singletons
+    return min(max(estimate, distinct) / total_rows, 1.0)
+
+
+def find_hot_keys(
+    ir: IR,
+    keys: tuple[NamedExpr, ...],
+    fraction: float,
+    partition_info: MutableMapping[IR, PartitionInfo],
+    config_options: ConfigOptions,
+) -> tuple[tuple[Any, ...], ...]:
+    """
+    Find the most frequent keys of a partitioned frame.
+
+    Parameters
+    ----------
+    ir
+        The (lowered) IR node to sample.
+    keys
+        The keys to count.
+    fraction
+        The fraction of the rows of ``ir`` that a key must
+        exceed to be returned.
+    partition_info
+        A mapping from all unique IR nodes to the
+        associated partitioning information.
+    config_options
+        GPUEngine configuration options.
+
+    Returns
+    -------
+    The (non-null) values of the keys that make up more than
+    ``fraction`` of the sampled rows (and occur more than once
+    in the sample), as tuples of Python
+    scalars. Empty if sampling is unavailable (see
+    :func:`estimate_cardinality_factor`).
+    """
+    sample = _sample(ir, partition_info, config_options, _hot_keys, keys, fraction)
+    return () if sample is None else sample[0]
+
+
+def estimate_partition_size(
+    ir: IR,
+    partition_info: MutableMapping[IR, PartitionInfo],
+    config_options: ConfigOptions,
+) -> float | None:
+    """
+    Estimate the mean size of the partitions of a partitioned frame.
+
+    Parameters
+    ----------
+    ir
+        The (lowered) IR node to sample.
+    partition_info
+        A mapping from all unique IR nodes to the
+        associated partitioning information.
+    config_options
+        GPUEngine configuration options.
+
+    Returns
+    -------
+    The mean (device) size in bytes of the sampled partitions.
+    None if sampling is unavailable (see
+    :func:`estimate_cardinality_factor`).
+    """
+    sample = _sample(ir, partition_info, config_options, _total_size)
+    if sample is None:
+        return None
+    size, n_sample = sample
+    return size / n_sample
+
+
+def _total_size(*dfs: DataFrame) -> int:
+    # Total size in bytes of the sampled partitions
+    return sum(_sizeof(df) for df in dfs)
+
+
+def _sample(
+    ir: IR,
+    partition_info: MutableMapping[IR, PartitionInfo],
+    config_options: ConfigOptions,
+    func: Callable[..., Any],
+    *args: Any,
+) -> tuple[Any, int] | None:
+    # Compute func(*args, *partitions) for a few evenly-spaced
+    # partitions of ir, and return the result and the number
+    # of sampled partitions (or None if ir cannot be sampled)
+    from cudf_polars.experimental.parallel import get_scheduler, task_graph
+
+    assert config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in '_sample'"
+    )
+    count = partition_info[ir].count
+    n_sample = min(config_options.executor.cardinality_sample_partitions, count)
+    if count < 2 or n_sample < 1 or not _sampleable(ir):
+        return None
+
+    name = get_key_name(ir)
+    sampled = [(name, i * count // n_sample) for i in range(n_sample)]
+    graph, _ = task_graph(ir, partition_info)
+    graph = cull(graph, sampled)
+    key = (f"sample-{name}", 0)
+    graph[key] = (func, *args, *sampled)
+    return get_scheduler(config_options)(graph, key), n_sample
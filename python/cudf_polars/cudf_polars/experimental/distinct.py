@@ -12,6 +12,7 @@ import pylibcudf as plc
 from cudf_polars.dsl.expressions.base import Col, NamedExpr
 from cudf_polars.dsl.ir import Distinct
 from cudf_polars.experimental.base import PartitionInfo
+from cudf_polars.experimental.cardinality import estimate_cardinality_factor
 from cudf_polars.experimental.dispatch import lower_ir_node
 from cudf_polars.experimental.utils import _fallback_inform, _lower_ir_fallback
 
@@ -48,6 +49,8 @@ def lower_distinct(
         GPUEngine configuration options.
     cardinality
         Cardinality factor to use for algorithm selection.
+        If None, the factor is estimated by sampling ``child``
+        (when possible).
 
     Returns
     -------
@@ -73,6 +76,14 @@ def lower_distinct(
     subset: frozenset = ir.subset or frozenset(ir.schema)
     shuffle_keys = tuple(NamedExpr(name, Col(ir.schema[name], name)) for name in subset)
     shuffled = partition_info[child].partitioned_on == shuffle_keys
+    if (
+        cardinality is None
+        and ir.zlice is None
+        and not (shuffled or require_tree_reduction)
+    ):
+        cardinality = estimate_cardinality_factor(
+            child, shuffle_keys, partition_info, config_options
+        )
     if ir.keep == plc.stream_compaction.DuplicateKeepOption.KEEP_NONE:
         # Need to shuffle the original data for keep == "none"
         if require_tree_reduction:
@@ -105,7 +116,7 @@ def lower_distinct(
             # to one partition.
             raise NotImplementedError("Unsupported slice for multiple partitions.")
     elif cardinality is not None:
-        # Use cardinality to determine partitioningcardinality
+        # Use cardinality to determine partitioning
         n_ary = min(max(int(1.0 / cardinality), 2), child_count)
         output_count = max(int(cardinality * child_count), 1)
 
@@ -17,6 +17,8 @@ from cudf_polars.dsl.ir import (
     Sort,
 )
 from cudf_polars.dsl.translate import Translator
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.experimental.io import _prune_parquet_row_groups
 from cudf_polars.experimental.parallel import lower_ir_graph
 from cudf_polars.utils.config import ConfigOptions
 
@@ -55,7 +57,7 @@ def explain_query(
 
     if physical:
         lowered_ir, partition_info = lower_ir_graph(ir, config)
-        return _repr_ir_tree(lowered_ir, partition_info)
+        return _repr_ir_tree(lowered_ir, partition_info) + _repr_pruning(ir)
     else:
         return _repr_ir_tree(ir)
 
@@ -84,6 +86,22 @@ def _repr_ir_tree(
     )
 
 
+def _repr_pruning(ir: IR) -> str:
+    # Summarize the files and row-groups pruned from each Scan
+    lines = []
+    for node in traversal([ir]):
+        if isinstance(node, Scan) and (keep := _prune_parquet_row_groups(node)):
+            n_files = len(keep)
+            pruned_files = sum(1 for k in keep.values() if not any(k))
+            n_rgs = sum(len(k) for k in keep.values())
+            pruned_rgs = sum(k.count(False) for k in keep.values())
+            lines.append(
+                f"SCAN {node.typ.upper()} PRUNED {pruned_files}/{n_files} files, "
+                f"{pruned_rgs}/{n_rgs} row groups\n"
+            )
+    return "".join(lines)
+
+
 def _repr_schema(schema: tuple | None) -> str:
     if schema is None:
         return ""  # pragma: no cover; no test yet
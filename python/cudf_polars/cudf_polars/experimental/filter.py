@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+"""Multi-partition Filter logic."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import pylibcudf as plc
+
+from cudf_polars.dsl import expr
+from cudf_polars.dsl.ir import Filter
+from cudf_polars.experimental.base import PartitionInfo
+from cudf_polars.experimental.dispatch import lower_ir_node
+from cudf_polars.experimental.repartition import Repartition
+from cudf_polars.experimental.utils import AND_OPS, OR_OPS
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.experimental.dispatch import LowerIRTransformer
+
+
+# Default selectivity estimates (in the style of classic
+# cost-based optimizers) for predicates without statistics
+_EQUALITY_SELECTIVITY = 0.1
+_RANGE_SELECTIVITY = 1 / 3
+_DEFAULT_SELECTIVITY = 0.5
+
+_EQUALITY_OPS = {
+    plc.binaryop.BinaryOperator.EQUAL,
+    plc.binaryop.BinaryOperator.NULL_EQUALS,
+}
+_INEQUALITY_OPS = {
+    plc.binaryop.BinaryOperator.NOT_EQUAL,
+    plc.binaryop.BinaryOperator.NULL_NOT_EQUALS,
+}
+_RANGE_OPS = {
+    plc.binaryop.BinaryOperator.LESS,
+    plc.binaryop.BinaryOperator.LESS_EQUAL,
+    plc.binaryop.BinaryOperator.GREATER,
+    plc.binaryop.BinaryOperator.GREATER_EQUAL,
+}
+
+
+def _estimate_selectivity(node: expr.Expr) -> float:
+    """
+    Estimate the fraction of rows selected by a predicate.
+
+    Parameters
+    ----------
+    node
+        Predicate expression.
+
+    Returns
+    -------
+    Estimated selectivity between 0 and 1.
+
+    Notes
+    -----
+    Conjunctions and disjunctions are assumed to combine
+    independent predicates. Predicates that cannot be
+    analyzed use a default selectivity of 0.5.
+    """
+    if isinstance(node, expr.BinOp):
+        left, right = node.children
+        if node.op in AND_OPS:
+            return _estimate_selectivity(left) * _estimate_selectivity(right)
+        elif node.op in OR_OPS:
+            a, b = _estimate_selectivity(left), _estimate_selectivity(right)
+            return a + b - a * b
+        elif node.op in _EQUALITY_OPS:
+            return _EQUALITY_SELECTIVITY
+        elif node.op in _INEQUALITY_OPS:
+            return 1 - _EQUALITY_SELECTIVITY
+        elif node.op in _RANGE_OPS:
+            return _RANGE_SELECTIVITY
+    elif isinstance(node, expr.BooleanFunction):
+        name = node.name
+        if name is expr.BooleanFunction.Name.Not:
+            return 1 - _estimate_selectivity(node.children[0])
+        elif name is expr.BooleanFunction.Name.IsIn:
+            (_, haystack) = node.children
+            if isinstance(haystack, expr.LiteralColumn):
+                return min(1.0, len(haystack.value) * _EQUALITY_SELECTIVITY)
+        elif name is expr.BooleanFunction.Name.IsBetween:
+            return _RANGE_SELECTIVITY * _RANGE_SELECTIVITY
+        elif name is expr.BooleanFunction.Name.IsNull:
+            return _EQUALITY_SELECTIVITY
+        elif name is expr.BooleanFunction.Name.IsNotNull:
+            return 1 - _EQUALITY_SELECTIVITY
+    return _DEFAULT_SELECTIVITY
+
+
+@lower_ir_node.register(Filter)
+def _(
+    ir: Filter, rec: LowerIRTransformer
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
+    from cudf_polars.experimental.cardinality import estimate_partition_size
+    from cudf_polars.experimental.parallel import _lower_ir_pwise
+
+    # Filter input partitions
+    new_node, partition_info = _lower_ir_pwise(ir, rec, preserve_partitioning=True)
+
+    config_options = rec.state["config_options"]
+    assert config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in 'lower_ir_node'"
+    )
+    info = partition_info[new_node]
+    if (
+        not config_options.executor.coalesce_filters
+        or info.count == 1
+        # Concatenating hash partitions would break the partitioning
+        or info.partitioned_on
+    ):
+        return new_node, partition_info
+
+    # Coalesce the (estimated) undersized output partitions.
+    # Neighboring partitions are concatenated, so the data
+    # stays globally sorted (if it was before).
+    size = estimate_partition_size(new_node, partition_info, config_options)
+    if size is None:
+        # Assume that the input partitions are target-sized
+        count = math.ceil(info.count * _estimate_selectivity(ir.mask.value))
+    else:
+        count = math.ceil(
+            info.count * size / config_options.executor.target_partition_size
+        )
+    count = max(count, 1)
+    if count < info.count:
+        coalesced = Repartition(new_node.schema, new_node)
+        partition_info[coalesced] = PartitionInfo(count=count, sorted_on=info.sorted_on)
+        return coalesced, partition_info
+    return new_node, partition_info
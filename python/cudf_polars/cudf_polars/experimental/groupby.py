@@ -6,16 +6,30 @@ from __future__ import annotations
 
 import itertools
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
 
 import pylibcudf as plc
 
-from cudf_polars.dsl.expr import Agg, BinOp, Col, Len, NamedExpr
-from cudf_polars.dsl.ir import GroupBy, Select
+from cudf_polars.containers import Column
+from cudf_polars.dsl.expr import (
+    Agg,
+    BinOp,
+    Cast,
+    Col,
+    Len,
+    Literal,
+    NamedExpr,
+    Ternary,
+    UnaryFunction,
+)
+from cudf_polars.dsl.ir import IR, GroupBy, Select, Sort
 from cudf_polars.dsl.traversal import traversal
 from cudf_polars.dsl.utils.naming import unique_names
-from cudf_polars.experimental.base import PartitionInfo
-from cudf_polars.experimental.dispatch import lower_ir_node
+from cudf_polars.experimental.base import PartitionInfo, get_key_name
+from cudf_polars.experimental.cardinality import estimate_cardinality_factor
+from cudf_polars.experimental.dispatch import generate_ir_tasks, lower_ir_node
 from cudf_polars.experimental.repartition import Repartition
 from cudf_polars.experimental.shuffle import Shuffle
 from cudf_polars.experimental.utils import _lower_ir_fallback
@@ -23,13 +37,78 @@ from cudf_polars.experimental.utils import _lower_ir_fallback
 if TYPE_CHECKING:
     from collections.abc import Generator, MutableMapping
 
+    from cudf_polars.containers import DataFrame
     from cudf_polars.dsl.expr import Expr
-    from cudf_polars.dsl.ir import IR
     from cudf_polars.experimental.parallel import LowerIRTransformer
+    from cudf_polars.typing import Schema
 
 
 # Supported multi-partition aggregations
-_GB_AGG_SUPPORTED = ("sum", "count", "mean", "min", "max", "n_unique")
+_GB_AGG_SUPPORTED = (
+    "sum",
+    "count",
+    "mean",
+    "min",
+    "max",
+    "n_unique",
+    "var",
+    "std",
+    "first",
+    "last",
+)
+# Aggregations that are evaluated exactly after
+# shuffling the input rows on the group-by keys
+_GB_AGG_SHUFFLE = ("median", "quantile")
+
+
+class PartitionIndex(IR):
+    """
+    Append the partition index to a dataframe.
+
+    Notes
+    -----
+    Used as an order tiebreaker for aggregations that
+    depend on the order of the rows (e.g. ``first``)
+    when the partitions are reduced with a shuffle.
+    """
+
+    __slots__ = ("name",)
+    _non_child = ("schema", "name")
+    name: str
+    """Name of the partition-index column."""
+
+    def __init__(self, schema: Schema, name: str, df: IR):
+        self.schema = schema
+        self.name = name
+        self._non_child_args = (name,)
+        self.children = (df,)
+
+    @classmethod
+    def do_evaluate(cls, name: str, df: DataFrame, index: int = 0) -> DataFrame:
+        """Evaluate and return a dataframe."""
+        return df.with_columns(
+            [
+                Column(
+                    plc.Column.from_scalar(
+                        plc.Scalar.from_py(index, plc.DataType(plc.TypeId.INT32)),
+                        df.num_rows,
+                    ),
+                    name=name,
+                )
+            ]
+        )
+
+
+@generate_ir_tasks.register(PartitionIndex)
+def _(
+    ir: PartitionIndex, partition_info: MutableMapping[IR, PartitionInfo]
+) -> MutableMapping[Any, Any]:
+    (child,) = ir.children
+    child_name = get_key_name(child)
+    return {
+        key: (ir.do_evaluate, ir.name, (child_name, i), i)
+        for i, key in enumerate(partition_info[ir].keys(ir))
+    }
 
 
 def combine(
@@ -90,7 +169,7 @@ def decompose(
         reduction = [NamedExpr(name, Agg(dtype, "sum", None, Col(dtype, name)))]
         return selection, aggregation, reduction
     if isinstance(expr, Agg):
-        if expr.name in ("sum", "count", "min", "max", "n_unique"):
+        if expr.name in ("sum", "count", "min", "max", "n_unique", "first", "last"):
             if expr.name in ("sum", "count", "n_unique"):
                 aggfunc = "sum"
             else:
@@ -114,6 +193,78 @@ def decompose(
                 BinOp(dtype, plc.binaryop.BinaryOperator.DIV, sum.value, count.value),
             )
             return selection, aggregations, reductions
+        elif expr.name in ("var", "std"):
+            (child,) = expr.children
+            f64 = plc.DataType(plc.TypeId.FLOAT64)
+            value = Cast(f64, child)
+            (total, total_sq, count), aggregations, reductions = combine(
+                decompose(
+                    f"{next(names)}__{expr.name}_sum",
+                    Agg(f64, "sum", None, value),
+                    names=names,
+                ),
+                decompose(
+                    f"{next(names)}__{expr.name}_sum_sq",
+                    Agg(
+                        f64,
+                        "sum",
+                        None,
+                        BinOp(f64, plc.binaryop.BinaryOperator.MUL, value, value),
+                    ),
+                    names=names,
+                ),
+                decompose(
+                    f"{next(names)}__{expr.name}_count",
+                    Agg(f64, "count", False, child),  # noqa: FBT003
+                    names=names,
+                ),
+            )
+            ddof = Literal(f64, pa.scalar(float(expr.options), type=pa.float64()))
+            # (sum_sq - sum * sum / count) / (count - ddof), which
+            # is clamped at zero to absorb rounding errors
+            result: Expr = BinOp(
+                f64,
+                plc.binaryop.BinaryOperator.NULL_MAX,
+                BinOp(
+                    f64,
+                    plc.binaryop.BinaryOperator.DIV,
+                    BinOp(
+                        f64,
+                        plc.binaryop.BinaryOperator.SUB,
+                        total_sq.value,
+                        BinOp(
+                            f64,
+                            plc.binaryop.BinaryOperator.DIV,
+                            BinOp(
+                                f64,
+                                plc.binaryop.BinaryOperator.MUL,
+                                total.value,
+                                total.value,
+                            ),
+                            count.value,
+                        ),
+                    ),
+                    BinOp(f64, plc.binaryop.BinaryOperator.SUB, count.value, ddof),
+                ),
+                Literal(f64, pa.scalar(0.0, type=pa.float64())),
+            )
+            if expr.name == "std":
+                result = UnaryFunction(f64, "sqrt", (), result)
+            # Null unless there are more than ddof values
+            result = Ternary(
+                f64,
+                BinOp(
+                    plc.DataType(plc.TypeId.BOOL8),
+                    plc.binaryop.BinaryOperator.GREATER,
+                    count.value,
+                    ddof,
+                ),
+                result,
+                Literal(f64, pa.scalar(None, type=pa.float64())),
+            )
+            if dtype != f64:
+                result = Cast(dtype, result)
+            return NamedExpr(name, result), aggregations, reductions
         else:
             raise NotImplementedError(
                 "group_by does not support multiple partitions "
@@ -159,6 +310,31 @@ def _(
         "'in-memory' executor not supported in 'generate_ir_tasks'"
     )
 
+    new_node: IR
+    child_count = partition_info[child].count
+    agg_names = {
+        e.name
+        for e in traversal([a.value for a in ir.agg_requests])
+        if isinstance(e, Agg)
+    }
+    if (
+        agg_names.intersection(_GB_AGG_SHUFFLE)
+        and not agg_names.intersection(("first", "last"))
+        and not (shuffled or ir.maintain_order or ir.zlice is not None)
+    ):
+        # Holistic aggregations (e.g. median) cannot be decomposed
+        # into partition-wise pieces. Shuffle the rows on the keys
+        # instead, so that each group is aggregated exactly within
+        # a single partition.
+        shuffled_child = Shuffle(child.schema, ir.keys, ir.config_options, child)
+        partition_info[shuffled_child] = PartitionInfo(count=child_count)
+        new_node = ir.reconstruct([shuffled_child])
+        partition_info[new_node] = PartitionInfo(
+            count=child_count,
+            partitioned_on=ir.keys,
+        )
+        return new_node, partition_info
+
     cardinality_factor = {
         c: min(f, 1.0)
         for c, f in ir.config_options.executor.cardinality_factor.items()
@@ -170,13 +346,20 @@ def _(
         # cardinality "factors". Each factor estimates the
         # fractional number of unique values in the column.
         # Each value should be in the range (0, 1].
-        child_count = partition_info[child].count
         post_aggregation_count = max(
             int(max(cardinality_factor.values()) * child_count),
             1,
         )
+    elif not (shuffled or ir.maintain_order or ir.zlice is not None):
+        # Otherwise, estimate the cardinality by sampling the
+        # child. We only consider a shuffle reduction if the
+        # output order (and slice) does not matter.
+        estimate = estimate_cardinality_factor(
+            child, ir.keys, partition_info, ir.config_options
+        )
+        if estimate is not None:
+            post_aggregation_count = max(int(estimate * child_count), 1)
 
-    new_node: IR
     name_generator = unique_names(ir.schema.keys())
     # Decompose the aggregation requests into three distinct phases
     try:
@@ -210,11 +393,10 @@ def _(
         ir.config_options,
         child,
     )
-    child_count = partition_info[child].count
     partition_info[gb_pwise] = PartitionInfo(count=child_count)
 
     # Reduction
-    gb_inter: GroupBy | Repartition | Shuffle
+    gb_inter: GroupBy | Repartition | Shuffle | Sort
     reduction_schema = {k.name: k.value.dtype for k in ir.keys} | {
         k.name: k.value.dtype for k in reduction_exprs
     }
@@ -227,12 +409,39 @@ def _(
                 msg="maintain_order not supported for multiple output partitions.",
             )
 
-        gb_inter = Shuffle(
-            gb_pwise.schema,
-            ir.keys,
-            ir.config_options,
-            gb_pwise,
-        )
+        if agg_names.intersection(("first", "last")):
+            # The shuffle does not preserve the order of the
+            # partitions, so tag each partial result with its
+            # partition index and restore the order afterwards.
+            index_name = next(name_generator)
+            int32 = plc.DataType(plc.TypeId.INT32)
+            gb_indexed = PartitionIndex(
+                gb_pwise.schema | {index_name: int32}, index_name, gb_pwise
+            )
+            partition_info[gb_indexed] = PartitionInfo(count=child_count)
+            gb_shuffled = Shuffle(
+                gb_indexed.schema,
+                ir.keys,
+                ir.config_options,
+                gb_indexed,
+            )
+            partition_info[gb_shuffled] = PartitionInfo(count=post_aggregation_count)
+            gb_inter = Sort(
+                gb_shuffled.schema,
+                [NamedExpr(index_name, Col(int32, index_name))],
+                [plc.types.Order.ASCENDING],
+                [plc.types.NullOrder.AFTER],
+                True,  # noqa: FBT003
+                None,
+                gb_shuffled,
+            )
+        else:
+            gb_inter = Shuffle(
+                gb_pwise.schema,
+                ir.keys,
+                ir.config_options,
+                gb_pwise,
+            )
         partition_info[gb_inter] = PartitionInfo(count=post_aggregation_count)
     else:
         # N-ary tree reduction
@@ -6,19 +6,28 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+import functools
+import itertools
 import math
 import random
+import statistics
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import pylibcudf as plc
 
+from cudf_polars.dsl import expr
 from cudf_polars.dsl.ir import IR, DataFrameScan, Scan, Union
+from cudf_polars.dsl.to_ast import REVERSED_COMPARISON
 from cudf_polars.experimental.base import PartitionInfo
 from cudf_polars.experimental.dispatch import lower_ir_node
+from cudf_polars.experimental.utils import AND_OPS, OR_OPS
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import MutableMapping, Sequence
 
     import numpy as np
     import numpy.typing as npt
@@ -99,13 +108,14 @@ class ScanPartitionPlan:
     @staticmethod
     def from_scan(ir: Scan) -> ScanPartitionPlan:
         """Extract the partitioning plan of a Scan operation."""
-        if ir.typ == "parquet":
-            # TODO: Use system info to set default blocksize
-            assert ir.config_options.executor.name == "streaming", (
-                "'in-memory' executor not supported in 'generate_ir_tasks'"
-            )
+        # TODO: Use system info to set default blocksize
+        assert ir.config_options.executor.name == "streaming", (
+            "'in-memory' executor not supported in 'generate_ir_tasks'"
+        )
 
-            blocksize: int = ir.config_options.executor.target_partition_size
+        blocksize: int = ir.config_options.executor.target_partition_size
+        file_size: float = 0
+        if ir.typ == "parquet":
             # _sample_pq_statistics is generic over the bit-width of the array
             # We don't care about that here, so we ignore it.
             stats = _sample_pq_statistics(ir)  # type: ignore[var-annotated]
@@ -113,24 +123,54 @@ class ScanPartitionPlan:
             # but not in the Parquet statistics dict. We use stats.get(column, 0)
             # to safely fall back to 0 in those cases.
             file_size = sum(float(stats.get(column, 0)) for column in ir.schema)
-            if file_size > 0:
-                if file_size > blocksize:
-                    # Split large files
-                    return ScanPartitionPlan(
-                        math.ceil(file_size / blocksize),
-                        ScanPartitionFlavor.SPLIT_FILES,
-                    )
-                else:
-                    # Fuse small files
-                    return ScanPartitionPlan(
-                        max(blocksize // int(file_size), 1),
-                        ScanPartitionFlavor.FUSED_FILES,
-                    )
+        elif ir.typ in ("csv", "ndjson"):
+            file_size = _sample_text_statistics(ir)
+
+        if file_size > 0:
+            if file_size > blocksize:
+                if not _splittable(ir):
+                    return ScanPartitionPlan(1, ScanPartitionFlavor.SINGLE_FILE)
+                # Split large files
+                return ScanPartitionPlan(
+                    math.ceil(file_size / blocksize),
+                    ScanPartitionFlavor.SPLIT_FILES,
+                )
+            else:
+                # Fuse small files
+                return ScanPartitionPlan(
+                    max(blocksize // int(file_size), 1),
+                    ScanPartitionFlavor.FUSED_FILES,
+                )
 
-        # TODO: Use file sizes for csv and json
         return ScanPartitionPlan(1, ScanPartitionFlavor.SINGLE_FILE)
 
 
+def _splittable(ir: Scan) -> bool:
+    # Check if the files of a Scan can be split into multiple partitions
+    if ir.typ == "parquet":
+        return True
+    # CSV and NDJSON files are split into byte ranges, which
+    # cannot be combined with row skipping or a row index.
+    # A quoted CSV field may contain a line terminator, in
+    # which case a byte range could start in the middle of
+    # a row, so CSV files are only split if quoting is
+    # disabled (e.g. ``pl.scan_csv(..., quote_char=None)``).
+    return (
+        ir.row_index is None
+        and ir.reader_options.get("skip_rows", 0) == 0
+        and ir.reader_options.get("skip_rows_after_header", 0) == 0
+        and (
+            ir.typ != "csv" or ir.reader_options["parse_options"]["quote_char"] is None
+        )
+    )
+
+
+def _starts_with_blank_line(path: str) -> bool:
+    # Check if a text file starts with a blank line
+    with Path(path).open() as f:
+        return f.readline() == "\n"
+
+
 class SplitScan(IR):
     """
     Input from a split file.
@@ -138,11 +178,13 @@ class SplitScan(IR):
     This class wraps a single-file `Scan` object. At
     IO/evaluation time, this class will only perform
     a partial read of the underlying file. The range
-    (skip_rows and n_rows) is calculated at IO time.
+    (skip_rows and n_rows for parquet, or a byte range
+    for CSV and NDJSON) is calculated at IO time.
     """
 
     __slots__ = (
         "base_scan",
+        "row_range",
         "schema",
         "split_index",
         "total_splits",
@@ -152,6 +194,7 @@ class SplitScan(IR):
         "base_scan",
         "split_index",
         "total_splits",
+        "row_range",
     )
     base_scan: Scan
     """Scan operation this node is based on."""
@@ -159,21 +202,34 @@ class SplitScan(IR):
     """Index of the current split."""
     total_splits: int
     """Total number of splits."""
+    row_range: tuple[int, int] | None
+    """
+    Pre-computed ``(skip_rows, n_rows)`` range of a parquet split.
+
+    If None, the range is calculated from the file metadata at IO time.
+    """
 
     def __init__(
-        self, schema: Schema, base_scan: Scan, split_index: int, total_splits: int
+        self,
+        schema: Schema,
+        base_scan: Scan,
+        split_index: int,
+        total_splits: int,
+        row_range: tuple[int, int] | None = None,
     ):
         self.schema = schema
         self.base_scan = base_scan
         self.split_index = split_index
         self.total_splits = total_splits
+        self.row_range = row_range
         self._non_child_args = (
             split_index,
             total_splits,
+            row_range,
             *base_scan._non_child_args,
         )
         self.children = ()
-        if base_scan.typ not in ("parquet",):  # pragma: no cover
+        if base_scan.typ not in ("parquet", "csv", "ndjson"):  # pragma: no cover
             raise NotImplementedError(
                 f"Unhandled Scan type for file splitting: {base_scan.typ}"
             )
@@ -183,6 +239,7 @@ class SplitScan(IR):
         cls,
         split_index: int,
         total_splits: int,
+        row_range: tuple[int, int] | None,
         schema: Schema,
         typ: str,
         reader_options: dict[str, Any],
@@ -196,50 +253,68 @@ class SplitScan(IR):
         predicate: NamedExpr | None,
     ) -> DataFrame:
         """Evaluate and return a dataframe."""
-        if typ not in ("parquet",):  # pragma: no cover
+        if typ not in ("parquet", "csv", "ndjson"):  # pragma: no cover
             raise NotImplementedError(f"Unhandled Scan type for file splitting: {typ}")
 
         if len(paths) > 1:  # pragma: no cover
             raise ValueError(f"Expected a single path, got: {paths}")
 
+        if typ in ("csv", "ndjson"):
+            # CSV and NDJSON logic:
+            # - Split the file into "total_splits" byte ranges
+            #   of (roughly) equal size.
+            # - The reader only returns the rows that start
+            #   within our byte range, so every row is read
+            #   by exactly one split.
+            # - polars skips the blank lines at the start of
+            #   a CSV file, which a byte range cannot do. If
+            #   there are any, the first split reads the whole
+            #   file, and the other splits are empty.
+            file_size = Path(paths[0]).stat().st_size
+            start = file_size * split_index // total_splits
+            end = file_size * (split_index + 1) // total_splits
+            last = split_index == (total_splits - 1)
+            # Last split should always read to end of file
+            byte_range: tuple[int, int] | None = (
+                start,
+                0 if last else max(end - start, 1),
+            )
+            whole_file = typ == "csv" and _starts_with_blank_line(paths[0])
+            if whole_file and split_index == 0:
+                byte_range = None
+            df = Scan.do_evaluate(
+                schema,
+                typ,
+                reader_options,
+                config_options,
+                paths,
+                with_columns,
+                skip_rows,
+                n_rows,
+                row_index,
+                include_file_paths,
+                predicate,
+                byte_range=byte_range,
+            )
+            if (whole_file and split_index > 0) or (end == start and not last):
+                # File is too small to give every split a byte
+                # (or is read by the first split)
+                return df.slice((0, 0))
+            return df
+
         # Parquet logic:
         # - We are one of "total_splits" SplitScan nodes
         #   assigned to the same file.
-        # - We know our index within this file ("split_index")
-        # - We can also use parquet metadata to query the
-        #   total number of rows in each row-group of the file.
-        # - We can use all this information to calculate the
-        #   "skip_rows" and "n_rows" options to use locally.
-
-        rowgroup_metadata = plc.io.parquet_metadata.read_parquet_metadata(
-            plc.io.SourceInfo(paths)
-        ).rowgroup_metadata()
-        total_row_groups = len(rowgroup_metadata)
-        if total_splits <= total_row_groups:
-            # We have enough row-groups in the file to align
-            # all "total_splits" of our reads with row-group
-            # boundaries. Calculate which row-groups to include
-            # in the current read, and use metadata to translate
-            # the row-group indices to "skip_rows" and "n_rows".
-            rg_stride = total_row_groups // total_splits
-            skip_rgs = rg_stride * split_index
-            skip_rows = sum(rg["num_rows"] for rg in rowgroup_metadata[:skip_rgs])
-            n_rows = sum(
-                rg["num_rows"]
-                for rg in rowgroup_metadata[skip_rgs : skip_rgs + rg_stride]
+        # - The "skip_rows" and "n_rows" options to use locally
+        #   are usually calculated from the (cached) file metadata
+        #   at lowering time. Otherwise, calculate them now.
+        if row_range is None:
+            row_range = _split_row_range(
+                _parquet_file_metadata(paths[0]).rowgroup_num_rows,
+                split_index,
+                total_splits,
             )
-        else:
-            # There are not enough row-groups to align
-            # all "total_splits" of our reads with row-group
-            # boundaries. Use metadata to directly calculate
-            # "skip_rows" and "n_rows" for the current read.
-            total_rows = sum(rg["num_rows"] for rg in rowgroup_metadata)
-            n_rows = total_rows // total_splits
-            skip_rows = n_rows * split_index
-
-        # Last split should always read to end of file
-        if split_index == (total_splits - 1):
-            n_rows = -1
+        skip_rows, n_rows = row_range
 
         # Perform the partial read
         return Scan.do_evaluate(
@@ -257,33 +332,428 @@ class SplitScan(IR):
         )
 
 
-def _sample_pq_statistics(ir: Scan) -> dict[str, np.floating[T]]:
-    import itertools
+class ParquetFileMetadata:
+    """Footer metadata of a single parquet file."""
+
+    __slots__ = ("column_sizes", "rowgroup_num_rows")
+    rowgroup_num_rows: tuple[int, ...]
+    """Number of rows in each row-group."""
+    column_sizes: dict[str, tuple[int, ...]]
+    """Uncompressed size of each column chunk, per row-group."""
+
+    def __init__(self, metadata: plc.io.parquet_metadata.ParquetMetadata) -> None:
+        self.rowgroup_num_rows = tuple(
+            rg["num_rows"] for rg in metadata.rowgroup_metadata()
+        )
+        self.column_sizes = {
+            name: tuple(sizes)
+            for name, sizes in metadata.columnchunk_metadata().items()
+        }
+
+
+# Maximum number of files in the parquet metadata cache
+PARQUET_METADATA_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=PARQUET_METADATA_CACHE_SIZE)
+def _cached_parquet_file_metadata(
+    path: str, size: int, mtime_ns: int
+) -> ParquetFileMetadata:
+    # The file size and modification time are part of the
+    # cache key, so that modified files are read again.
+    return ParquetFileMetadata(
+        plc.io.parquet_metadata.read_parquet_metadata(plc.io.SourceInfo([path]))
+    )
+
+
+@functools.lru_cache(maxsize=PARQUET_METADATA_CACHE_SIZE)
+def _cached_parquet_file_statistics(
+    path: str, size: int, mtime_ns: int
+) -> tuple[dict[str, tuple[Any, Any]], ...]:
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_metadata(path)
+    statistics = []
+    for i in range(metadata.num_row_groups):
+        rg = metadata.row_group(i)
+        rg_statistics = {}
+        for j in range(rg.num_columns):
+            column = rg.column(j)
+            stats = column.statistics
+            # Only use statistics of top-level (non-nested) columns
+            if (
+                "." not in column.path_in_schema
+                and stats is not None
+                and stats.has_min_max
+            ):
+                rg_statistics[column.path_in_schema] = (stats.min, stats.max)
+        statistics.append(rg_statistics)
+    return tuple(statistics)
+
+
+def _file_cache_key(path: str) -> tuple[str, int, int] | None:
+    # Cache key of a local file (or None if the file cannot be stat'ed).
+    # Remote files (e.g. ``s3://bucket/file``) are not identified, since
+    # that would cost a round trip for every lookup, and would need the
+    # credentials of the Scan.
+    if "://" in str(path):
+        return None
+    try:
+        stat = Path(path).stat()
+    except (OSError, TypeError):  # pragma: no cover; Unusual path
+        return None
+    return str(path), stat.st_size, stat.st_mtime_ns
+
+
+def _parquet_file_metadata(path: str) -> ParquetFileMetadata:
+    """
+    Return the footer metadata of a parquet file.
+
+    Parameters
+    ----------
+    path
+        Path of the parquet file.
+
+    Returns
+    -------
+    The file metadata.
+
+    Notes
+    -----
+    Metadata of local files is cached for the whole process,
+    and shared between query planning and all ``SplitScan``
+    tasks. Use ``_cached_parquet_file_metadata.cache_clear()``
+    to clear the cache.
+    """
+    key = _file_cache_key(path)
+    if key is None:  # pragma: no cover
+        return ParquetFileMetadata(
+            plc.io.parquet_metadata.read_parquet_metadata(plc.io.SourceInfo([path]))
+        )
+    return _cached_parquet_file_metadata(*key)
+
+
+def _parquet_file_statistics(path: str) -> tuple[dict[str, tuple[Any, Any]], ...]:
+    """
+    Return the min/max statistics of a parquet file.
+
+    Parameters
+    ----------
+    path
+        Path of the parquet file.
 
+    Returns
+    -------
+    A ``{column: (min, max)}`` dictionary for each row-group.
+    Columns without statistics are omitted.
+
+    Notes
+    -----
+    Statistics of local files are cached like the footer
+    metadata returned by :func:`_parquet_file_metadata`.
+    """
+    key = _file_cache_key(path)
+    if key is None:  # pragma: no cover
+        return _cached_parquet_file_statistics.__wrapped__(path, 0, 0)
+    return _cached_parquet_file_statistics(*key)
+
+
+def _compare_may_match(
+    op: plc.binaryop.BinaryOperator, lo: Any, hi: Any, value: Any
+) -> bool:
+    # Check if any value in [lo, hi] may satisfy "<value> op <literal>".
+    # Floating-point columns are never pruned, because NaN values
+    # are not included in the parquet statistics.
+    if value is None or isinstance(value, float):
+        return True
+    if type(lo) is not type(value) or type(hi) is not type(value):
+        return True
+    try:
+        if op == plc.binaryop.BinaryOperator.EQUAL:
+            return bool(lo <= value <= hi)
+        elif op == plc.binaryop.BinaryOperator.NOT_EQUAL:
+            return not (lo == value == hi)
+        elif op == plc.binaryop.BinaryOperator.LESS:
+            return bool(lo < value)
+        elif op == plc.binaryop.BinaryOperator.LESS_EQUAL:
+            return bool(lo <= value)
+        elif op == plc.binaryop.BinaryOperator.GREATER:
+            return bool(hi > value)
+        elif op == plc.binaryop.BinaryOperator.GREATER_EQUAL:
+            return bool(hi >= value)
+    except TypeError:  # pragma: no cover; Incomparable values
+        return True
+    return True  # pragma: no cover
+
+
+def _may_match(node: expr.Expr, statistics: dict[str, tuple[Any, Any]]) -> bool:
+    """
+    Check if a row-group may contain rows matching a predicate.
+
+    Parameters
+    ----------
+    node
+        Predicate expression.
+    statistics
+        ``{column: (min, max)}`` statistics of the row-group.
+
+    Returns
+    -------
+    False if the statistics rule out every row of the
+    row-group, otherwise True.
+    """
+    if isinstance(node, expr.BinOp):
+        left, right = node.children
+        if node.op in AND_OPS:
+            return _may_match(left, statistics) and _may_match(right, statistics)
+        elif node.op in OR_OPS:
+            return _may_match(left, statistics) or _may_match(right, statistics)
+        elif node.op in REVERSED_COMPARISON:
+            op = node.op
+            if isinstance(left, expr.Literal) and isinstance(right, expr.Col):
+                left, right = right, left
+                op = REVERSED_COMPARISON[op]
+            if (
+                isinstance(left, expr.Col)
+                and isinstance(right, expr.Literal)
+                and left.name in statistics
+            ):
+                return _compare_may_match(
+                    op, *statistics[left.name], right.value.as_py()
+                )
+    elif (
+        isinstance(node, expr.BooleanFunction)
+        and node.name is expr.BooleanFunction.Name.IsIn
+    ):
+        needles, haystack = node.children
+        if (
+            isinstance(needles, expr.Col)
+            and isinstance(haystack, expr.LiteralColumn)
+            and needles.name in statistics
+        ):
+            return any(
+                _compare_may_match(
+                    plc.binaryop.BinaryOperator.EQUAL,
+                    *statistics[needles.name],
+                    value,
+                )
+                for value in haystack.value.to_pylist()
+            )
+    return True
+
+
+def _prune_parquet_row_groups(ir: Scan) -> dict[str, tuple[bool, ...]] | None:
+    """
+    Prune the row-groups of a parquet Scan using its predicate.
+
+    Parameters
+    ----------
+    ir
+        The parquet Scan operation.
+
+    Returns
+    -------
+    A mapping from each path to a tuple that is False for
+    every row-group whose min/max statistics rule out the
+    predicate, or None if the Scan cannot be pruned.
+
+    Notes
+    -----
+    A file is pruned if all of its row-groups are pruned.
+    The predicate is still applied when the remaining data
+    is read, so pruning only needs to be conservative.
+    Files that cannot be cached (e.g. remote files) are
+    not pruned, so that query planning never reads them
+    without the credentials in ``ir.cloud_options``.
+    """
+    if ir.typ != "parquet" or ir.predicate is None or ir.row_index is not None:
+        return None
+    if any(_file_cache_key(path) is None for path in ir.paths):
+        return None
+    try:
+        # Read the footers concurrently
+        with ThreadPoolExecutor() as executor:
+            file_statistics = list(executor.map(_parquet_file_statistics, ir.paths))
+    except (OSError, ValueError):
+        # Unreadable footer, let the reader raise
+        return None
+    predicate = ir.predicate.value
+    return {
+        path: tuple(_may_match(predicate, statistics) for statistics in rg_statistics)
+        for path, rg_statistics in zip(ir.paths, file_statistics, strict=True)
+    }
+
+
+def _split_row_range(
+    rowgroup_num_rows: Sequence[int], split_index: int, total_splits: int
+) -> tuple[int, int]:
+    """
+    Calculate the rows to read for a split of a parquet file.
+
+    Parameters
+    ----------
+    rowgroup_num_rows
+        Number of rows in each row-group of the file.
+    split_index
+        Index of the current split.
+    total_splits
+        Total number of splits of the file.
+
+    Returns
+    -------
+    The ``(skip_rows, n_rows)`` range to read. The last split
+    always reads to the end of the file (``n_rows == -1``).
+    """
+    total_row_groups = len(rowgroup_num_rows)
+    if total_splits <= total_row_groups:
+        # We have enough row-groups in the file to align
+        # all "total_splits" of our reads with row-group
+        # boundaries. Calculate which row-groups to include
+        # in the current read, and use metadata to translate
+        # the row-group indices to "skip_rows" and "n_rows".
+        rg_stride = total_row_groups // total_splits
+        skip_rgs = rg_stride * split_index
+        skip_rows = sum(rowgroup_num_rows[:skip_rgs])
+        n_rows = sum(rowgroup_num_rows[skip_rgs : skip_rgs + rg_stride])
+    else:
+        # There are not enough row-groups to align
+        # all "total_splits" of our reads with row-group
+        # boundaries. Use metadata to directly calculate
+        # "skip_rows" and "n_rows" for the current read.
+        total_rows = sum(rowgroup_num_rows)
+        n_rows = total_rows // total_splits
+        skip_rows = n_rows * split_index
+
+    # Last split should always read to end of file
+    if split_index == (total_splits - 1):
+        n_rows = -1
+
+    return skip_rows, n_rows
+
+
+def _split_row_ranges(
+    rowgroup_num_rows: Sequence[int],
+    total_splits: int,
+    keep: Sequence[bool] | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Calculate the rows to read for every split of a parquet file.
+
+    Parameters
+    ----------
+    rowgroup_num_rows
+        Number of rows in each row-group of the file.
+    total_splits
+        Target number of splits of the file.
+    keep
+        Whether each row-group needs to be read. If None,
+        all row-groups are read.
+
+    Returns
+    -------
+    The ``(skip_rows, n_rows)`` range of each split. If some
+    row-groups are pruned, the remaining row-groups are split
+    into (at most) ``total_splits`` contiguous row ranges.
+    """
+    if keep is None or all(keep):
+        return [
+            _split_row_range(rowgroup_num_rows, split_index, total_splits)
+            for split_index in range(total_splits)
+        ]
+    offsets = [0, *itertools.accumulate(rowgroup_num_rows)]
+    kept = [i for i, k in enumerate(keep) if k]
+    total_splits = min(total_splits, len(kept))
+    rg_stride = len(kept) // total_splits if total_splits else 0
+    ranges = []
+    for split_index in range(total_splits):
+        rgs = (
+            kept[split_index * rg_stride :]
+            if split_index == total_splits - 1
+            else kept[split_index * rg_stride : (split_index + 1) * rg_stride]
+        )
+        # Pruned row-groups between rgs[0] and rgs[-1] are still
+        # read, but filtered out by the predicate.
+        ranges.append((offsets[rgs[0]], offsets[rgs[-1] + 1] - offsets[rgs[0]]))
+    return ranges
+
+
+def _sample_pq_statistics(ir: Scan) -> dict[str, np.floating[T]]:
     import numpy as np
 
     # Use average total_uncompressed_size of three files
     n_sample = min(3, len(ir.paths))
-    metadata = plc.io.parquet_metadata.read_parquet_metadata(
-        plc.io.SourceInfo(random.sample(ir.paths, n_sample))
-    )
-    column_sizes = {}
-    rowgroup_offsets_per_file = np.insert(
-        np.cumsum(metadata.num_rowgroups_per_file()), 0, 0
-    )
+    column_sizes: defaultdict[str, list[int]] = defaultdict(list)
 
     # For each column, calculate the `total_uncompressed_size` for each file
-    for name, uncompressed_sizes in metadata.columnchunk_metadata().items():
-        column_sizes[name] = np.array(
-            [
-                np.sum(uncompressed_sizes[start:end])
-                for (start, end) in itertools.pairwise(rowgroup_offsets_per_file)
-            ],
-            dtype="int64",
-        )
+    for path in random.sample(ir.paths, n_sample):
+        for name, sizes in _parquet_file_metadata(path).column_sizes.items():
+            column_sizes[name].append(sum(sizes))
 
     # Return the mean per-file `total_uncompressed_size` for each column
-    return {name: np.mean(sizes) for name, sizes in column_sizes.items()}
+    return {
+        name: np.mean(np.array(sizes, dtype="int64"))
+        for name, sizes in column_sizes.items()
+    }
+
+
+def _sample_text_statistics(ir: Scan, *, sample_size: int = 64 * 1024) -> float:
+    """
+    Estimate the mean in-memory size of a CSV or NDJSON file.
+
+    Parameters
+    ----------
+    ir
+        The CSV or NDJSON Scan operation.
+    sample_size
+        Number of bytes to sample from the start of each file.
+
+    Returns
+    -------
+    The estimated mean in-memory size (in bytes) of the
+    projected columns of each file, or ``0`` if the files
+    cannot be sampled.
+
+    Notes
+    -----
+    We sample the start of (up to) three files to estimate
+    the number of bytes per row, and use the file sizes to
+    estimate the number of rows in each file. Fixed-width
+    columns are assumed to use their device size, while
+    other columns (e.g. strings) are assumed to use their
+    share of the text representation of each row.
+    """
+    n_sample = min(3, len(ir.paths))
+    estimates = []
+    for path in random.sample(ir.paths, n_sample):
+        try:
+            file_size = Path(path).stat().st_size
+            with Path(path).open("rb") as f:
+                head = f.read(sample_size)
+        except (OSError, TypeError):  # pragma: no cover; Remote or unusual path
+            return 0
+        lines = [line for line in head.splitlines() if line.strip()]
+        if len(head) == sample_size:
+            # The last line may be incomplete
+            lines = lines[:-1]
+        if ir.typ == "csv":
+            if not lines:
+                continue
+            header, *lines = lines
+            sep = ir.reader_options["parse_options"]["separator"]
+            n_columns = header.count(sep) + 1
+        else:
+            n_columns = max(len(ir.schema), 1)
+        if not lines:
+            continue
+        bytes_per_row = sum(len(line) + 1 for line in lines) / len(lines)
+        row_size = sum(
+            plc.types.size_of(dtype)
+            if plc.traits.is_fixed_width(dtype)
+            else bytes_per_row / n_columns + 4  # Assume 4-byte offsets
+            for dtype in ir.schema.values()
+        )
+        estimates.append(file_size / bytes_per_row * row_size)
+    return statistics.mean(estimates) if estimates else 0
 
 
 @lower_ir_node.register(Scan)
@@ -294,6 +764,14 @@ def _(
     if ir.typ in ("csv", "parquet", "ndjson") and ir.n_rows == -1 and ir.skip_rows == 0:
         plan = ScanPartitionPlan.from_scan(ir)
         paths = list(ir.paths)
+        # Drop files and row-groups ruled out by the predicate
+        keep = _prune_parquet_row_groups(ir)
+        if keep is not None:
+            # Always read at least one file, to produce the
+            # correct (empty) result if all files are pruned
+            paths = [path for path in paths if any(keep[path])] or paths[:1]
+            if not any(keep[paths[0]]):
+                keep = None
         if plan.flavor == ScanPartitionFlavor.SPLIT_FILES:
             # Disable chunked reader when splitting files
             config_options = dataclasses.replace(
@@ -319,10 +797,29 @@ def _(
                     ir.include_file_paths,
                     ir.predicate,
                 )
-                slices.extend(
-                    SplitScan(ir.schema, base_scan, sindex, plan.factor)
-                    for sindex in range(plan.factor)
-                )
+                if ir.typ == "parquet":
+                    # Calculate the row range of each split once,
+                    # rather than in every SplitScan task
+                    row_ranges = _split_row_ranges(
+                        _parquet_file_metadata(path).rowgroup_num_rows,
+                        plan.factor,
+                        None if keep is None else keep[path],
+                    )
+                    slices.extend(
+                        SplitScan(
+                            ir.schema,
+                            base_scan,
+                            sindex,
+                            len(row_ranges),
+                            row_range,
+                        )
+                        for sindex, row_range in enumerate(row_ranges)
+                    )
+                else:
+                    slices.extend(
+                        SplitScan(ir.schema, base_scan, sindex, plan.factor)
+                        for sindex in range(plan.factor)
+                    )
             new_node = Union(ir.schema, None, *slices)
             partition_info = {slice: PartitionInfo(count=1) for slice in slices} | {
                 new_node: PartitionInfo(count=len(slices))
@@ -8,19 +8,35 @@ import operator
 from functools import reduce
 from typing import TYPE_CHECKING, Any
 
+import pyarrow as pa
+
+import pylibcudf as plc
+
+from cudf_polars.containers import DataFrame
 from cudf_polars.dsl.ir import ConditionalJoin, Join
 from cudf_polars.experimental.base import PartitionInfo, get_key_name
+from cudf_polars.experimental.cardinality import find_hot_keys
 from cudf_polars.experimental.dispatch import generate_ir_tasks, lower_ir_node
 from cudf_polars.experimental.repartition import Repartition
-from cudf_polars.experimental.shuffle import Shuffle, _partition_dataframe
-from cudf_polars.experimental.utils import _concat, _fallback_inform, _lower_ir_fallback
+from cudf_polars.experimental.shuffle import (
+    Shuffle,
+    _partition_dataframe,
+    _task_shuffle,
+)
+from cudf_polars.experimental.utils import (
+    _concat,
+    _fallback_inform,
+    _lower_ir_fallback,
+    _sizeof,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import MutableMapping, Sequence
 
     from cudf_polars.dsl.expr import NamedExpr
     from cudf_polars.dsl.ir import IR
     from cudf_polars.experimental.parallel import LowerIRTransformer
+    from cudf_polars.typing import Schema
     from cudf_polars.utils.config import ConfigOptions
 
 
@@ -94,20 +110,19 @@ def _make_hash_join(
     return ir, partition_info
 
 
-def _should_bcast_join(
+def _bcast_join_supported(
     ir: Join,
     left: IR,
     right: IR,
     partition_info: MutableMapping[IR, PartitionInfo],
     output_count: int,
 ) -> bool:
-    # Decide if a broadcast join is appropriate.
+    # Check if a broadcast join is compatible with the join
+    # "kind" and the partitioning of the "large" table.
     if partition_info[left].count >= partition_info[right].count:
-        small_count = partition_info[right].count
         large = left
         large_on = ir.left_on
     else:
-        small_count = partition_info[left].count
         large = right
         large_on = ir.right_on
 
@@ -117,6 +132,23 @@ def _should_bcast_join(
         and partition_info[large].count == output_count
     )
 
+    return not large_shuffled and (
+        ir.options[0] == "Inner"
+        or (ir.options[0] in ("Left", "Semi", "Anti") and large == left)
+        or (ir.options[0] == "Right" and large == right)
+    )
+
+
+def _should_bcast_join(
+    ir: Join,
+    left: IR,
+    right: IR,
+    partition_info: MutableMapping[IR, PartitionInfo],
+    output_count: int,
+) -> bool:
+    # Decide if a broadcast join is appropriate.
+    small_count = min(partition_info[left].count, partition_info[right].count)
+
     # Broadcast-Join Criteria:
     # 1. Large dataframe isn't already shuffled
     # 2. Small dataframe has 8 partitions (or fewer).
@@ -127,14 +159,31 @@ def _should_bcast_join(
         "'in-memory' executor not supported in 'generate_ir_tasks'"
     )
 
+    return small_count <= ir.config_options.executor.broadcast_join_limit and (
+        _bcast_join_supported(ir, left, right, partition_info, output_count)
+    )
+
+
+def _should_adaptive_join(
+    ir: Join,
+    left: IR,
+    right: IR,
+    partition_info: MutableMapping[IR, PartitionInfo],
+    output_count: int,
+) -> bool:
+    # Decide if the choice between a broadcast and a hash
+    # join should be deferred until the size of the smaller
+    # table is known. The hash join of an adaptive join
+    # partitions its inputs in tasks, so we don't defer the
+    # choice if the Shuffle nodes would use rapidsmpf.
+    assert ir.config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in 'generate_ir_tasks'"
+    )
     return (
-        not large_shuffled
-        and small_count <= ir.config_options.executor.broadcast_join_limit
-        and (
-            ir.options[0] == "Inner"
-            or (ir.options[0] in ("Left", "Semi", "Anti") and large == left)
-            or (ir.options[0] == "Right" and large == right)
-        )
+        ir.config_options.executor.adaptive_join
+        and _task_shuffle(ir.config_options)
+        and ir.options[2] is None
+        and _bcast_join_supported(ir, left, right, partition_info, output_count)
     )
 
 
@@ -184,6 +233,316 @@ def _make_bcast_join(
     return new_node, partition_info
 
 
+class AdaptiveJoin(Join):
+    """
+    A multi-partition join with a runtime join strategy.
+
+    Notes
+    -----
+    The smaller table (the child with fewer partitions) is
+    computed first. If its total size is small enough, it is
+    broadcast to every partition of the larger table. Otherwise,
+    both tables are hash-partitioned on the join keys. The
+    output partitioning is unknown at lowering time.
+    """
+
+    __slots__ = ()
+
+
+def _use_bcast_join(limit: int, *small: DataFrame) -> bool:
+    # Decide (at runtime) if the small table should be broadcast
+    return sum(_sizeof(df) for df in small) <= limit
+
+
+def _adaptive_partition(
+    df: DataFrame,
+    bcast: bool,  # noqa: FBT001
+    on: tuple[NamedExpr, ...],
+    count: int,
+    index: int | None,
+) -> dict[int, DataFrame | None]:
+    """
+    Partition an input DataFrame of an adaptive join.
+
+    Parameters
+    ----------
+    df
+        DataFrame to partition.
+    bcast
+        Whether the join is a broadcast join.
+    on
+        Join keys of ``df``.
+    count
+        Number of output partitions.
+    index
+        Partition index of ``df`` in the large table, or
+        None for the small table.
+
+    Returns
+    -------
+    A dictionary mapping between int partition indices and
+    DataFrame fragments. For a broadcast join, partition
+    ``index`` of the large table is passed through unchanged,
+    and the fragments of the small table are None (the
+    concatenated small table is used instead).
+    """
+    if not bcast:
+        return _partition_dataframe(df, on, count)  # type: ignore[return-value]
+    elif index is None:
+        return dict.fromkeys(range(count))
+    return {i: df if i == index else df.slice((0, 0)) for i in range(count)}
+
+
+def _bcast_table(bcast: bool, *small: DataFrame) -> DataFrame | None:  # noqa: FBT001
+    # Concatenate the small table of a broadcast join
+    return _concat(*small) if bcast else None
+
+
+def _adaptive_join(
+    left_on: tuple[NamedExpr, ...],
+    right_on: tuple[NamedExpr, ...],
+    options: Any,
+    small_side: str,
+    large_count: int,
+    small_table: DataFrame | None,
+    *pieces: DataFrame | None,
+) -> DataFrame:
+    """
+    Join a single output partition of an adaptive join.
+
+    Parameters
+    ----------
+    left_on
+        Left join keys.
+    right_on
+        Right join keys.
+    options
+        Join options.
+    small_side
+        Which side (``"Left"`` or ``"Right"``) is small.
+    large_count
+        Number of large-table fragments in ``pieces``.
+    small_table
+        Concatenated small table of a broadcast join (or None
+        for a hash join).
+    pieces
+        Large-table fragments followed by small-table fragments.
+
+    Returns
+    -------
+    The joined output partition.
+    """
+    # Skip empty fragments, so that a broadcast join
+    # does not copy the large-table partition
+    large_pieces = [df for df in pieces[:large_count] if df is not None]
+    large = [df for df in large_pieces if df.num_rows > 0] or large_pieces[:1]
+    large_df = large[0] if len(large) == 1 else _concat(*large)
+    small_df = (
+        small_table
+        if small_table is not None
+        else _concat(*(df for df in pieces[large_count:] if df is not None))
+    )
+    if small_side == "Left":
+        return Join.do_evaluate(left_on, right_on, options, small_df, large_df)
+    return Join.do_evaluate(left_on, right_on, options, large_df, small_df)
+
+
+def _make_adaptive_join(
+    ir: Join,
+    output_count: int,
+    partition_info: MutableMapping[IR, PartitionInfo],
+    left: IR,
+    right: IR,
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
+    new_node = AdaptiveJoin(
+        ir.schema,
+        ir.left_on,
+        ir.right_on,
+        ir.options,
+        ir.config_options,
+        left,
+        right,
+    )
+    partition_info[new_node] = PartitionInfo(count=output_count)
+    return new_node, partition_info
+
+
+class SaltedJoin(Join):
+    """
+    A multi-partition hash join with skewed join keys.
+
+    Notes
+    -----
+    The rows of the larger table (the child with more partitions)
+    with a "hot" join key are spread evenly over all output
+    partitions, rather than being sent to the single partition
+    selected by the key hash. The rows of the smaller table with
+    a hot key are copied to every output partition. All other
+    rows are hash-partitioned on the join keys. This is only
+    valid for joins that do not preserve the unmatched rows of
+    the smaller table.
+    """
+
+    __slots__ = ("hot_keys",)
+    _non_child = (*Join._non_child, "hot_keys")
+    hot_keys: tuple[tuple[Any, ...], ...]
+    """Values of the hot join keys of the larger table."""
+
+    def __init__(
+        self,
+        schema: Schema,
+        left_on: Sequence[NamedExpr],
+        right_on: Sequence[NamedExpr],
+        options: Any,
+        config_options: ConfigOptions,
+        hot_keys: tuple[tuple[Any, ...], ...],
+        left: IR,
+        right: IR,
+    ):
+        super().__init__(
+            schema, left_on, right_on, options, config_options, left, right
+        )
+        self.hot_keys = hot_keys
+
+
+def _hot_key_table(
+    on: tuple[NamedExpr, ...], hot_keys: tuple[tuple[Any, ...], ...]
+) -> DataFrame:
+    # The values of the hot join keys of a salted join,
+    # with the names and dtypes of the join keys `on`
+    return DataFrame.from_table(
+        plc.Table(
+            [
+                plc.interop.from_arrow(
+                    pa.array(
+                        [key[i] for key in hot_keys],
+                        type=plc.interop.to_arrow(e.value.dtype),
+                    )
+                )
+                for i, e in enumerate(on)
+            ]
+        ),
+        [e.name for e in on],
+    )
+
+
+def _salted_partition(
+    df: DataFrame,
+    on: tuple[NamedExpr, ...],
+    hot_table: DataFrame,
+    count: int,
+    replicate: bool,  # noqa: FBT001
+) -> dict[int, DataFrame]:
+    """
+    Partition an input DataFrame of a salted join.
+
+    Parameters
+    ----------
+    df
+        DataFrame to partition.
+    on
+        Join keys of ``df``.
+    hot_table
+        Values of the hot join keys (see ``_hot_key_table``).
+    count
+        Number of output partitions.
+    replicate
+        Whether to copy the rows with a hot key to every
+        output partition (for the smaller table), rather
+        than splitting them evenly (for the larger table).
+
+    Returns
+    -------
+    A dictionary mapping between int partition indices and
+    DataFrame fragments.
+    """
+    keys = plc.Table([e.evaluate(df).obj for e in on])
+    hot, cold = (
+        DataFrame.from_table(
+            plc.copying.gather(
+                df.table,
+                join_fn(keys, hot_table.table, plc.types.NullEquality.EQUAL),
+                plc.copying.OutOfBoundsPolicy.DONT_CHECK,
+            ),
+            df.column_names,
+        )
+        for join_fn in (plc.join.left_semi_join, plc.join.left_anti_join)
+    )
+    parts = _partition_dataframe(cold, on, count)
+    if hot.num_rows == 0:
+        return parts
+    if replicate:
+        return {i: _concat(part, hot) for i, part in parts.items()}
+    offsets = [hot.num_rows * i // count for i in range(count + 1)]
+    return {
+        i: _concat(part, hot.slice((offsets[i], offsets[i + 1] - offsets[i])))
+        for i, part in parts.items()
+    }
+
+
+def _salted_join_supported(
+    ir: Join,
+    left: IR,
+    right: IR,
+    partition_info: MutableMapping[IR, PartitionInfo],
+) -> bool:
+    # Check if a salted join is compatible with the join "kind".
+    # The unmatched rows of the smaller table cannot be preserved,
+    # because its hot rows are copied to every output partition.
+    large_is_left = partition_info[left].count >= partition_info[right].count
+    return ir.options[2] is None and (
+        ir.options[0] == "Inner"
+        or (ir.options[0] in ("Left", "Semi", "Anti") and large_is_left)
+        or (ir.options[0] == "Right" and not large_is_left)
+    )
+
+
+def _make_salted_join(
+    ir: Join,
+    output_count: int,
+    partition_info: MutableMapping[IR, PartitionInfo],
+    left: IR,
+    right: IR,
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]] | None:
+    # Create a salted join if the larger table has hot keys.
+    # The inputs of a salted join are partitioned in tasks,
+    # so we don't use one if the Shuffle nodes would use
+    # rapidsmpf.
+    assert ir.config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in '_make_salted_join'"
+    )
+    if not _task_shuffle(ir.config_options):
+        return None
+    if partition_info[left].count >= partition_info[right].count:
+        large, large_on = left, ir.left_on
+    else:
+        large, large_on = right, ir.right_on
+    if partition_info[large].partitioned_on == large_on:
+        # Already shuffled
+        return None
+    hot_keys = find_hot_keys(
+        large,
+        large_on,
+        ir.config_options.executor.skew_join_threshold / output_count,
+        partition_info,
+        ir.config_options,
+    )
+    if not hot_keys:
+        return None
+    new_node = SaltedJoin(
+        ir.schema,
+        ir.left_on,
+        ir.right_on,
+        ir.options,
+        ir.config_options,
+        hot_keys,
+        left,
+        right,
+    )
+    partition_info[new_node] = PartitionInfo(count=output_count)
+    return new_node, partition_info
+
+
 @lower_ir_node.register(ConditionalJoin)
 def _(
     ir: ConditionalJoin, rec: LowerIRTransformer
@@ -250,6 +609,31 @@ def _(
             left,
             right,
         )
+    elif _should_adaptive_join(ir, left, right, partition_info, output_count):
+        # Choose between a broadcast and a hash join at runtime
+        return _make_adaptive_join(
+            ir,
+            output_count,
+            partition_info,
+            left,
+            right,
+        )
+    elif (
+        ir.config_options.executor.skew_join_threshold > 0
+        and _salted_join_supported(ir, left, right, partition_info)
+        and (
+            salted := _make_salted_join(
+                ir,
+                output_count,
+                partition_info,
+                left,
+                right,
+            )
+        )
+        is not None
+    ):
+        # Spread the hot keys of the larger table
+        return salted
     else:
         # Create a hash join
         return _make_hash_join(
@@ -351,3 +735,141 @@ def _(
                 graph[(out_name, part_out)] = (_concat, *_concat_list)
 
         return graph
+
+
+@generate_ir_tasks.register(AdaptiveJoin)
+def _(
+    ir: AdaptiveJoin, partition_info: MutableMapping[IR, PartitionInfo]
+) -> MutableMapping[Any, Any]:
+    assert ir.config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in 'generate_ir_tasks'"
+    )
+    left, right = ir.children
+    if partition_info[left].count >= partition_info[right].count:
+        small_side = "Right"
+        small, small_on = right, ir.right_on
+        large, large_on = left, ir.left_on
+    else:
+        small_side = "Left"
+        small, small_on = left, ir.left_on
+        large, large_on = right, ir.right_on
+    small_name = get_key_name(small)
+    small_count = partition_info[small].count
+    large_name = get_key_name(large)
+    large_count = partition_info[large].count
+
+    out_name = get_key_name(ir)
+    out_count = partition_info[ir].count
+    bcast_key = (f"bcast-{out_name}", 0)
+    table_key = (f"table-{out_name}", 0)
+    split_large_name = f"split_large-{out_name}"
+    split_small_name = f"split_small-{out_name}"
+    small_keys = [(small_name, j) for j in range(small_count)]
+
+    executor = ir.config_options.executor
+    limit = executor.broadcast_join_limit * executor.target_partition_size
+    graph: MutableMapping[Any, Any] = {
+        bcast_key: (_use_bcast_join, limit, *small_keys),
+        table_key: (_bcast_table, bcast_key, *small_keys),
+    }
+    for i in range(large_count):
+        graph[(split_large_name, i)] = (
+            _adaptive_partition,
+            (large_name, i),
+            bcast_key,
+            large_on,
+            out_count,
+            i,
+        )
+    for j, small_key in enumerate(small_keys):
+        graph[(split_small_name, j)] = (
+            _adaptive_partition,
+            small_key,
+            bcast_key,
+            small_on,
+            out_count,
+            None,
+        )
+    for part_out in range(out_count):
+        pieces = []
+        for split_name, count in (
+            (split_large_name, large_count),
+            (split_small_name, small_count),
+        ):
+            inter_name = split_name.replace("split", "inter", 1)
+            for part_in in range(count):
+                pieces.append((inter_name, part_out, part_in))
+                graph[pieces[-1]] = (
+                    operator.getitem,
+                    (split_name, part_in),
+                    part_out,
+                )
+        graph[(out_name, part_out)] = (
+            _adaptive_join,
+            ir.left_on,
+            ir.right_on,
+            ir.options,
+            small_side,
+            large_count,
+            table_key,
+            *pieces,
+        )
+    return graph
+
+
+@generate_ir_tasks.register(SaltedJoin)
+def _(
+    ir: SaltedJoin, partition_info: MutableMapping[IR, PartitionInfo]
+) -> MutableMapping[Any, Any]:
+    left, right = ir.children
+    if partition_info[left].count >= partition_info[right].count:
+        small_side = "Right"
+        small, small_on = right, ir.right_on
+        large, large_on = left, ir.left_on
+    else:
+        small_side = "Left"
+        small, small_on = left, ir.left_on
+        large, large_on = right, ir.right_on
+    large_count = partition_info[large].count
+
+    out_name = get_key_name(ir)
+    out_count = partition_info[ir].count
+    graph: MutableMapping[Any, Any] = {}
+    pieces: list[list[tuple[str, int, int]]] = [[] for _ in range(out_count)]
+    for child, on, replicate, prefix in (
+        (large, large_on, False, "large"),
+        (small, small_on, True, "small"),
+    ):
+        child_name = get_key_name(child)
+        split_name = f"split_{prefix}-{out_name}"
+        inter_name = f"inter_{prefix}-{out_name}"
+        # Build the table of hot keys once, rather than in every task
+        hot_table = _hot_key_table(on, ir.hot_keys)
+        for part_in in range(partition_info[child].count):
+            graph[(split_name, part_in)] = (
+                _salted_partition,
+                (child_name, part_in),
+                on,
+                hot_table,
+                out_count,
+                replicate,
+            )
+            for part_out in range(out_count):
+                pieces[part_out].append((inter_name, part_out, part_in))
+                graph[pieces[part_out][-1]] = (
+                    operator.getitem,
+                    (split_name, part_in),
+                    part_out,
+                )
+    for part_out in range(out_count):
+        graph[(out_name, part_out)] = (
+            _adaptive_join,
+            ir.left_on,
+            ir.right_on,
+            ir.options,
+            small_side,
+            large_count,
+            None,
+            *pieces[part_out],
+        )
+    return graph
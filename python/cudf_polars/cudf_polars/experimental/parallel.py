@@ -10,16 +10,18 @@ from functools import partial, reduce
 from typing import TYPE_CHECKING, Any
 
 import cudf_polars.experimental.distinct
+import cudf_polars.experimental.filter
 import cudf_polars.experimental.groupby
 import cudf_polars.experimental.io
 import cudf_polars.experimental.join
 import cudf_polars.experimental.select
 import cudf_polars.experimental.shuffle
+import cudf_polars.experimental.sink
+import cudf_polars.experimental.slice
 import cudf_polars.experimental.sort  # noqa: F401
 from cudf_polars.dsl.ir import (
     IR,
     Cache,
-    Filter,
     HConcat,
     HStack,
     MapFunction,
@@ -41,6 +43,7 @@ if TYPE_CHECKING:
     from cudf_polars.containers import DataFrame
     from cudf_polars.experimental.dispatch import LowerIRTransformer
     from cudf_polars.utils.config import ConfigOptions
+    from cudf_polars.utils.timer import Timer
 
 
 @lower_ir_node.register(IR)
@@ -129,6 +132,15 @@ def task_graph(
         return graph, (key_name, 0)
 
 
+def _set_device(device: int) -> None:
+    # Make `device` the active device of the calling thread
+    from cuda.bindings import runtime
+
+    (ret,) = runtime.cudaSetDevice(device)
+    if ret.value != 0:  # pragma: no cover
+        raise RuntimeError(f"Unable to set the current device to {device}")
+
+
 # The true type signature for get_scheduler() needs an overload. Not worth it.
 
 
@@ -155,6 +167,21 @@ def get_scheduler(config_options: ConfigOptions) -> Any:
         from cudf_polars.experimental.scheduler import synchronous_scheduler
 
         return synchronous_scheduler
+    elif scheduler == "threads":
+        from cuda.bindings import runtime
+
+        from cudf_polars.experimental.scheduler import threaded_scheduler
+
+        # Worker threads must execute on the device that
+        # is active for the calling thread.
+        ret, device = runtime.cudaGetDevice()
+        if ret.value != 0:  # pragma: no cover
+            raise RuntimeError("Unable to get the current device")
+        return partial(
+            threaded_scheduler,
+            max_workers=config_options.executor.max_workers,
+            initializer=partial(_set_device, device),
+        )
     else:  # pragma: no cover
         raise ValueError(f"{scheduler} not a supported scheduler option.")
 
@@ -194,7 +221,9 @@ def post_process_task_graph(
     return graph
 
 
-def evaluate_streaming(ir: IR, config_options: ConfigOptions) -> DataFrame:
+def evaluate_streaming(
+    ir: IR, config_options: ConfigOptions, *, timer: Timer | None = None
+) -> DataFrame:
     """
     Evaluate an IR graph with partitioning.
 
@@ -204,10 +233,18 @@ def evaluate_streaming(ir: IR, config_options: ConfigOptions) -> DataFrame:
         Logical plan to evaluate.
     config_options
         GPUEngine configuration options.
+    timer
+        If not None, a Timer object to record per-node and
+        per-partition timings for the evaluation of the graph.
 
     Returns
     -------
     A cudf-polars DataFrame object.
+
+    Notes
+    -----
+    Timings are only recorded for schedulers executing in the
+    current process (i.e. not for the distributed scheduler).
     """
     ir, partition_info = lower_ir_graph(ir, config_options)
 
@@ -215,7 +252,19 @@ def evaluate_streaming(ir: IR, config_options: ConfigOptions) -> DataFrame:
 
     graph = post_process_task_graph(graph, key, config_options)
 
-    return get_scheduler(config_options)(graph, key)
+    profiler = None
+    if timer is not None and config_options.executor.scheduler != "distributed":
+        from cudf_polars.experimental.profiling import StreamingProfiler
+
+        profiler = StreamingProfiler(ir)
+        graph = profiler.wrap_graph(graph)
+
+    result = get_scheduler(config_options)(graph, key)
+
+    if profiler is not None:
+        assert timer is not None  # Satisfy type checking
+        profiler.store(timer)
+    return result
 
 
 @generate_ir_tasks.register(IR)
@@ -320,7 +369,6 @@ def _lower_ir_pwise(
 
 _lower_ir_pwise_preserve = partial(_lower_ir_pwise, preserve_partitioning=True)
 lower_ir_node.register(Projection, _lower_ir_pwise_preserve)
-lower_ir_node.register(Filter, _lower_ir_pwise_preserve)
 lower_ir_node.register(Cache, _lower_ir_pwise)
 lower_ir_node.register(HStack, _lower_ir_pwise)
 lower_ir_node.register(HConcat, _lower_ir_pwise)
@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+"""Task-level profiling for the streaming executor."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any
+
+from cudf_polars.containers import DataFrame
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.experimental.base import get_key_name
+from cudf_polars.experimental.scheduler import istask
+from cudf_polars.experimental.utils import _sizeof
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableMapping
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.utils.timer import Timer
+
+
+class PartitionStatistics:
+    """Execution statistics for one partition of an IR node."""
+
+    __slots__ = ("end", "nbytes", "rows", "start", "tasks")
+    start: int
+    """Start of the first task (use time.monotonic_ns)."""
+    end: int
+    """End of the last task."""
+    rows: int
+    """Number of rows in the output partition."""
+    nbytes: int
+    """Size (in bytes) of the output partition."""
+    tasks: int
+    """Number of tasks executed for this partition."""
+
+    def __init__(self) -> None:
+        self.start = -1
+        self.end = -1
+        self.rows = 0
+        self.nbytes = 0
+        self.tasks = 0
+
+
+class StreamingProfiler:
+    """
+    Collect per-task timings for a streaming task graph.
+
+    Parameters
+    ----------
+    ir
+        Root of the lowered IR graph.
+
+    Notes
+    -----
+    Every task in the graph is attributed to the IR node whose
+    key name it carries (e.g. ``("scan-123", 0)``), including
+    auxiliary tasks such as ``("split-shuffle-456", 0)``. Only
+    the output partitions of a node contribute row and byte
+    counts. Recording is thread-safe, but statistics are only
+    collected in the current process, so profiling is not
+    supported with the distributed scheduler.
+    """
+
+    def __init__(self, ir: IR) -> None:
+        self.labels = _node_labels(ir)
+        self.statistics: defaultdict[str, defaultdict[int, PartitionStatistics]] = (
+            defaultdict(lambda: defaultdict(PartitionStatistics))
+        )
+        self._lock = threading.Lock()
+
+    def label(self, key: Any) -> tuple[str, int, bool]:
+        """
+        Return the node label and partition index for a task key.
+
+        Parameters
+        ----------
+        key
+            The task key.
+
+        Returns
+        -------
+        label, partition, is_output
+            The label of the owning IR node, the partition index
+            (``0`` for non-partitioned keys), and whether ``key``
+            is an output partition of that node.
+        """
+        if isinstance(key, tuple):
+            name, partition, is_output = key[0], key[1], len(key) == 2
+        else:
+            # Final (concatenated) output of the graph
+            name, partition, is_output = key, 0, False
+        if name in self.labels:
+            return self.labels[name], partition, is_output
+        _, _, rest = name.partition("-")
+        if rest in self.labels:
+            return self.labels[rest], partition, False
+        return name, partition, False  # pragma: no cover
+
+    def record(self, key: Any, start: int, end: int, result: Any) -> None:
+        """Record the execution of a single task."""
+        label, partition, is_output = self.label(key)
+        with self._lock:
+            stats = self.statistics[label][partition]
+            stats.start = start if stats.start < 0 else min(stats.start, start)
+            stats.end = max(stats.end, end)
+            stats.tasks += 1
+            if is_output:
+                stats.rows, stats.nbytes = _rows_and_bytes(result)
+
+    def wrap_graph(self, graph: MutableMapping[Any, Any]) -> MutableMapping[Any, Any]:
+        """
+        Wrap every task in ``graph`` to record its execution.
+
+        Parameters
+        ----------
+        graph
+            Task graph to wrap.
+
+        Returns
+        -------
+        A new task graph with profiled tasks.
+        """
+        return {
+            key: (self._wrap(task[0], key), *task[1:]) if istask(task) else task
+            for key, task in graph.items()
+        }
+
+    def _wrap(self, func: Callable, key: Any) -> Callable:
+        def wrapper(*args: Any) -> Any:
+            start = time.monotonic_ns()
+            result = func(*args)
+            self.record(key, start, time.monotonic_ns(), result)
+            return result
+
+        return wrapper
+
+    def store(self, timer: Timer) -> None:
+        """
+        Store the collected statistics in a timer.
+
+        Parameters
+        ----------
+        timer
+            Timer to store the per-partition and per-node
+            timings in.
+
+        Notes
+        -----
+        Each partition is stored under the name
+        ``"<node>[<partition>] rows=<rows> bytes=<bytes>"``,
+        followed by an aggregated entry for the whole node
+        named ``"<node> partitions=<count> rows=<rows> bytes=<bytes>"``.
+        """
+        for label, partitions in self.statistics.items():
+            for partition, stats in sorted(partitions.items()):
+                timer.store(
+                    stats.start,
+                    stats.end,
+                    f"{label}[{partition}] rows={stats.rows} bytes={stats.nbytes}",
+                )
+            timer.store(
+                min(s.start for s in partitions.values()),
+                max(s.end for s in partitions.values()),
+                f"{label} partitions={len(partitions)} "
+                f"rows={sum(s.rows for s in partitions.values())} "
+                f"bytes={sum(s.nbytes for s in partitions.values())}",
+            )
+
+
+def _node_labels(ir: IR) -> dict[str, str]:
+    # Map key names to human-readable labels. Node types that
+    # appear more than once are disambiguated with a suffix.
+    nodes = list(traversal([ir]))
+    counts = Counter(type(node).__name__ for node in nodes)
+    seen: Counter[str] = Counter()
+    labels = {}
+    for node in nodes:
+        name = type(node).__name__
+        if counts[name] > 1:
+            labels[get_key_name(node)] = f"{name}-{seen[name]}"
+            seen[name] += 1
+        else:
+            labels[get_key_name(node)] = name
+    return labels
+
+
+def _rows_and_bytes(result: Any) -> tuple[int, int]:
+    if isinstance(result, DataFrame):
+        return result.num_rows, _sizeof(result)
+    return 0, 0
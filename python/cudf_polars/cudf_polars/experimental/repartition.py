@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
-import math
+import itertools
+import operator
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 from cudf_polars.dsl.ir import IR
@@ -15,6 +17,7 @@ from cudf_polars.experimental.utils import _concat
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
+    from cudf_polars.containers import DataFrame
     from cudf_polars.experimental.parallel import PartitionInfo
     from cudf_polars.typing import Schema
 
@@ -27,10 +30,12 @@ class Repartition(IR):
     -----
     Repartitioning means that we are not modifying any
     data, nor are we reordering or shuffling rows. We
-    are only changing the overall partition count. For
-    now, we only support an N -> [1...N] repartitioning
-    (inclusive). The output partition count is tracked
-    separately using PartitionInfo.
+    are only changing the overall partition count. When
+    the partition count decreases, neighboring partitions
+    are concatenated. When it increases, partitions are
+    split into row ranges of (roughly) equal size. The
+    output partition count is tracked separately using
+    PartitionInfo.
     """
 
     __slots__ = ()
@@ -42,26 +47,46 @@ class Repartition(IR):
         self.children = (df,)
 
 
+def _split_rows(df: DataFrame, count: int) -> list[DataFrame]:
+    # Split a DataFrame into `count` contiguous row ranges
+    offsets = [df.num_rows * i // count for i in range(count + 1)]
+    return [
+        df.slice((start, end - start)) for start, end in itertools.pairwise(offsets)
+    ]
+
+
 @generate_ir_tasks.register(Repartition)
 def _(
     ir: Repartition, partition_info: MutableMapping[IR, PartitionInfo]
 ) -> MutableMapping[Any, Any]:
     # Repartition an IR node.
-    # Only supports rapartitioning to fewer (for now).
 
     (child,) = ir.children
     count_in = partition_info[child].count
     count_out = partition_info[ir].count
-
-    if count_out > count_in:  # pragma: no cover
-        raise NotImplementedError(
-            f"Repartition {count_in} -> {count_out} not supported."
-        )
-
     key_name = get_key_name(ir)
-    stride = math.ceil(count_in / count_out)
     child_keys = tuple(partition_info[child].keys(child))
-    return {
-        (key_name, i): (_concat, *child_keys[k : k + stride])
-        for i, k in enumerate(range(0, count_in, stride))
+
+    if count_out <= count_in:
+        # Concatenate neighboring partitions
+        # (Output i gets inputs [i * N // M, (i + 1) * N // M))
+        offsets = [count_in * i // count_out for i in range(count_out + 1)]
+        return {
+            (key_name, i): (_concat, *child_keys[start:end])
+            for i, (start, end) in enumerate(itertools.pairwise(offsets))
+        }
+
+    # Split each partition into row ranges
+    # (Output j is a piece of input j * N // M)
+    split_name = f"split-{key_name}"
+    sources = [count_in * j // count_out for j in range(count_out)]
+    pieces = Counter(sources)
+    graph: MutableMapping[Any, Any] = {
+        (split_name, i): (_split_rows, child_key, pieces[i])
+        for i, child_key in enumerate(child_keys)
     }
+    first: dict[int, int] = {}
+    for j, i in enumerate(sources):
+        piece = j - first.setdefault(i, j)
+        graph[(key_name, j)] = (operator.getitem, (split_name, i), piece)
+    return graph
@@ -1,18 +1,23 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES.
 # SPDX-License-Identifier: Apache-2.0
-"""Synchronous task scheduler."""
+"""Synchronous and threaded task schedulers."""
 
 from __future__ import annotations
 
-from collections import Counter
+import heapq
+from collections import Counter, defaultdict
 from collections.abc import MutableMapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from itertools import chain
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from typing_extensions import Unpack
 
+from cudf_polars.experimental.utils import _sizeof
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping, Sequence
+    from concurrent.futures import Future
     from typing import TypeAlias
 
 
@@ -82,6 +87,31 @@ def required_keys(key: Key, graph: Graph) -> list[Key]:
     ]
 
 
+def cull(graph: Graph, keys: Sequence[Key]) -> Graph:
+    """
+    Remove the tasks that are not needed to extract keys.
+
+    Parameters
+    ----------
+    graph
+        The full task graph.
+    keys
+        Keys we want to extract.
+
+    Returns
+    -------
+    The subgraph of ``graph`` needed to extract ``keys``.
+    """
+    culled: Graph = {}
+    stack = list(keys)
+    while stack:
+        key = stack.pop()
+        if key not in culled:
+            culled[key] = graph[key]
+            stack.extend(required_keys(key, graph))
+    return culled
+
+
 def toposort(graph: Graph, dependencies: Mapping[Key, list[Key]]) -> list[Key]:
     """Return a list of task keys sorted in topological order."""
     # Stack-based depth-first search traversal. This is based on Tarjan's
@@ -115,11 +145,167 @@ def toposort(graph: Graph, dependencies: Mapping[Key, list[Key]]) -> list[Key]:
     return ordered
 
 
+def order(graph: Graph, dependencies: Mapping[Key, list[Key]]) -> list[Key]:
+    """
+    Return a memory-aware execution order for the task keys.
+
+    Parameters
+    ----------
+    graph
+        The full task graph.
+    dependencies
+        Mapping from each key to the keys it depends on.
+
+    Returns
+    -------
+    List of task keys sorted in a valid topological order.
+
+    Notes
+    -----
+    This is a greedy priority-based ordering in the spirit of
+    ``dask.order.order``. We simulate a serial execution of
+    the graph, and always pick the next ready task using the
+    following (descending) preference:
+
+    1. Tasks that are the last remaining consumer of some
+       intermediate result (running them frees memory).
+    2. Tasks that consume an intermediate result (running
+       them continues work on data that is already live).
+    3. Root tasks with no dependencies (running them
+       produces new data, e.g. a file read).
+
+    Ties are broken by a deterministic depth-first
+    post-order traversal from the output keys, so that
+    one branch of the graph is finished before the next
+    one is started.
+    """
+    dependents: dict[Key, list[Key]] = {k: [] for k in graph}
+    waiting: dict[Key, int] = {}
+    for k, deps in dependencies.items():
+        unique_deps = dict.fromkeys(deps)
+        waiting[k] = len(unique_deps)
+        for dep in unique_deps:
+            dependents[dep].append(k)
+    remaining = {k: len(v) for k, v in dependents.items()}
+
+    # Static priority: deterministic depth-first post-order,
+    # starting from the keys that nothing depends on.
+    static: dict[Key, int] = {}
+    for root in chain(
+        (k for k in graph if not dependents[k]),
+        graph,  # Cycles are not allowed, but be safe
+    ):
+        if root in static:
+            continue
+        stack: list[tuple[Key, bool]] = [(root, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in static:
+                continue
+            if expanded:
+                static[current] = len(static)
+            else:
+                stack.append((current, True))
+                stack.extend(
+                    (dep, False)
+                    for dep in reversed(dependencies[current])
+                    if dep not in static
+                )
+
+    releasing: list[tuple[int, Key]] = []
+    consuming: list[tuple[int, Key]] = []
+    roots: list[tuple[int, Key]] = []
+
+    def push(k: Key) -> None:
+        if any(remaining[dep] == 1 for dep in dependencies[k]):
+            heapq.heappush(releasing, (static[k], k))
+        elif dependencies[k]:
+            heapq.heappush(consuming, (static[k], k))
+        else:
+            heapq.heappush(roots, (static[k], k))
+
+    for k, n in waiting.items():
+        if n == 0:
+            push(k)
+
+    ordered: list[Key] = []
+    completed: set[Key] = set()
+    while len(ordered) < len(graph):
+        for heap in (releasing, consuming, roots):
+            while heap and heap[0][1] in completed:
+                # Drop stale entries
+                heapq.heappop(heap)
+            if heap:
+                break
+        else:  # pragma: no cover
+            raise ValueError("Task graph contains a cycle.")
+        _, current = heapq.heappop(heap)
+        ordered.append(current)
+        completed.add(current)
+        for dep in dict.fromkeys(dependencies[current]):
+            remaining[dep] -= 1
+            if remaining[dep] == 1:
+                # The last consumer of `dep` will now free memory
+                (last,) = (d for d in dependents[dep] if d not in completed)
+                if waiting[last] == 0:
+                    heapq.heappush(releasing, (static[last], last))
+        for dependent in dependents[current]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                push(dependent)
+
+    return ordered
+
+
+class LiveBytesCounter:
+    """
+    Track the number of bytes held by live intermediate results.
+
+    Parameters
+    ----------
+    sizeof
+        Callable returning the size (in bytes) of a task result.
+        By default, the device-buffer size of cudf-polars
+        DataFrame objects is used, and any other result is
+        treated as zero bytes.
+
+    Notes
+    -----
+    A counter may be passed to :func:`synchronous_scheduler` or
+    :func:`threaded_scheduler` to measure the effect of task
+    ordering on memory pressure.
+    """
+
+    __slots__ = ("_sizes", "current", "peak", "sizeof")
+    current: int
+    """Number of bytes currently held."""
+    peak: int
+    """Largest number of bytes held at once."""
+
+    def __init__(self, sizeof: Callable[[Any], int] | None = None) -> None:
+        self.sizeof = sizeof or _sizeof
+        self._sizes: dict[Key, int] = {}
+        self.current = 0
+        self.peak = 0
+
+    def add(self, key: Key, value: Any) -> None:
+        """Record a new live result."""
+        nbytes = self.sizeof(value)
+        self._sizes[key] = nbytes
+        self.current += nbytes
+        self.peak = max(self.peak, self.current)
+
+    def remove(self, key: Key) -> None:
+        """Record that a result was released."""
+        self.current -= self._sizes.pop(key, 0)
+
+
 def synchronous_scheduler(
     graph: Graph,
     key: Key,
     *,
     cache: MutableMapping | None = None,
+    live_bytes: LiveBytesCounter | None = None,
 ) -> Any:
     """
     Execute the task graph for a given key.
@@ -132,6 +318,9 @@ def synchronous_scheduler(
         The final output key to extract from the graph.
     cache
         Intermediate-data cache.
+    live_bytes
+        Optional counter used to track the size of
+        intermediate results held during execution.
 
     Returns
     -------
@@ -142,14 +331,120 @@ def synchronous_scheduler(
     if cache is None:
         cache = {}
 
+    # Only execute the tasks that key depends on
+    graph = cull(graph, [key])
     dependencies = {k: required_keys(k, graph) for k in graph}
     refcount = Counter(chain.from_iterable(dependencies.values()))
 
-    for k in toposort(graph, dependencies):
+    for k in order(graph, dependencies):
         cache[k] = _execute_task(graph[k], cache)
+        if live_bytes is not None:
+            live_bytes.add(k, cache[k])
         for dep in dependencies[k]:
             refcount[dep] -= 1
             if refcount[dep] == 0 and dep != key:
                 del cache[dep]
+                if live_bytes is not None:
+                    live_bytes.remove(dep)
+
+    return cache[key]
+
+
+def threaded_scheduler(
+    graph: Graph,
+    key: Key,
+    *,
+    cache: MutableMapping | None = None,
+    max_workers: int = 1,
+    initializer: Callable[[], None] | None = None,
+    live_bytes: LiveBytesCounter | None = None,
+) -> Any:
+    """
+    Execute the task graph for a given key on a local thread pool.
+
+    Parameters
+    ----------
+    graph
+        The task graph to execute.
+    key
+        The final output key to extract from the graph.
+    cache
+        Intermediate-data cache.
+    max_workers
+        Maximum number of tasks to execute concurrently.
+    initializer
+        Optional callable to run in each worker thread
+        before it executes any tasks.
+    live_bytes
+        Optional counter used to track the size of
+        intermediate results held during execution.
+
+    Returns
+    -------
+    Executed task-graph result for ``key``.
+
+    Notes
+    -----
+    Ready tasks are prioritized using the same ordering as
+    :func:`synchronous_scheduler` (see :func:`order`), and no more than
+    ``max_workers`` tasks are ever in flight. Intermediate
+    results are released as soon as their last dependent
+    task has finished.
+    """
+    if key not in graph:  # pragma: no cover
+        raise KeyError(f"{key} is not a key in the graph")
+    if max_workers < 1:  # pragma: no cover
+        raise ValueError(f"max_workers must be positive, got: {max_workers}")
+    if cache is None:
+        cache = {}
+
+    # Only execute the tasks that key depends on
+    graph = cull(graph, [key])
+    dependencies = {k: required_keys(k, graph) for k in graph}
+    refcount = Counter(chain.from_iterable(dependencies.values()))
+    dependents: defaultdict[Key, list[Key]] = defaultdict(list)
+    waiting: dict[Key, int] = {}
+    for k, deps in dependencies.items():
+        unique_deps = set(deps)
+        waiting[k] = len(unique_deps)
+        for dep in unique_deps:
+            dependents[dep].append(k)
+
+    # Use the synchronous execution order as a priority, so
+    # that we favor releasing intermediate results and
+    # finishing one branch of the graph before starting
+    # the next.
+    priority = {k: i for i, k in enumerate(order(graph, dependencies))}
+    ready = [(priority[k], k) for k, n in waiting.items() if n == 0]
+    heapq.heapify(ready)
+
+    running: dict[Future, Key] = {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers, initializer=initializer
+    ) as executor:
+        try:
+            while ready or running:
+                while ready and len(running) < max_workers:
+                    _, k = heapq.heappop(ready)
+                    running[executor.submit(_execute_task, graph[k], cache)] = k
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    k = running.pop(future)
+                    cache[k] = future.result()
+                    if live_bytes is not None:
+                        live_bytes.add(k, cache[k])
+                    for dep in dependencies[k]:
+                        refcount[dep] -= 1
+                        if refcount[dep] == 0 and dep != key:
+                            del cache[dep]
+                            if live_bytes is not None:
+                                live_bytes.remove(dep)
+                    for dependent in dependents[k]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            heapq.heappush(ready, (priority[dependent], dependent))
+        finally:
+            for future in running:
+                future.cancel()
 
     return cache[key]
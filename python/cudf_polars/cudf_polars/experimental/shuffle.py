@@ -130,6 +130,16 @@ class Shuffle(IR):
         return df
 
 
+def _task_shuffle(config_options: ConfigOptions) -> bool:
+    # Will the Shuffle nodes of a query use the task-based
+    # shuffle (see generate_ir_tasks), rather than rapidsmpf?
+    assert config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in '_task_shuffle'"
+    )
+    executor = config_options.executor
+    return executor.shuffle_method == "tasks" or executor.scheduler != "distributed"
+
+
 def _partition_dataframe(
     df: DataFrame,
     keys: tuple[NamedExpr, ...],
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+"""Multi-partition Sink Logic."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pylibcudf as plc
+
+from cudf_polars.containers import DataFrame
+from cudf_polars.dsl.ir import Sink
+from cudf_polars.experimental.base import PartitionInfo, get_key_name
+from cudf_polars.experimental.dispatch import generate_ir_tasks, lower_ir_node
+from cudf_polars.experimental.utils import _lower_ir_fallback
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.experimental.dispatch import LowerIRTransformer
+
+
+@lower_ir_node.register(Sink)
+def _(
+    ir: Sink, rec: LowerIRTransformer
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
+    config_options = rec.state["config_options"]
+    assert config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in 'lower_ir_node'"
+    )
+    if config_options.executor.scheduler == "distributed":
+        # Partitions may be held by workers on different hosts,
+        # and the chunked parquet writer cannot move between workers.
+        return _lower_ir_fallback(
+            ir,
+            rec,
+            msg="Sink does not support multiple partitions with the distributed scheduler.",
+        )
+
+    # Lower child
+    child, partition_info = rec(ir.children[0])
+
+    # Each child partition is written as soon as it is produced
+    # (see the generate_ir_tasks logic below), so the output is
+    # a single (empty) partition.
+    new_node = ir.reconstruct([child])
+    partition_info[new_node] = PartitionInfo(count=1)
+    return new_node, partition_info
+
+
+def _sink_partition(
+    kind: str,
+    path: str,
+    options: dict[str, Any],
+    writer: plc.io.parquet.ParquetChunkedWriter | bool | None,  # noqa: FBT001
+    df: DataFrame,
+) -> plc.io.parquet.ParquetChunkedWriter | bool:
+    # Write a single partition to the sink. The writer is None
+    # for the first partition, and the return value of the
+    # previous call for every other partition.
+    if kind == "Parquet":
+        if writer is None:
+            Sink.prepare_path(path, options)
+            metadata, compression, stats_level = Sink.parquet_writer_options(
+                options, df
+            )
+            builder = (
+                plc.io.parquet.ChunkedParquetWriterOptions.builder(
+                    plc.io.SinkInfo([path])
+                )
+                .metadata(metadata)
+                .compression(compression)
+                .stats_level(stats_level)
+            )
+            if (row_group_size := options.get("row_group_size")) is not None:
+                builder = builder.row_group_size_rows(row_group_size)
+            if (data_page_size := options.get("data_page_size")) is not None:
+                builder = builder.max_page_size_bytes(data_page_size)
+            writer = plc.io.parquet.ParquetChunkedWriter.from_options(builder.build())
+        assert isinstance(writer, plc.io.parquet.ParquetChunkedWriter)
+        writer.write(df.table)
+        return writer
+
+    # Text formats are appended to the file, partition by partition
+    first = writer is None
+    if first:
+        Sink.prepare_path(path, options)
+    with Path(path).open("wb" if first else "ab") as f:
+        target = plc.io.SinkInfo([f])
+        if kind == "Csv":
+            Sink.write_csv(
+                target,
+                options,
+                df,
+                include_header=first and options["include_header"],
+            )
+        else:
+            Sink.write_json(target, df)
+    return True
+
+
+def _sink_finalize(
+    writer: plc.io.parquet.ParquetChunkedWriter | bool,  # noqa: FBT001
+) -> DataFrame:
+    # Close the sink once every partition has been written
+    if isinstance(writer, plc.io.parquet.ParquetChunkedWriter):
+        writer.close([])
+    return DataFrame([])
+
+
+@generate_ir_tasks.register(Sink)
+def _(
+    ir: Sink, partition_info: MutableMapping[IR, PartitionInfo]
+) -> MutableMapping[Any, Any]:
+    (child,) = ir.children
+    child_name = get_key_name(child)
+    count = partition_info[child].count
+    key_name = get_key_name(ir)
+    if count == 1:
+        return {
+            (key_name, 0): (
+                ir.do_evaluate,
+                *ir._non_child_args,
+                (child_name, 0),
+            )
+        }
+
+    # Chain the partition writes together, so that partitions
+    # are written in order and each one can be released as soon
+    # as it has been written (rather than concatenated at the end).
+    write_name = f"write-{key_name}"
+    graph: MutableMapping[Any, Any] = {}
+    writer: tuple[str, int] | None = None
+    for i in range(count):
+        graph[(write_name, i)] = (
+            _sink_partition,
+            ir.kind,
+            ir.path,
+            ir.options,
+            writer,
+            (child_name, i),
+        )
+        writer = (write_name, i)
+    graph[(key_name, 0)] = (_sink_finalize, writer)
+    return graph
@@ -0,0 +1,255 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+"""Multi-partition Slice Logic."""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any
+
+from cudf_polars.dsl.ir import (
+    IR,
+    Cache,
+    DataFrameScan,
+    HStack,
+    Projection,
+    Scan,
+    Slice,
+    Union,
+)
+from cudf_polars.experimental.base import PartitionInfo, get_key_name
+from cudf_polars.experimental.cardinality import _sampleable
+from cudf_polars.experimental.dispatch import generate_ir_tasks, lower_ir_node
+from cudf_polars.experimental.io import (
+    ScanPartitionFlavor,
+    ScanPartitionPlan,
+    SplitScan,
+    _parquet_file_metadata,
+)
+from cudf_polars.experimental.repartition import Repartition
+from cudf_polars.experimental.scheduler import synchronous_scheduler
+from cudf_polars.experimental.utils import _concat
+from cudf_polars.utils.conversion import from_polars_slice
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from cudf_polars.containers import DataFrame
+    from cudf_polars.experimental.dispatch import LowerIRTransformer
+    from cudf_polars.typing import Schema
+
+
+class SlicePartitions(IR):
+    """
+    Slice a subset of the partitions of a dataframe.
+
+    Notes
+    -----
+    Output partition ``j`` is the slice ``ranges[j][1:]``
+    of child partition ``ranges[j][0]``. Child partitions
+    that are not referenced by ``ranges`` are never computed.
+    """
+
+    __slots__ = ("ranges",)
+    _non_child = ("schema", "ranges")
+    ranges: tuple[tuple[int, int, int], ...]
+    """``(partition, offset, length)`` of each output partition."""
+
+    def __init__(
+        self, schema: Schema, ranges: tuple[tuple[int, int, int], ...], df: IR
+    ):
+        self.schema = schema
+        self.ranges = ranges
+        self._non_child_args = ()
+        self.children = (df,)
+
+
+def _partition_row_counts(
+    ir: IR, partition_info: MutableMapping[IR, PartitionInfo]
+) -> list[int] | None:
+    """
+    Return the number of rows in each partition of a (lowered) IR node.
+
+    Parameters
+    ----------
+    ir
+        The IR node.
+    partition_info
+        A mapping from all unique IR nodes to the
+        associated partitioning information.
+
+    Returns
+    -------
+    The row count of each partition, or None if the row counts
+    are not known without computing the partitions. Parquet
+    row counts are read from the (cached) file metadata, and
+    grouped by file in the same way as the scan partitions.
+    """
+    counts: list[int] | None = None
+    if isinstance(ir, (Cache, HStack, Projection)):
+        counts = _partition_row_counts(ir.children[0], partition_info)
+    elif isinstance(ir, Union) and ir.zlice is None:
+        counts = []
+        for c in ir.children:
+            if (child_counts := _partition_row_counts(c, partition_info)) is None:
+                return None
+            counts.extend(child_counts)
+    elif isinstance(ir, DataFrameScan):
+        counts = [ir.df.shape()[0]]
+    elif (
+        isinstance(ir, Scan)
+        and ir.typ == "parquet"
+        and ir.predicate is None
+        and ir.skip_rows == 0
+        and ir.n_rows == -1
+    ):
+        file_counts = [
+            sum(_parquet_file_metadata(path).rowgroup_num_rows) for path in ir.paths
+        ]
+        if partition_info[ir].count == 1:
+            counts = [sum(file_counts)]
+        else:
+            # Follow the file grouping of the scan partitioning plan
+            plan = ScanPartitionPlan.from_scan(ir)
+            if plan.flavor != ScanPartitionFlavor.SPLIT_FILES:
+                counts = [
+                    sum(file_counts[i : i + plan.factor])
+                    for i in range(0, len(file_counts), plan.factor)
+                ]
+    elif (
+        isinstance(ir, SplitScan)
+        and ir.base_scan.typ == "parquet"
+        and ir.base_scan.predicate is None
+        and ir.row_range is not None
+    ):
+        skip_rows, n_rows = ir.row_range
+        if n_rows == -1:
+            (path,) = ir.base_scan.paths
+            n_rows = sum(_parquet_file_metadata(path).rowgroup_num_rows) - skip_rows
+        counts = [n_rows]
+    if counts is None or len(counts) != partition_info[ir].count:
+        return None
+    return counts
+
+
+@lower_ir_node.register(Slice)
+def _(
+    ir: Slice, rec: LowerIRTransformer
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
+    config_options = rec.state["config_options"]
+    assert config_options.executor.name == "streaming", (
+        "'in-memory' executor not supported in 'lower_ir_node'"
+    )
+
+    # Lower child
+    child, partition_info = rec(ir.children[0])
+    count = partition_info[child].count
+    if count == 1:
+        new_node = ir.reconstruct([child])
+        partition_info[new_node] = PartitionInfo(count=1)
+        return new_node, partition_info
+
+    if (row_counts := _partition_row_counts(child, partition_info)) is not None:
+        # The row counts are known, so we only need to
+        # compute the partitions that overlap the slice.
+        start, end = from_polars_slice((ir.offset, ir.length), num_rows=sum(row_counts))
+        offsets = [0, *itertools.accumulate(row_counts)]
+        ranges = tuple(
+            (i, max(start - lo, 0), min(end, hi) - max(start, lo))
+            for i, (lo, hi) in enumerate(itertools.pairwise(offsets))
+            if max(start, lo) < min(end, hi)
+        ) or ((0, 0, 0),)  # Empty slice
+        new_node = SlicePartitions(ir.schema, ranges, child)
+        partition_info[new_node] = PartitionInfo(count=len(ranges))
+        return new_node, partition_info
+
+    if (
+        ir.offset >= 0
+        and config_options.executor.scheduler != "distributed"
+        and _sampleable(child)
+    ):
+        # Evaluate the child partitions one at a time,
+        # and stop as soon as we have enough rows
+        # (see the generate_ir_tasks logic below).
+        new_node = ir.reconstruct([child])
+        partition_info[new_node] = PartitionInfo(count=1)
+        return new_node, partition_info
+
+    # Otherwise, the rows we need must be among the first
+    # (offset + length) rows of every partition, or among the
+    # last -offset rows of every partition when slicing from
+    # the end. Trim the partitions before concatenating them.
+    if ir.offset >= 0:
+        trim = Slice(child.schema, 0, ir.offset + ir.length, child)
+    else:
+        trim = Slice(child.schema, ir.offset, -ir.offset, child)
+    partition_info[trim] = PartitionInfo(count=count)
+    concatenated = Repartition(trim.schema, trim)
+    partition_info[concatenated] = PartitionInfo(count=1)
+    new_node = ir.reconstruct([concatenated])
+    partition_info[new_node] = PartitionInfo(count=1)
+    return new_node, partition_info
+
+
+def _slice_head(
+    offset: int,
+    length: int,
+    graph: MutableMapping[Any, Any],
+    keys: list[tuple[str, int]],
+) -> DataFrame:
+    # Evaluate the partitions in keys (in order), until
+    # the first (offset + length) rows have been produced
+    needed = offset + length
+    dfs = []
+    for key in keys:
+        df = synchronous_scheduler(graph, key).slice((0, needed))
+        dfs.append(df)
+        needed -= df.num_rows
+        if needed <= 0:
+            break
+    return Slice.do_evaluate(offset, length, _concat(*dfs))
+
+
+@generate_ir_tasks.register(Slice)
+def _(
+    ir: Slice, partition_info: MutableMapping[IR, PartitionInfo]
+) -> MutableMapping[Any, Any]:
+    from cudf_polars.experimental.parallel import task_graph
+
+    (child,) = ir.children
+    if partition_info[ir].count == partition_info[child].count:
+        # Partition-wise slice
+        child_name = get_key_name(child)
+        return {
+            key: (ir.do_evaluate, *ir._non_child_args, (child_name, i))
+            for i, key in enumerate(partition_info[ir].keys(ir))
+        }
+
+    # Head of a multi-partition child. The child graph is
+    # embedded in the task (rather than being a dependency),
+    # so that the scheduler does not compute every partition.
+    # Every child partition can be computed on its own
+    # (see lower_ir_node), so nothing is computed twice.
+    child_graph, _ = task_graph(child, partition_info)
+    return {
+        (get_key_name(ir), 0): (
+            _slice_head,
+            *ir._non_child_args,
+            child_graph,
+            list(partition_info[child].keys(child)),
+        )
+    }
+
+
+@generate_ir_tasks.register(SlicePartitions)
+def _(
+    ir: SlicePartitions, partition_info: MutableMapping[IR, PartitionInfo]
+) -> MutableMapping[Any, Any]:
+    (child,) = ir.children
+    child_name = get_key_name(child)
+    return {
+        key: (Slice.do_evaluate, offset, length, (child_name, i))
+        for key, (i, offset, length) in zip(
+            partition_info[ir].keys(ir), ir.ranges, strict=True
+        )
+    }
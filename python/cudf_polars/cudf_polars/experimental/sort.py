@@ -4,19 +4,276 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import operator
+from typing import TYPE_CHECKING, Any
 
-from cudf_polars.dsl.ir import Sort
-from cudf_polars.experimental.base import PartitionInfo
-from cudf_polars.experimental.dispatch import lower_ir_node
+import pylibcudf as plc
+
+from cudf_polars.containers import DataFrame
+from cudf_polars.dsl.ir import IR, Sort, broadcast
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.experimental.base import PartitionInfo, get_key_name
+from cudf_polars.experimental.dispatch import generate_ir_tasks, lower_ir_node
 from cudf_polars.experimental.repartition import Repartition
-from cudf_polars.experimental.utils import _lower_ir_fallback
+from cudf_polars.experimental.utils import _concat, _lower_ir_fallback
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import MutableMapping, Sequence
 
-    from cudf_polars.dsl.ir import IR
+    from cudf_polars.dsl.expr import NamedExpr
     from cudf_polars.experimental.dispatch import LowerIRTransformer
+    from cudf_polars.typing import Schema
+
+
+# Number of sort-key rows to sample from each input partition
+_SAMPLES_PER_PARTITION = 100
+
+
+class RangeShuffle(IR):
+    """
+    Shuffle multi-partition data into sorted ranges.
+
+    Notes
+    -----
+    Splitter values for the sort keys are computed from a
+    sample of every input partition. Each row is then sent
+    to the output partition covering the range of its sort
+    keys. After a partition-wise sort, the data is globally
+    sorted. The relative order of rows within each output
+    partition is preserved.
+    """
+
+    __slots__ = ("by", "null_order", "order")
+    _non_child = ("schema", "by", "order", "null_order")
+    by: tuple[NamedExpr, ...]
+    """Sort keys."""
+    order: tuple[plc.types.Order, ...]
+    """Sort order for each sort key."""
+    null_order: tuple[plc.types.NullOrder, ...]
+    """Null sorting location for each sort key."""
+
+    def __init__(
+        self,
+        schema: Schema,
+        by: Sequence[NamedExpr],
+        order: Sequence[plc.types.Order],
+        null_order: Sequence[plc.types.NullOrder],
+        df: IR,
+    ):
+        self.schema = schema
+        self.by = tuple(by)
+        self.order = tuple(order)
+        self.null_order = tuple(null_order)
+        self._non_child_args = (schema, self.by, self.order, self.null_order)
+        self.children = (df,)
+
+    @classmethod
+    def do_evaluate(
+        cls,
+        schema: Schema,
+        by: Sequence[NamedExpr],
+        order: Sequence[plc.types.Order],
+        null_order: Sequence[plc.types.NullOrder],
+        df: DataFrame,
+    ) -> DataFrame:  # pragma: no cover
+        """Evaluate and return a dataframe."""
+        # Single-partition RangeShuffle evaluation is a no-op
+        return df
+
+
+def _sort_keys(df: DataFrame, by: Sequence[NamedExpr]) -> plc.Table:
+    # Evaluate the sort keys of a DataFrame
+    return plc.Table(
+        [
+            c.obj
+            for c in broadcast(*(k.evaluate(df) for k in by), target_length=df.num_rows)
+        ]
+    )
+
+
+def _evenly_spaced(table: plc.Table, count: int, *, skip_first: bool) -> plc.Table:
+    # Gather `count` evenly-spaced rows from `table`
+    nrows = table.num_rows()
+    step = nrows // (count + 1) if skip_first else nrows // count
+    init = plc.Scalar.from_py(step if skip_first else 0, plc.types.SIZE_TYPE)
+    return plc.copying.gather(
+        table,
+        plc.filling.sequence(
+            count, init, plc.Scalar.from_py(step, plc.types.SIZE_TYPE)
+        ),
+        plc.copying.OutOfBoundsPolicy.DONT_CHECK,
+    )
+
+
+def _sample_sort_keys(
+    df: DataFrame,
+    by: Sequence[NamedExpr],
+    order: Sequence[plc.types.Order],
+    null_order: Sequence[plc.types.NullOrder],
+) -> DataFrame:
+    """
+    Sample the sort keys of a single partition.
+
+    Parameters
+    ----------
+    df
+        DataFrame to sample.
+    by
+        Sort keys.
+    order
+        Sort order for each sort key.
+    null_order
+        Null sorting location for each sort key.
+
+    Returns
+    -------
+    A DataFrame with (at most) ``_SAMPLES_PER_PARTITION``
+    evenly-spaced rows of the sorted keys.
+    """
+    keys = plc.sorting.sort(_sort_keys(df, by), list(order), list(null_order))
+    if keys.num_rows() > _SAMPLES_PER_PARTITION:
+        keys = _evenly_spaced(keys, _SAMPLES_PER_PARTITION, skip_first=False)
+    return DataFrame.from_table(keys, [str(i) for i in range(len(by))])
+
+
+def _find_splitters(
+    order: Sequence[plc.types.Order],
+    null_order: Sequence[plc.types.NullOrder],
+    count: int,
+    *samples: DataFrame,
+) -> DataFrame:
+    """
+    Find the sort-key splitters between output partitions.
+
+    Parameters
+    ----------
+    order
+        Sort order for each sort key.
+    null_order
+        Null sorting location for each sort key.
+    count
+        Number of output partitions.
+    samples
+        Sampled sort keys from every input partition.
+
+    Returns
+    -------
+    A sorted DataFrame containing ``count - 1`` splitter
+    rows (or no rows if the input is empty).
+    """
+    sample = _concat(*samples)
+    keys = plc.sorting.sort(sample.table, list(order), list(null_order))
+    if keys.num_rows() > 0:
+        keys = _evenly_spaced(keys, count - 1, skip_first=True)
+    return DataFrame.from_table(keys, sample.column_names)
+
+
+def _range_partition_dataframe(
+    df: DataFrame,
+    splitters: DataFrame,
+    by: Sequence[NamedExpr],
+    order: Sequence[plc.types.Order],
+    null_order: Sequence[plc.types.NullOrder],
+    count: int,
+) -> dict[int, DataFrame]:
+    """
+    Partition an input DataFrame by ranges of its sort keys.
+
+    Parameters
+    ----------
+    df
+        DataFrame to partition.
+    splitters
+        Sorted splitter rows from :func:`_find_splitters`.
+    by
+        Sort keys.
+    order
+        Sort order for each sort key.
+    null_order
+        Null sorting location for each sort key.
+    count
+        Total number of output partitions.
+
+    Returns
+    -------
+    A dictionary mapping between int partition indices and
+    DataFrame fragments.
+    """
+    if df.num_rows == 0 or splitters.num_rows == 0:
+        # Fast path for empty DataFrame or splitters
+        return {i: df if i == 0 else df.slice((0, 0)) for i in range(count)}
+
+    # Rows that compare equal to a splitter are sent to
+    # the partition after it, so equal keys are never split
+    partition_map = plc.search.upper_bound(
+        splitters.table,
+        _sort_keys(df, by),
+        list(order),
+        list(null_order),
+    )
+
+    # Apply partitioning
+    t, offsets = plc.partitioning.partition(df.table, partition_map, count)
+
+    # Split and return the partitioned result
+    return {
+        i: DataFrame.from_table(split, df.column_names)
+        for i, split in enumerate(plc.copying.split(t, offsets[1:-1]))
+    }
+
+
+@generate_ir_tasks.register(RangeShuffle)
+def _(
+    ir: RangeShuffle, partition_info: MutableMapping[IR, PartitionInfo]
+) -> MutableMapping[Any, Any]:
+    (child,) = ir.children
+    name_in = get_key_name(child)
+    name_out = get_key_name(ir)
+    count_in = partition_info[child].count
+    count_out = partition_info[ir].count
+
+    sample_name = f"sample-{name_out}"
+    splitters_key = (f"splitters-{name_out}", 0)
+    split_name = f"split-{name_out}"
+    inter_name = f"inter-{name_out}"
+
+    graph: MutableMapping[Any, Any] = {}
+    for part_in in range(count_in):
+        graph[(sample_name, part_in)] = (
+            _sample_sort_keys,
+            (name_in, part_in),
+            ir.by,
+            ir.order,
+            ir.null_order,
+        )
+    graph[splitters_key] = (
+        _find_splitters,
+        ir.order,
+        ir.null_order,
+        count_out,
+        *((sample_name, part_in) for part_in in range(count_in)),
+    )
+    for part_in in range(count_in):
+        graph[(split_name, part_in)] = (
+            _range_partition_dataframe,
+            (name_in, part_in),
+            splitters_key,
+            ir.by,
+            ir.order,
+            ir.null_order,
+            count_out,
+        )
+    for part_out in range(count_out):
+        _concat_list = []
+        for part_in in range(count_in):
+            _concat_list.append((inter_name, part_out, part_in))
+            graph[_concat_list[-1]] = (
+                operator.getitem,
+                (split_name, part_in),
+                part_out,
+            )
+        graph[(name_out, part_out)] = (_concat, *_concat_list)
+    return graph
 
 
 @lower_ir_node.register(Sort)
@@ -41,5 +298,34 @@ def _(
             partition_info[new_node] = PartitionInfo(count=1)
         return new_node, partition_info
 
-    # Fallback
-    return _lower_ir_fallback(ir, rec, msg="Sort does not support multiple partitions.")
+    if ir.zlice is not None:
+        return _lower_ir_fallback(
+            ir, rec, msg="Sort with a slice does not support multiple partitions."
+        )
+
+    if not all(expr.is_pointwise for expr in traversal([ne.value for ne in ir.by])):
+        return _lower_ir_fallback(
+            ir,
+            rec,
+            msg="Sort does not support multiple partitions for non-pointwise keys.",
+        )
+
+    # Lower child
+    child, partition_info = rec(ir.children[0])
+    count = partition_info[child].count
+    if count == 1:
+        new_node = ir.reconstruct([child])
+        partition_info[new_node] = PartitionInfo(count=1)
+        return new_node, partition_info
+
+    # Sample-based range partitioning
+    shuffled = RangeShuffle(child.schema, ir.by, ir.order, ir.null_order, child)
+    partition_info[shuffled] = PartitionInfo(count=count)
+
+    # Partition-wise sort
+    new_node = ir.reconstruct([shuffled])
+    partition_info[new_node] = PartitionInfo(
+        count=count,
+        sorted_on=tuple(zip(ir.by, ir.order, ir.null_order, strict=True)),
+    )
+    return new_node, partition_info
@@ -8,7 +8,9 @@ import operator
 import warnings
 from functools import reduce
 from itertools import chain
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import pylibcudf as plc
 
 from cudf_polars.dsl.expr import Col
 from cudf_polars.dsl.ir import Union
@@ -24,11 +26,37 @@ if TYPE_CHECKING:
     from cudf_polars.utils.config import ConfigOptions
 
 
+# Binary operators that combine two boolean predicates
+AND_OPS = frozenset(
+    {
+        plc.binaryop.BinaryOperator.BITWISE_AND,
+        plc.binaryop.BinaryOperator.LOGICAL_AND,
+        plc.binaryop.BinaryOperator.NULL_LOGICAL_AND,
+    }
+)
+OR_OPS = frozenset(
+    {
+        plc.binaryop.BinaryOperator.BITWISE_OR,
+        plc.binaryop.BinaryOperator.LOGICAL_OR,
+        plc.binaryop.BinaryOperator.NULL_LOGICAL_OR,
+    }
+)
+
+
 def _concat(*dfs: DataFrame) -> DataFrame:
     # Concatenate a sequence of DataFrames vertically
     return Union.do_evaluate(None, *dfs)
 
 
+def _sizeof(obj: Any) -> int:
+    # Device size in bytes of a DataFrame (0 for any other object)
+    from cudf_polars.containers import DataFrame
+
+    if isinstance(obj, DataFrame):
+        return sum(c.obj.device_buffer_size() for c in obj.columns)
+    return 0
+
+
 def _fallback_inform(msg: str, config_options: ConfigOptions) -> None:
     """Inform the user of single-partition fallback."""
     # Satisfy type checking
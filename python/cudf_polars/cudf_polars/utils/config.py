@@ -46,10 +46,12 @@ class Scheduler(str, enum.Enum):
     The scheduler to use for the streaming executor.
 
     * ``Scheduler.SYNCHRONOUS`` : Use the synchronous scheduler.
+    * ``Scheduler.THREADS`` : Use a local thread-pool scheduler.
     * ``Scheduler.DISTRIBUTED`` : Use the distributed scheduler.
     """
 
     SYNCHRONOUS = "synchronous"
+    THREADS = "threads"
     DISTRIBUTED = "distributed"
 
 
@@ -156,6 +158,10 @@ class StreamingExecutor:
         by default.
 
         Note ``scheduler="distributed"`` requires a Dask cluster to be running.
+    max_workers
+        The maximum number of tasks to execute concurrently when
+        ``scheduler="threads"``. By default, this is the smaller of 4 and
+        the number of available CPUs. Ignored by other schedulers.
     fallback_mode
         How to handle errors when the GPU engine fails to execute a query.
         ``StreamingFallbackMode.WARN`` by default.
@@ -168,8 +174,23 @@ class StreamingExecutor:
         on the right).
 
         Each factor estimates the fractional number of unique values in the
-        column. By default, ``1.0`` is used for any column not included in
-        ``cardinality_factor``.
+        column. By default, the factor of any column not included in
+        ``cardinality_factor`` is estimated by sampling (see
+        ``cardinality_sample_partitions``).
+    cardinality_sample_partitions
+        The number of input partitions to sample when estimating the
+        number of distinct group-by (or ``unique``) keys, if none of the
+        keys are included in ``cardinality_factor``. The estimate is used
+        to choose between a tree reduction and a shuffle, and to choose
+        the number of output partitions. The same number of partitions
+        is sampled to find skewed join keys (see ``skew_join_threshold``)
+        and to estimate the size of filtered partitions (see
+        ``coalesce_filters``).
+        Sampling is only done when the
+        sampled partitions can be computed without the rest of the input
+        (e.g. directly from a file scan). 2 by default. Set to 0 to disable
+        sampling, in which case a tree reduction to a single partition is
+        used.
     target_partition_size
         Target partition size for IO tasks. This configuration currently
         controls how large parquet files are split into multiple partitions.
@@ -184,6 +205,33 @@ class StreamingExecutor:
     broadcast_join_limit
         The maximum number of partitions to allow for the smaller table in
         a broadcast join.
+    adaptive_join
+        Whether to choose between a broadcast join and a hash join at
+        runtime, when the partition counts alone rule out a broadcast
+        join. The partitions of the smaller table are computed first,
+        and the table is broadcast if its total size is at most
+        ``broadcast_join_limit * target_partition_size`` bytes.
+        Only used with the task-based shuffle (see ``shuffle_method``).
+        ``False`` by default.
+    skew_join_threshold
+        The size (relative to an average output partition) above which
+        a join key of a hash join is treated as a skewed ("hot") key.
+        The larger table is sampled (see ``cardinality_sample_partitions``)
+        to find the hot keys. The rows of the larger table with a hot key
+        are spread over all output partitions, and the matching rows of
+        the smaller table are copied to every output partition. Only
+        used with the task-based shuffle (see ``shuffle_method``). ``0.0``
+        by default, which disables skew detection.
+    coalesce_filters
+        Whether to coalesce the output partitions of a filter, based on
+        an estimate of their size. A few output partitions are sampled
+        (see ``cardinality_sample_partitions``), and neighboring
+        partitions are concatenated so that the estimated output
+        partitions are about ``target_partition_size`` bytes. If the
+        output cannot be sampled, the input partitions are assumed to
+        be ``target_partition_size`` bytes, and the fraction of rows
+        selected by the filter is estimated from its predicate.
+        ``False`` by default.
     shuffle_method
         The method to use for shuffling data between workers. ``None``
         by default, which will use 'rapidsmpf' if installed and fall back to
@@ -195,19 +243,25 @@ class StreamingExecutor:
 
     name: Literal["streaming"] = dataclasses.field(default="streaming", init=False)
     scheduler: Scheduler = Scheduler.SYNCHRONOUS
+    max_workers: int = 0
     fallback_mode: StreamingFallbackMode = StreamingFallbackMode.WARN
     max_rows_per_partition: int = 1_000_000
     cardinality_factor: dict[str, float] = dataclasses.field(default_factory=dict)
+    cardinality_sample_partitions: int = 2
     target_partition_size: int = 0
     groupby_n_ary: int = 32
     broadcast_join_limit: int = 0
+    adaptive_join: bool = False
+    skew_join_threshold: float = 0.0
+    coalesce_filters: bool = False
     shuffle_method: ShuffleMethod | None = None
     rapidsmpf_spill: bool = False
 
     def __post_init__(self) -> None:
-        if self.scheduler == "synchronous" and self.shuffle_method == "rapidsmpf":
+        if self.scheduler != "distributed" and self.shuffle_method == "rapidsmpf":
             raise ValueError(
-                "rapidsmpf shuffle method is not supported for synchronous scheduler"
+                "rapidsmpf shuffle method is not supported for "
+                f"{Scheduler(self.scheduler).value} scheduler"
             )
 
         # frozen dataclass, so use object.__setattr__
@@ -226,22 +280,36 @@ class StreamingExecutor:
                 2 if self.scheduler == "distributed" else 32,
             )
         object.__setattr__(self, "scheduler", Scheduler(self.scheduler))
+        if self.max_workers == 0:
+            object.__setattr__(self, "max_workers", min(4, os.cpu_count() or 1))
         if self.shuffle_method is not None:
             object.__setattr__(
                 self, "shuffle_method", ShuffleMethod(self.shuffle_method)
             )
 
         # Type / value check everything else
+        if not isinstance(self.max_workers, int):
+            raise TypeError("max_workers must be an int")
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be positive")
         if not isinstance(self.max_rows_per_partition, int):
             raise TypeError("max_rows_per_partition must be an int")
         if not isinstance(self.cardinality_factor, dict):
             raise TypeError("cardinality_factor must be a dict of column name to float")
+        if not isinstance(self.cardinality_sample_partitions, int):
+            raise TypeError("cardinality_sample_partitions must be an int")
         if not isinstance(self.target_partition_size, int):
             raise TypeError("target_partition_size must be an int")
         if not isinstance(self.groupby_n_ary, int):
             raise TypeError("groupby_n_ary must be an int")
         if not isinstance(self.broadcast_join_limit, int):
             raise TypeError("broadcast_join_limit must be an int")
+        if not isinstance(self.adaptive_join, bool):
+            raise TypeError("adaptive_join must be bool")
+        if not isinstance(self.skew_join_threshold, (float, int)):
+            raise TypeError("skew_join_threshold must be a float")
+        if not isinstance(self.coalesce_filters, bool):
+            raise TypeError("coalesce_filters must be bool")
         if not isinstance(self.rapidsmpf_spill, bool):
             raise TypeError("rapidsmpf_spill must be bool")
 
@@ -27,7 +27,7 @@ def pytest_addoption(parser):
         "--scheduler",
         action="store",
         default="synchronous",
-        choices=("synchronous", "distributed"),
+        choices=("synchronous", "threads", "distributed"),
         help="Scheduler to use for 'streaming' executor.",
     )
 
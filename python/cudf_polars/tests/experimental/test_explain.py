@@ -153,3 +153,19 @@ def test_explain_logical_plan_wide_table():
     plan = explain_query(q, engine, physical=False)
 
     assert "DATAFRAMESCAN ('col0', 'col1', 'col2', '...', 'col18', 'col19')" in plan
+
+
+def test_explain_physical_plan_with_pruning(tmp_path, df):
+    make_partitioned_source(df, tmp_path, fmt="parquet", n_files=5)
+
+    q = pl.scan_parquet(tmp_path).filter(pl.col("x") < 2_000)
+
+    engine = pl.GPUEngine(
+        executor="streaming",
+        raise_on_fail=True,
+        executor_options={"scheduler": DEFAULT_SCHEDULER},
+    )
+
+    plan = explain_query(q, engine)
+
+    assert "SCAN PARQUET PRUNED 4/5 files, 9/10 row groups" in plan
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from cudf_polars import Translator
+from cudf_polars.experimental.base import PartitionInfo
+from cudf_polars.experimental.parallel import get_scheduler, lower_ir_graph, task_graph
+from cudf_polars.experimental.repartition import Repartition
+from cudf_polars.testing.asserts import DEFAULT_SCHEDULER, assert_gpu_result_equal
+from cudf_polars.utils.config import ConfigOptions
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pl.LazyFrame(
+        {
+            "x": range(100),
+            "y": [1, 2, 3, 4] * 25,
+        }
+    )
+
+
+def make_engine(*, coalesce_filters: bool, sample_partitions: int = 2) -> pl.GPUEngine:
+    return pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 10,
+            "coalesce_filters": coalesce_filters,
+            "cardinality_sample_partitions": sample_partitions,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "predicate, count",
+    [
+        (pl.col("x") < 10, 4),
+        (pl.col("y") == 2, 1),
+        ((pl.col("x") < 50) | (pl.col("y") != 2), 10),
+        (~(pl.col("x") >= 10), 7),
+    ],
+)
+@pytest.mark.parametrize("coalesce_filters", [True, False])
+def test_filter_coalesce(df, predicate, count, coalesce_filters):
+    # Without sampling, the input partitions are assumed to be
+    # target-sized and the selectivity of the predicate is estimated
+    engine = make_engine(coalesce_filters=coalesce_filters, sample_partitions=0)
+    q = df.filter(predicate)
+    assert_gpu_result_equal(q, engine=engine)
+
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    assert info[ir].count == (count if coalesce_filters else 10)
+
+
+@pytest.mark.parametrize(
+    "predicate", [pl.col("x") < 10, pl.col("y") == 2, pl.col("x") >= 0]
+)
+def test_filter_coalesce_sampled(df, predicate):
+    engine = make_engine(coalesce_filters=True)
+    q = df.filter(predicate)
+    assert_gpu_result_equal(q, engine=engine)
+
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    # The sampled output partitions are far smaller
+    # than the target partition size
+    assert info[ir].count == 1
+
+
+def test_filter_coalesce_sorted(df):
+    engine = make_engine(coalesce_filters=True)
+    q = df.sort("y", maintain_order=True).filter(pl.col("x") > 20)
+    assert_gpu_result_equal(q, engine=engine)
+
+
+@pytest.mark.parametrize("count_out", [1, 3, 4, 10, 11, 25, 100])
+def test_repartition(df, count_out):
+    engine = make_engine(coalesce_filters=False)
+    config_options = ConfigOptions.from_polars_engine(engine)
+    ir, partition_info = lower_ir_graph(
+        Translator(df._ldf.visit(), engine).translate_ir(), config_options
+    )
+    assert partition_info[ir].count == 10
+
+    repartitioned = Repartition(ir.schema, ir)
+    partition_info[repartitioned] = PartitionInfo(count=count_out)
+    graph, key = task_graph(repartitioned, partition_info)
+    assert sum(isinstance(k, tuple) and k[0] == key for k in graph) == count_out
+    result = get_scheduler(config_options)(graph, key)
+    assert_frame_equal(result.to_polars(), df.collect())
@@ -9,7 +9,11 @@ import pytest
 
 import polars as pl
 
+import cudf_polars.experimental.groupby
+from cudf_polars import Translator
+from cudf_polars.experimental.parallel import lower_ir_graph
 from cudf_polars.testing.asserts import DEFAULT_SCHEDULER, assert_gpu_result_equal
+from cudf_polars.utils.config import ConfigOptions
 
 
 @pytest.fixture(scope="module")
@@ -61,7 +65,20 @@ def test_groupby_single_partitions(df, op, keys):
 
 
 @pytest.mark.parametrize(
-    "op", ["sum", "mean", "len", "count", "min", "max", "n_unique"]
+    "op",
+    [
+        "sum",
+        "mean",
+        "len",
+        "count",
+        "min",
+        "max",
+        "n_unique",
+        "var",
+        "std",
+        "first",
+        "last",
+    ],
 )
 @pytest.mark.parametrize("keys", [("y",), ("y", "z")])
 def test_groupby_agg(df, engine, op, keys):
@@ -72,7 +89,9 @@ def test_groupby_agg(df, engine, op, keys):
     assert_gpu_result_equal(q, engine=engine, check_row_order=False)
 
 
-@pytest.mark.parametrize("op", ["sum", "mean", "len", "count"])
+@pytest.mark.parametrize(
+    "op", ["sum", "mean", "len", "count", "std", "first", "last", "median"]
+)
 @pytest.mark.parametrize("keys", [("y",), ("y", "z")])
 def test_groupby_agg_config_options(df, op, keys):
     engine = pl.GPUEngine(
@@ -108,7 +127,7 @@ def test_groupby_fallback(df, engine, fallback_mode):
     )
     match = "Failed to decompose groupby aggs"
 
-    q = df.group_by("y").median()
+    q = df.group_by("y", maintain_order=True).median()
 
     if fallback_mode == "silent":
         ctx = contextlib.nullcontext()
@@ -125,6 +144,53 @@ def test_groupby_fallback(df, engine, fallback_mode):
         assert_gpu_result_equal(q, engine=engine, check_row_order=False)
 
 
+@pytest.mark.parametrize("ddof", [0, 1, 2])
+@pytest.mark.parametrize("op", ["var", "std"])
+def test_groupby_agg_var_std(df, engine, op, ddof):
+    agg = getattr(pl.col("x", "z"), op)(ddof=ddof)
+    q = df.filter(pl.col("x") % 7 != 0).group_by("y", "z").agg(agg)
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+@pytest.mark.parametrize(
+    "agg",
+    [
+        pl.col("x").median(),
+        pl.col("x", "z").quantile(0.3, interpolation="linear"),
+        [pl.col("x").median(), pl.col("z").sum()],
+    ],
+)
+def test_groupby_agg_median_quantile(df, engine, agg):
+    q = df.group_by("y").agg(agg)
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+def test_groupby_agg_median_no_sampling(df, monkeypatch):
+    def estimate_cardinality_factor(*args, **kwargs):
+        raise AssertionError("Holistic aggregations should not sample")
+
+    monkeypatch.setattr(
+        cudf_polars.experimental.groupby,
+        "estimate_cardinality_factor",
+        estimate_cardinality_factor,
+    )
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 4,
+            "cardinality_sample_partitions": 2,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    # The rows are shuffled on the keys, so the
+    # cardinality estimate would not be used
+    q = df.group_by("y").agg(pl.col("x").median())
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    assert info[ir].count > 1
+
+
 def test_groupby_agg_literal(df, engine):
     q = df.group_by("y").agg(1)
     assert_gpu_result_equal(q, engine=engine, check_row_order=False)
@@ -170,3 +236,48 @@ def test_groupby_agg_duplicate(
 def test_groupby_agg_empty(df: pl.LazyFrame, engine: pl.GPUEngine) -> None:
     q = df.group_by("y").agg()
     assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+@pytest.mark.parametrize(
+    "key, sample_partitions, shuffle",
+    [("x", 2, True), ("x", 0, False), ("y", 2, False)],
+)
+def test_groupby_estimated_cardinality(df, key, sample_partitions, shuffle):
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 4,
+            "cardinality_sample_partitions": sample_partitions,
+            "scheduler": DEFAULT_SCHEDULER,
+            "shuffle_method": "tasks",
+        },
+    )
+    q = df.group_by(key).agg(pl.col("z").sum())
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    # High-cardinality keys are reduced with a shuffle
+    assert (info[ir].count > 1) == shuffle
+
+
+def test_groupby_estimated_cardinality_unique_key(df):
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 4,
+            "cardinality_sample_partitions": 2,
+            "scheduler": DEFAULT_SCHEDULER,
+            "shuffle_method": "tasks",
+        },
+    )
+    q = df.group_by("x").agg(pl.col("z").sum())
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    # Only 2 of the 38 partitions are sampled, and every sampled
+    # key is seen once, so the key is assumed to be unique
+    assert info[ir].count == 38
@@ -8,6 +8,7 @@ import pytest
 import polars as pl
 
 from cudf_polars import Translator
+from cudf_polars.experimental.join import AdaptiveJoin, SaltedJoin
 from cudf_polars.experimental.parallel import lower_ir_graph
 from cudf_polars.experimental.shuffle import Shuffle
 from cudf_polars.testing.asserts import DEFAULT_SCHEDULER, assert_gpu_result_equal
@@ -158,3 +159,131 @@ def test_join_conditional(reverse, max_rows_per_partition):
         left, right = right, left
     q = left.join_where(right, pl.col("y") < pl.col("yy"))
     assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "full", "semi", "anti"])
+@pytest.mark.parametrize("reverse", [True, False])
+@pytest.mark.parametrize("target_partition_size", [1, 1_000_000])
+def test_adaptive_join(left, right, how, reverse, target_partition_size):
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 3,
+            "broadcast_join_limit": 1,
+            "adaptive_join": True,
+            # The small table is broadcast at runtime if it is
+            # at most 1 * target_partition_size bytes
+            "target_partition_size": target_partition_size,
+            "scheduler": DEFAULT_SCHEDULER,
+            "shuffle_method": "tasks",
+        },
+    )
+    q = (
+        right.join(left, on="y", how=how)
+        if reverse
+        else left.join(right, on="y", how=how)
+    )
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+    # Joins that support a broadcast join are adaptive
+    nodes = lower_ir_graph(
+        Translator(q._ldf.visit(), engine).translate_ir(),
+        ConfigOptions.from_polars_engine(engine),
+    )[1]
+    adaptive = (
+        how == "inner"
+        or (how in ("left", "semi", "anti") and not reverse)
+        or (how == "right" and reverse)
+    )
+    assert any(isinstance(node, AdaptiveJoin) for node in nodes) == adaptive
+
+
+@pytest.mark.parametrize(
+    "scheduler, shuffle_method, adaptive",
+    [
+        ("synchronous", None, True),
+        ("distributed", None, False),
+        ("distributed", "tasks", True),
+        ("distributed", "rapidsmpf", False),
+    ],
+)
+def test_adaptive_join_shuffle_method(left, right, scheduler, shuffle_method, adaptive):
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 3,
+            "broadcast_join_limit": 1,
+            "adaptive_join": True,
+            "scheduler": scheduler,
+            "shuffle_method": shuffle_method,
+        },
+    )
+    q = left.join(right, on="y", how="inner")
+    # The hash join of an adaptive join partitions its inputs
+    # in tasks, so it is not used if rapidsmpf may shuffle
+    nodes = lower_ir_graph(
+        Translator(q._ldf.visit(), engine).translate_ir(),
+        ConfigOptions.from_polars_engine(engine),
+    )[1]
+    assert any(isinstance(node, AdaptiveJoin) for node in nodes) == adaptive
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "full", "semi", "anti"])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_salted_join(how, reverse):
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 5,
+            "broadcast_join_limit": 1,
+            "skew_join_threshold": 1.0,
+            "scheduler": DEFAULT_SCHEDULER,
+            "shuffle_method": "tasks",
+        },
+    )
+    # Two thirds of the rows of the larger table have y == 0
+    large = pl.LazyFrame({"x": range(60), "y": [0 if i % 3 else i for i in range(60)]})
+    small = pl.LazyFrame({"xx": range(9), "y": [0, 0, 3, 6, 7, 9, 0, 30, 31]})
+    q = (
+        small.join(large, on="y", how=how)
+        if reverse
+        else large.join(small, on="y", how=how)
+    )
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+    # Joins that do not preserve the unmatched rows
+    # of the smaller table spread the hot key
+    nodes = lower_ir_graph(
+        Translator(q._ldf.visit(), engine).translate_ir(),
+        ConfigOptions.from_polars_engine(engine),
+    )[1]
+    salted = [node for node in nodes if isinstance(node, SaltedJoin)]
+    assert len(salted) == (
+        how == "inner"
+        or (how in ("left", "semi", "anti") and not reverse)
+        or (how == "right" and reverse)
+    )
+    if salted:
+        assert salted[0].hot_keys == ((0,),)
+
+    # The inputs of a salted join are partitioned in tasks,
+    # so it is not used if rapidsmpf may shuffle
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 5,
+            "broadcast_join_limit": 1,
+            "skew_join_threshold": 1.0,
+            "scheduler": "distributed",
+            "shuffle_method": "rapidsmpf",
+        },
+    )
+    nodes = lower_ir_graph(
+        Translator(q._ldf.visit(), engine).translate_ir(),
+        ConfigOptions.from_polars_engine(engine),
+    )[1]
+    assert not any(isinstance(node, SaltedJoin) for node in nodes)
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import itertools
+import operator
 import pickle
 
 import pytest
@@ -180,3 +182,146 @@ def test_synchronous_scheduler():
 
     # The cache should only contain the final result
     assert set(cache) == {key}
+
+
+def test_threaded_scheduler():
+    # Test that the threaded scheduler produces the same
+    # result and clears the cache as tasks are executed.
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 4,
+            "scheduler": "threads",
+            "max_workers": 3,
+        },
+    )
+    left = pl.LazyFrame(
+        {
+            "x": range(15),
+            "y": [1, 2, 3] * 5,
+            "z": [1.0, 2.0, 3.0, 4.0, 5.0] * 3,
+        }
+    )
+    right = pl.LazyFrame(
+        {
+            "xx": range(6),
+            "y": [2, 4, 3] * 2,
+            "zz": [1, 2] * 3,
+        }
+    )
+    q = left.join(right, on="y").group_by("y").agg(pl.col("zz").mean()).sort(by="y")
+
+    config_options = ConfigOptions.from_polars_engine(engine)
+    ir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, partition_info = lower_ir_graph(ir, config_options)
+    graph, key = task_graph(ir, partition_info)
+    scheduler = get_scheduler(config_options)
+    cache = {}
+    result = scheduler(graph, key, cache=cache)
+    assert_frame_equal(result.to_polars(), q.collect())
+
+    # The cache should only contain the final result
+    assert set(cache) == {key}
+
+    assert_gpu_result_equal(q, engine=engine)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 8])
+def test_threaded_scheduler_graph(max_workers):
+    from cudf_polars.experimental.scheduler import (
+        synchronous_scheduler,
+        threaded_scheduler,
+    )
+
+    graph = {("x", i): i for i in range(10)}
+    graph |= {("y", i): (operator.mul, ("x", i), ("x", i)) for i in range(10)}
+    graph["z"] = (sum_args, *(("y", i) for i in range(10)))
+    cache = {}
+    result = threaded_scheduler(graph, "z", cache=cache, max_workers=max_workers)
+    assert result == synchronous_scheduler(graph, "z") == 285
+    assert set(cache) == {"z"}
+
+
+def sum_args(*args):
+    return sum(args)
+
+
+def test_threaded_scheduler_raises():
+    from cudf_polars.experimental.scheduler import threaded_scheduler
+
+    def fail(x):
+        raise RuntimeError("boom")
+
+    graph = {"a": 1, "b": (fail, "a"), "c": (operator.add, "a", "b")}
+    with pytest.raises(RuntimeError, match="boom"):
+        threaded_scheduler(graph, "c", max_workers=2)
+
+
+def _wide_shuffle_graph(n):
+    # Mimic a task-based shuffle of `n` scanned partitions
+    graph = {}
+    for i in range(n):
+        graph[("scan", i)] = (list, range(10 * i, 10 * (i + 1)))
+        graph[("split", i)] = (_split_list, ("scan", i), n)
+        for p in range(n):
+            graph[("inter", p, i)] = (operator.getitem, ("split", i), p)
+    for p in range(n):
+        graph[("out", p)] = (_concat_lists, *(("inter", p, i) for i in range(n)))
+    graph["final"] = (_concat_lists, *(("out", p) for p in range(n)))
+    return graph
+
+
+def _split_list(x, n):
+    return [x[j::n] for j in range(n)]
+
+
+def _concat_lists(*args):
+    return list(itertools.chain.from_iterable(args))
+
+
+def _list_sizeof(x):
+    if not isinstance(x, list):
+        return 0
+    elif x and isinstance(x[0], list):
+        return sum(_list_sizeof(v) for v in x)
+    return len(x)
+
+
+def test_order():
+    from cudf_polars.experimental.scheduler import order, required_keys
+
+    graph = _wide_shuffle_graph(4)
+    dependencies = {k: required_keys(k, graph) for k in graph}
+    ordered = order(graph, dependencies)
+    position = {k: i for i, k in enumerate(ordered)}
+    assert len(ordered) == len(graph)
+    assert all(position[d] < position[k] for k in graph for d in dependencies[k])
+    # Each scanned partition is split before the next scan starts
+    assert ordered[:2] == [("scan", 0), ("split", 0)]
+    assert position[("split", 0)] < position[("scan", 1)]
+
+
+@pytest.mark.parametrize("scheduler", ["synchronous", "threads"])
+def test_live_bytes_counter(scheduler):
+    from cudf_polars.experimental.scheduler import (
+        LiveBytesCounter,
+        synchronous_scheduler,
+        threaded_scheduler,
+    )
+
+    n = 8
+    graph = _wide_shuffle_graph(n)
+    live_bytes = LiveBytesCounter(sizeof=_list_sizeof)
+    if scheduler == "synchronous":
+        result = synchronous_scheduler(graph, "final", live_bytes=live_bytes)
+    else:
+        result = threaded_scheduler(
+            graph, "final", max_workers=1, live_bytes=live_bytes
+        )
+    assert sorted(result) == list(range(10 * n))
+    # Only the final result remains live
+    assert live_bytes.current == 10 * n
+    # Never hold more than one scanned partition
+    # in addition to the shuffled data
+    assert live_bytes.peak <= 2 * 10 * n
@@ -8,6 +8,8 @@ import pytest
 import polars as pl
 
 from cudf_polars import Translator
+from cudf_polars.dsl.ir import Scan
+from cudf_polars.dsl.traversal import traversal
 from cudf_polars.experimental.parallel import lower_ir_graph
 from cudf_polars.testing.asserts import DEFAULT_SCHEDULER, assert_gpu_result_equal
 from cudf_polars.testing.io import make_partitioned_source
@@ -67,3 +69,236 @@ def test_target_partition_size(tmp_path, df, blocksize, n_files):
         assert count > n_files
     else:
         assert count < n_files
+
+
+@pytest.mark.parametrize(
+    "fmt, scan_fn",
+    [
+        ("csv", pl.scan_csv),
+        ("ndjson", pl.scan_ndjson),
+    ],
+)
+@pytest.mark.parametrize("blocksize", [1_000, 10_000, 1_000_000])
+@pytest.mark.parametrize("n_files", [2, 3])
+def test_target_partition_size_text(tmp_path, df, fmt, scan_fn, blocksize, n_files):
+    make_partitioned_source(df, tmp_path, fmt, n_files=n_files)
+    # Only CSV files without quoting can be split into byte ranges
+    q = scan_fn(tmp_path, **({"quote_char": None} if fmt == "csv" else {}))
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": blocksize,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    assert_gpu_result_equal(q, engine=engine)
+
+    # Check partitioning
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    count = info[ir].count
+    if blocksize <= 10_000:
+        assert count > n_files
+    else:
+        assert count < n_files
+
+
+def test_split_csv_with_row_index(tmp_path, df):
+    make_partitioned_source(df, tmp_path, "csv", n_files=1)
+    q = pl.scan_csv(tmp_path, row_index_name="index")
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": 1_000,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    # Files with a row index are not split
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    assert info[ir].count == 1
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_split_csv_quoted(tmp_path):
+    path = tmp_path / "quoted.csv"
+    path.write_text("a,b\n" + "".join(f'{i},"line\n{i}"\n' for i in range(1_000)))
+    q = pl.scan_csv(path)
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": 1_000,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    # Quoted fields may contain line terminators,
+    # so the file is not split into byte ranges
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    assert info[ir].count == 1
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_split_csv_leading_blank_line(tmp_path, df):
+    path = tmp_path / "blank.csv"
+    path.write_text("\n" + df.write_csv())
+    q = pl.scan_csv(path, quote_char=None)
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": 1_000,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_parquet_metadata_cache(tmp_path, df):
+    from cudf_polars.experimental.io import (
+        SplitScan,
+        _cached_parquet_file_metadata,
+        _parquet_file_metadata,
+        _split_row_range,
+    )
+
+    make_partitioned_source(df, tmp_path, "parquet", n_files=1, row_group_size=500)
+    (path,) = tmp_path.iterdir()
+    q = pl.scan_parquet(path)
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": 10_000,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    _cached_parquet_file_metadata.cache_clear()
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    assert info[ir].count > 1
+
+    # Planning reads the footer once, and row ranges
+    # are calculated at lowering time
+    assert _cached_parquet_file_metadata.cache_info().misses == 1
+    metadata = _parquet_file_metadata(path)
+    assert _cached_parquet_file_metadata.cache_info().misses == 1
+    splits = [node for node in info if isinstance(node, SplitScan)]
+    assert splits
+    for split in splits:
+        assert split.row_range == _split_row_range(
+            metadata.rowgroup_num_rows, split.split_index, split.total_splits
+        )
+    assert_gpu_result_equal(q, engine=engine)
+
+    # Rewriting the file invalidates the cached metadata
+    df.head(100).write_parquet(path)
+    assert sum(_parquet_file_metadata(path).rowgroup_num_rows) == 100
+    assert _cached_parquet_file_metadata.cache_info().misses == 2
+
+
+def test_file_cache_key_remote():
+    from cudf_polars.experimental.io import _file_cache_key
+
+    # Remote files are not identified (or cached)
+    assert _file_cache_key("s3://bucket/df.parquet") is None
+
+
+@pytest.mark.parametrize(
+    "rowgroup_num_rows, total_splits, expected",
+    [
+        ((10, 10, 10, 10), 2, [(0, 20), (20, -1)]),
+        ((10, 10, 10), 2, [(0, 10), (10, -1)]),
+        ((30,), 3, [(0, 10), (10, 10), (20, -1)]),
+    ],
+)
+def test_split_row_range(rowgroup_num_rows, total_splits, expected):
+    from cudf_polars.experimental.io import _split_row_range
+
+    assert [
+        _split_row_range(rowgroup_num_rows, i, total_splits)
+        for i in range(total_splits)
+    ] == expected
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        pl.col("x") < 400,
+        pl.col("x") >= 2_900,
+        (pl.col("x") > 1_100) & (pl.col("x") <= 1_300),
+        (pl.col("x") < 100) | (pl.col("x") == 2_999),
+        pl.col("x").is_in([5, 2_500]),
+        pl.col("x") > 10_000,
+        pl.col("y") == "dog",
+        pl.col("z") > 2.0,
+    ],
+)
+@pytest.mark.parametrize("blocksize", [1_000, 1_000_000])
+def test_scan_row_group_pruning(tmp_path, df, predicate, blocksize):
+    make_partitioned_source(df, tmp_path, "parquet", n_files=3, row_group_size=250)
+    q = pl.scan_parquet(tmp_path).filter(predicate)
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": blocksize,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+def test_scan_row_group_pruning_partitions(tmp_path, df, monkeypatch):
+    from cudf_polars.experimental import io
+    from cudf_polars.experimental.io import _prune_parquet_row_groups
+
+    make_partitioned_source(df, tmp_path, "parquet", n_files=3, row_group_size=250)
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": 1_000,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+
+    def lower(q):
+        qir = Translator(q._ldf.visit(), engine).translate_ir()
+        return qir, *lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+
+    _, ir, info = lower(pl.scan_parquet(tmp_path))
+    count = info[ir].count
+    qir, ir, info = lower(pl.scan_parquet(tmp_path).filter(pl.col("x") < 400))
+    assert info[ir].count < count
+
+    scan = next(node for node in traversal([qir]) if isinstance(node, Scan))
+    keep = _prune_parquet_row_groups(scan)
+    assert keep is not None
+    assert sum(any(k) for k in keep.values()) == 1
+    assert sum(sum(k) for k in keep.values()) == 2
+
+    # Files that cannot be cached (e.g. remote files) are not pruned
+    with monkeypatch.context() as m:
+        m.setattr(io, "_file_cache_key", lambda path: None)
+        assert _prune_parquet_row_groups(scan) is None
+
+    # Scans with a row index are not pruned
+    scan = next(
+        node
+        for node in traversal(
+            [
+                Translator(
+                    pl.scan_parquet(tmp_path, row_index_name="index")
+                    .filter(pl.col("x") < 400)
+                    ._ldf.visit(),
+                    engine,
+                ).translate_ir()
+            ]
+        )
+        if isinstance(node, Scan)
+    )
+    assert _prune_parquet_row_groups(scan) is None
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from cudf_polars import Translator
+from cudf_polars.dsl.ir import Sink
+from cudf_polars.experimental.parallel import lower_ir_graph, task_graph
+from cudf_polars.experimental.scheduler import LiveBytesCounter, synchronous_scheduler
+from cudf_polars.testing.asserts import DEFAULT_SCHEDULER
+from cudf_polars.utils.config import ConfigOptions
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pl.LazyFrame(
+        {
+            "x": range(150),
+            "y": ["cat", "dog", "fish"] * 50,
+            "z": [1.0, 2.0, 3.0, 4.0, None] * 30,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 10,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+
+
+@pytest.mark.parametrize("compression", ["zstd", "snappy", "uncompressed"])
+def test_sink_parquet(df, engine, tmp_path, compression):
+    path = tmp_path / "out.parquet"
+    df.sink_parquet(path, compression=compression, engine=engine)
+    assert_frame_equal(pl.read_parquet(path), df.collect())
+
+
+@pytest.mark.parametrize("include_header", [True, False])
+def test_sink_csv(df, engine, tmp_path, include_header):
+    path = tmp_path / "out.csv"
+    df.sink_csv(path, include_header=include_header, engine=engine)
+    expected = tmp_path / "expected.csv"
+    df.sink_csv(expected, include_header=include_header)
+    assert path.read_text() == expected.read_text()
+
+
+def test_sink_ndjson(df, engine, tmp_path):
+    path = tmp_path / "out.jsonl"
+    df.sink_ndjson(path, engine=engine)
+    assert_frame_equal(pl.read_ndjson(path, schema=df.collect_schema()), df.collect())
+
+
+def test_sink_writes_partitions(df, engine, tmp_path):
+    config_options = ConfigOptions.from_polars_engine(engine)
+    child = Translator(df._ldf.visit(), engine).translate_ir()
+    path = str(tmp_path / "out.jsonl")
+    sink = Sink(child.schema, "Json", path, {"maintain_order": True}, None, child)
+    ir, partition_info = lower_ir_graph(sink, config_options)
+    assert partition_info[ir.children[0]].count == 15
+    assert partition_info[ir].count == 1
+
+    (lowered_child,) = ir.children
+    total = LiveBytesCounter().sizeof(
+        synchronous_scheduler(*task_graph(lowered_child, partition_info))
+    )
+
+    graph, key = task_graph(ir, partition_info)
+    live_bytes = LiveBytesCounter()
+    result = synchronous_scheduler(graph, key, live_bytes=live_bytes)
+    assert result.num_rows == 0
+    # Partitions are released once they have been written,
+    # rather than all being held for a final concatenation
+    assert live_bytes.peak < total // 2
+    assert_frame_equal(pl.read_ndjson(path, schema=df.collect_schema()), df.collect())
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from cudf_polars import Translator
+from cudf_polars.dsl.ir import Slice
+from cudf_polars.experimental.base import PartitionInfo
+from cudf_polars.experimental.io import ScanPartitionFlavor, ScanPartitionPlan
+from cudf_polars.experimental.parallel import lower_ir_graph, task_graph
+from cudf_polars.experimental.scheduler import synchronous_scheduler
+from cudf_polars.experimental.slice import (
+    SlicePartitions,
+    _partition_row_counts,
+    _slice_head,
+)
+from cudf_polars.testing.asserts import DEFAULT_SCHEDULER, assert_gpu_result_equal
+from cudf_polars.testing.io import make_partitioned_source
+from cudf_polars.utils.config import ConfigOptions
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 10,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pl.LazyFrame(
+        {
+            "x": range(150),
+            "y": ["cat", "dog", "fish"] * 50,
+            "z": [1.0, 2.0, 3.0, 4.0, 5.0] * 30,
+        }
+    )
+
+
+def _lower_slice(q, engine, offset, length):
+    child = Translator(q._ldf.visit(), engine).translate_ir()
+    ir = Slice(child.schema, offset, length, child)
+    return lower_ir_graph(ir, ConfigOptions.from_polars_engine(engine))
+
+
+def _evaluate(ir, partition_info):
+    return synchronous_scheduler(*task_graph(ir, partition_info)).to_polars()
+
+
+@pytest.mark.parametrize(
+    "zlice",
+    [(0, 5), (0, 25), (12, 30), (140, 50), (200, 5), (-5, 5), (-25, 10), (-200, 60)],
+)
+def test_slice(df, engine, zlice):
+    q = df.slice(*zlice)
+    assert_gpu_result_equal(q, engine=engine)
+
+    ir, partition_info = _lower_slice(df, engine, *zlice)
+    # Only the partitions that overlap the slice are computed
+    assert isinstance(ir, SlicePartitions)
+    assert partition_info[ir].count == len(ir.ranges) <= 7
+    assert_frame_equal(_evaluate(ir, partition_info), q.collect())
+
+
+@pytest.mark.parametrize("n", [0, 3, 40, 200])
+def test_slice_head_filtered(df, engine, n):
+    q = df.filter(pl.col("x") % 3 != 0)
+    assert_gpu_result_equal(q.head(n), engine=engine)
+
+    ir, partition_info = _lower_slice(q, engine, 0, n)
+    # The row counts are unknown, so the partitions
+    # are evaluated in order until we have n rows
+    assert partition_info[ir].count == 1
+    assert partition_info[ir.children[0]].count == 15
+    graph, key = task_graph(ir, partition_info)
+    assert graph[key][0] is _slice_head
+    assert_frame_equal(_evaluate(ir, partition_info), q.head(n).collect())
+
+
+@pytest.mark.parametrize("zlice", [(-5, 5), (-30, 12)])
+def test_slice_tail_filtered(df, engine, zlice):
+    q = df.filter(pl.col("x") % 3 != 0)
+    assert_gpu_result_equal(q.slice(*zlice), engine=engine)
+
+    ir, partition_info = _lower_slice(q, engine, *zlice)
+    assert_frame_equal(_evaluate(ir, partition_info), q.slice(*zlice).collect())
+
+
+def test_slice_parquet(tmp_path):
+    make_partitioned_source(
+        pl.DataFrame({"x": range(3_000), "y": [1, 2, 3] * 1_000}),
+        tmp_path,
+        "parquet",
+        n_files=3,
+        row_group_size=100,
+    )
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": 1_000,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    q = pl.scan_parquet(tmp_path)
+    assert_gpu_result_equal(q.slice(1_490, 20), engine=engine)
+
+    # The row counts are read from the parquet metadata
+    ir, partition_info = _lower_slice(q, engine, 1_490, 20)
+    assert isinstance(ir, SlicePartitions)
+    assert len(ir.ranges) < partition_info[ir.children[0]].count
+    assert_frame_equal(_evaluate(ir, partition_info), q.slice(1_490, 20).collect())
+
+
+def test_slice_parquet_fused(tmp_path):
+    make_partitioned_source(
+        pl.DataFrame({"x": range(3_000), "y": [1, 2, 3] * 1_000}),
+        tmp_path,
+        "parquet",
+        n_files=6,
+    )
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "target_partition_size": 20_000,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    q = pl.scan_parquet(tmp_path)
+    assert_gpu_result_equal(q.slice(1_490, 20), engine=engine)
+
+    # Several files are read by each partition
+    scan = Translator(q._ldf.visit(), engine).translate_ir()
+    plan = ScanPartitionPlan.from_scan(scan)
+    assert plan.flavor == ScanPartitionFlavor.FUSED_FILES
+    assert 1 < plan.factor < 6
+    count = math.ceil(6 / plan.factor)
+    counts = _partition_row_counts(scan, {scan: PartitionInfo(count=count)})
+    assert counts is not None
+    assert len(counts) == count
+    assert sum(counts) == 3_000
+
+    ir, partition_info = _lower_slice(q, engine, 1_490, 20)
+    assert isinstance(ir, SlicePartitions)
+    assert len(ir.ranges) < partition_info[ir.children[0]].count == count
+    assert_frame_equal(_evaluate(ir, partition_info), q.slice(1_490, 20).collect())
@@ -7,7 +7,14 @@ import pytest
 
 import polars as pl
 
+import pylibcudf as plc
+
+from cudf_polars import Translator
+from cudf_polars.dsl.ir import Sort
+from cudf_polars.experimental.parallel import lower_ir_graph
+from cudf_polars.experimental.sort import RangeShuffle
 from cudf_polars.testing.asserts import DEFAULT_SCHEDULER, assert_gpu_result_equal
+from cudf_polars.utils.config import ConfigOptions
 
 
 @pytest.fixture(scope="module")
@@ -35,10 +42,50 @@ def df():
     )
 
 
-def test_sort(df, engine):
-    q = df.sort(by=["y", "z"])
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("nulls_last", [False, True])
+def test_sort(df, engine, descending, nulls_last):
+    q = df.sort(by=["y", "z"], descending=descending, nulls_last=nulls_last)
+    assert_gpu_result_equal(q, engine=engine)
+
+
+@pytest.mark.parametrize("nulls_last", [False, True])
+def test_sort_nulls_and_duplicates(engine, nulls_last):
+    df = pl.LazyFrame(
+        {
+            "x": [3, None, 1, 3, 2, None, 1, 3, 2, 3, 1, None, 2],
+            "y": range(13),
+        }
+    )
+    q = df.sort(by="x", nulls_last=nulls_last, maintain_order=True)
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_sort_empty_partitions(engine):
+    df = pl.LazyFrame({"x": range(20), "y": [1] * 20})
+    q = df.filter(pl.col("x") > 15).sort(by="x", descending=True)
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_sort_partition_info(df, engine):
+    q = df.sort(by="y")
+    config_options = ConfigOptions.from_polars_engine(engine)
+    ir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, partition_info = lower_ir_graph(ir, config_options)
+    assert isinstance(ir, Sort)
+    assert isinstance(ir.children[0], RangeShuffle)
+    assert partition_info[ir].count == 3
+    ((key, order, null_order),) = partition_info[ir].sorted_on
+    assert key.name == "y"
+    assert order == plc.types.Order.ASCENDING
+    assert null_order == plc.types.NullOrder.BEFORE
+
+
+def test_sort_slice_fallback(df, engine):
+    q = df.sort(by="y").slice(2, 2)
     with pytest.raises(
-        pl.exceptions.ComputeError, match="Sort does not support multiple partitions."
+        pl.exceptions.ComputeError,
+        match="Sort with a slice does not support multiple partitions.",
     ):
         assert_gpu_result_equal(q, engine=engine)
 
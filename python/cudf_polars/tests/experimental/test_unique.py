@@ -8,7 +8,10 @@ import pytest
 import polars as pl
 from polars.testing import assert_frame_equal
 
+from cudf_polars import Translator
+from cudf_polars.experimental.parallel import lower_ir_graph
 from cudf_polars.testing.asserts import DEFAULT_SCHEDULER, assert_gpu_result_equal
+from cudf_polars.utils.config import ConfigOptions
 
 
 @pytest.fixture(scope="module")
@@ -102,3 +105,22 @@ def test_unique_head_tail(keep, zlice):
         getattr(q, zlice)().collect(engine=engine),
         getattr(expect, zlice)().collect(),
     )
+
+
+@pytest.mark.parametrize("subset, shuffle", [(("x",), True), (("z",), False)])
+def test_unique_estimated_cardinality(df, subset, shuffle):
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={
+            "max_rows_per_partition": 10,
+            "scheduler": DEFAULT_SCHEDULER,
+        },
+    )
+    q = df.unique(subset=subset, keep="any").select(*subset)
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+    qir = Translator(q._ldf.visit(), engine).translate_ir()
+    ir, info = lower_ir_graph(qir, ConfigOptions.from_polars_engine(engine))
+    # High-cardinality keys are deduplicated with a shuffle
+    assert (info[ir].count > 1) == shuffle
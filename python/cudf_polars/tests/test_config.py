@@ -191,6 +191,23 @@ def test_validate_scheduler() -> None:
     )
     assert config.executor.scheduler == "synchronous"
 
+    config = ConfigOptions.from_polars_engine(
+        pl.GPUEngine(
+            executor="streaming",
+            executor_options={"scheduler": "threads", "max_workers": 2},
+        )
+    )
+    assert config.executor.scheduler == "threads"
+    assert config.executor.max_workers == 2
+
+    with pytest.raises(ValueError, match="max_workers must be positive"):
+        ConfigOptions.from_polars_engine(
+            pl.GPUEngine(
+                executor="streaming",
+                executor_options={"scheduler": "threads", "max_workers": -1},
+            )
+        )
+
     with pytest.raises(ValueError, match="'foo' is not a valid Scheduler"):
         ConfigOptions.from_polars_engine(
             pl.GPUEngine(
@@ -220,11 +237,16 @@ def test_validate_shuffle_method() -> None:
 @pytest.mark.parametrize(
     "option",
     [
+        "max_workers",
         "max_rows_per_partition",
         "cardinality_factor",
+        "cardinality_sample_partitions",
         "target_partition_size",
         "groupby_n_ary",
         "broadcast_join_limit",
+        "adaptive_join",
+        "skew_join_threshold",
+        "coalesce_filters",
         "rapidsmpf_spill",
     ],
 )
@@ -2,6 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import re
+
+import pytest
+
 import polars as pl
 from polars.testing import assert_frame_equal
 
@@ -23,3 +27,40 @@ def test_profile_basic():
     assert "gpu-ir-translation" in timings["node"]
 
     assert_frame_equal(result, q.collect(engine="in-memory"), check_row_order=False)
+
+
+@pytest.mark.parametrize("scheduler", ["synchronous", "threads"])
+def test_profile_streaming(scheduler):
+    df = pl.LazyFrame(
+        {
+            "a": [1, 2, 1, 3, 5, 2, 4],
+            "b": [1, 2, 3, 4, 5, 6, 7],
+        }
+    )
+    q = df.filter(pl.col("b") > 1).group_by("a").agg(pl.col("b").sum())
+    engine = pl.GPUEngine(
+        raise_on_fail=True,
+        executor="streaming",
+        executor_options={"max_rows_per_partition": 2, "scheduler": scheduler},
+    )
+
+    result, timings = q.profile(engine=engine)
+    assert_frame_equal(result, q.collect(), check_row_order=False)
+
+    nodes = timings["node"].to_list()
+    assert "gpu-ir-translation" in nodes
+    # One entry per partition of each node...
+    partitions = [
+        n for n in nodes if re.match(r"^[\w-]+\[\d+\] rows=\d+ bytes=\d+$", n)
+    ]
+    scan_rows = [
+        int(re.search(r"rows=(\d+)", n).group(1))
+        for n in partitions
+        if n.startswith("DataFrameScan")
+    ]
+    assert len(scan_rows) == 4
+    assert sum(scan_rows) == 7
+    # ...and an aggregated entry for each node
+    assert any(
+        re.match(r"^[\w-]+ partitions=\d+ rows=\d+ bytes=\d+$", n) for n in nodes
+    )
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+
+@pytest.fixture
+def df():
+    return pl.LazyFrame(
+        {
+            "a": [1, 2, 3, None, 5],
+            "b": ["x", "y", None, "w", "v"],
+            "c": [True, False, None, True, True],
+        }
+    )
+
+
+@pytest.mark.parametrize("compression", ["zstd", "snappy", "lz4", "uncompressed"])
+@pytest.mark.parametrize("statistics", [True, False])
+def test_sink_parquet(df, tmp_path, compression, statistics):
+    path = tmp_path / "out.parquet"
+    df.sink_parquet(
+        path,
+        compression=compression,
+        statistics=statistics,
+        engine=pl.GPUEngine(raise_on_fail=True),
+    )
+    assert_frame_equal(pl.read_parquet(path), df.collect())
+
+
+def test_sink_parquet_compression_level_raises(df, tmp_path):
+    with pytest.raises(pl.exceptions.ComputeError):
+        df.sink_parquet(
+            tmp_path / "out.parquet",
+            compression="zstd",
+            compression_level=10,
+            engine=pl.GPUEngine(raise_on_fail=True),
+        )
+
+
+@pytest.mark.parametrize("separator", [",", "|"])
+@pytest.mark.parametrize("null_value", ["", "NA"])
+def test_sink_csv(df, tmp_path, separator, null_value):
+    path = tmp_path / "out.csv"
+    expected = tmp_path / "expected.csv"
+    df.sink_csv(
+        path,
+        separator=separator,
+        null_value=null_value,
+        engine=pl.GPUEngine(raise_on_fail=True),
+    )
+    df.sink_csv(expected, separator=separator, null_value=null_value)
+    assert path.read_text() == expected.read_text()
+
+
+def test_sink_ndjson(df, tmp_path):
+    path = tmp_path / "out.jsonl"
+    df.sink_ndjson(path, engine=pl.GPUEngine(raise_on_fail=True))
+    assert_frame_equal(pl.read_ndjson(path, schema=df.collect_schema()), df.collect())